@@ -0,0 +1,299 @@
+"""
+Модуль для учёта выделений памяти за кадр (диагностика на tracemalloc)
+
+Запуск как скрипта проверяет, что движение корзины не выделяет память,
+и бюджеты выделений GameState.update и Game.draw (при превышении -
+код выхода 1):
+    python alloc_tracker.py
+"""
+import fnmatch
+import functools
+import gc
+import os
+import re
+import sys
+import tracemalloc
+from collections import deque
+import config
+
+
+def _trace_filters():
+    """Исключение выделений самого tracemalloc, этого модуля, кэшей фильтрации снимков и кэша isinstance для ABC"""
+    return (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, fnmatch.__file__),
+        tracemalloc.Filter(False, functools.__file__),
+        tracemalloc.Filter(False, os.path.join(os.path.dirname(re.__file__), '*')),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen abc>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    )
+
+
+class AllocationTracker:
+    """
+    Выделения памяти за кадр с разбивкой по файлу и строке.
+
+    В конце кадра снимок tracemalloc сравнивается со снимком начала: в
+    учёт попадают блоки, созданные за кадр и ещё живые (в том числе мусор,
+    ждущий сборщика циклов). Временные объекты, освобождённые внутри кадра,
+    видны только в пиковом приросте памяти (peak_bytes). Снимки дорогие,
+    поэтому трекер включается лишь в режиме диагностики.
+    """
+
+    def __init__(self, window: int = None, trace_depth: int = 1):
+        self.window = window if window is not None else config.ALLOC_TRACKING_WINDOW
+        self.trace_depth = trace_depth
+        # Кадры окна: (блоков, байт, пик байт, {место: (блоков, байт)})
+        self.frames = deque(maxlen=self.window)
+        self.frame_count = 0
+        self._started_tracing = False
+        self._before = None
+        self._base_memory = 0
+
+    def start(self):
+        """Включение tracemalloc (если он ещё не включён)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_depth)
+            self._started_tracing = True
+
+    def stop(self):
+        """Выключение tracemalloc, если его включал этот трекер"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._before = None
+
+    def begin_frame(self):
+        """Снимок памяти в начале кадра"""
+        if not tracemalloc.is_tracing():
+            return
+        # Фильтрация снимка - после конца кадра: её собственные объекты
+        # (кэши fnmatch, нормализация путей) иначе попадали бы в кадр
+        self._before = tracemalloc.take_snapshot()
+        # Пик сбрасывается последним: собственные объекты трекера (кортеж из
+        # get_traced_memory, число в _base_memory) в пик кадра не попадают
+        self._base_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def end_frame(self):
+        """Сравнение со снимком начала кадра и запись в окно"""
+        if self._before is None or not tracemalloc.is_tracing():
+            return
+        peak_bytes = tracemalloc.get_traced_memory()[1] - self._base_memory
+        after = tracemalloc.take_snapshot().filter_traces(_trace_filters())
+        before = self._before.filter_traces(_trace_filters())
+        sites = {}
+        blocks = 0
+        size = 0
+        for stat in after.compare_to(before, 'lineno'):
+            if stat.count_diff <= 0 and stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            sites[(frame.filename, frame.lineno)] = (max(0, stat.count_diff), max(0, stat.size_diff))
+            blocks += max(0, stat.count_diff)
+            size += max(0, stat.size_diff)
+        self.frames.append((blocks, size, max(0, peak_bytes), sites))
+        self.frame_count += 1
+        self._before = None
+
+    def average_blocks(self) -> float:
+        """Среднее число новых блоков за кадр по окну"""
+        if not self.frames:
+            return 0.0
+        return sum(frame[0] for frame in self.frames) / len(self.frames)
+
+    def average_bytes(self) -> float:
+        """Средний объём новых блоков за кадр по окну"""
+        if not self.frames:
+            return 0.0
+        return sum(frame[1] for frame in self.frames) / len(self.frames)
+
+    def average_peak_bytes(self) -> float:
+        """Средний пиковый прирост памяти внутри кадра по окну"""
+        if not self.frames:
+            return 0.0
+        return sum(frame[2] for frame in self.frames) / len(self.frames)
+
+    def top_sites(self, limit: int = 10, by_file: bool = False) -> list:
+        """
+        Места с наибольшим числом выделений: [(место, блоков/кадр, байт/кадр)].
+
+        :param by_file: Группировать по файлу, а не по строке.
+        """
+        if not self.frames:
+            return []
+        totals = {}
+        for frame in self.frames:
+            for (filename, lineno), (count, size) in frame[3].items():
+                key = os.path.basename(filename) if by_file else f"{os.path.basename(filename)}:{lineno}"
+                total_count, total_size = totals.get(key, (0, 0))
+                totals[key] = (total_count + count, total_size + size)
+        frames = len(self.frames)
+        ordered = sorted(totals.items(), key=lambda item: (item[1][1], item[1][0]), reverse=True)
+        return [(key, count / frames, size / frames) for key, (count, size) in ordered[:limit]]
+
+    def get_report(self, limit: int = 10) -> str:
+        """Текстовый отчёт по окну"""
+        lines = [
+            f"Выделения за кадр (окно {len(self.frames)} кадров): "
+            f"{self.average_blocks():.1f} блоков, {self.average_bytes():.0f} байт, "
+            f"пик {self.average_peak_bytes():.0f} байт"
+        ]
+        lines.append("По файлам:")
+        for key, count, size in self.top_sites(limit, by_file=True):
+            lines.append(f"  {key:<30}{count:>10.1f}{size:>12.0f}")
+        lines.append("По строкам:")
+        for key, count, size in self.top_sites(limit):
+            lines.append(f"  {key:<30}{count:>10.1f}{size:>12.0f}")
+        return "\n".join(lines)
+
+    def print_report(self, limit: int = 10):
+        """Вывод отчёта"""
+        print(self.get_report(limit))
+
+
+def measure_allocations(func, *args, calls: int = 60, warmup: int = 10):
+    """
+    Выделения за вызов func(*args) по calls вызовам после warmup прогревочных.
+
+    Прогревочные вызовы тоже идут под трекером: ленивые кэши и в функции,
+    и в самом трекере заполняются до замера. В окне трекера остаются
+    только последние calls вызовов. Перед замером прогрев проходит ещё и
+    отдельным сеансом: первый сеанс tracemalloc в процессе приписывает
+    вызовам блоки, которые освобождаются уже вне кадров. Циклический
+    сборщик на время замера выключен: сборка, начатая посреди вызова,
+    приписала бы ему чужие объекты (паузы сборщика замеряет gc_control).
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for count in (warmup, warmup + calls):
+            tracker = AllocationTracker(window=calls)
+            tracker.start()
+            try:
+                for _ in range(count):
+                    tracker.begin_frame()
+                    func(*args)
+                    tracker.end_frame()
+            finally:
+                tracker.stop()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    tracker.frame_count = len(tracker.frames)
+    return tracker
+
+
+def assert_allocation_budget(func, *args, max_blocks: float, max_bytes: float = None,
+                             max_peak_bytes: float = None, calls: int = 60, warmup: int = 10):
+    """
+    Проверка, что func(*args) в среднем оставляет не больше max_blocks
+    новых блоков (и max_bytes байт) за вызов, а пиковый прирост памяти
+    внутри вызова в среднем не больше max_peak_bytes. Выжившие блоки
+    показывают утечки и мусор для сборщика, пик - временные объекты
+    (Rect, кортежи, поверхности), созданные и освобождённые внутри вызова;
+    max_peak_bytes=0 требует, чтобы ни один вызов ничего не выделял.
+    При превышении - AssertionError с отчётом о местах выделений.
+    """
+    tracker = measure_allocations(func, *args, calls=calls, warmup=warmup)
+    blocks = tracker.average_blocks()
+    size = tracker.average_bytes()
+    peak = tracker.average_peak_bytes()
+    if (blocks > max_blocks or (max_bytes is not None and size > max_bytes) or
+            (max_peak_bytes is not None and peak > max_peak_bytes)):
+        name = getattr(func, '__qualname__', repr(func))
+        raise AssertionError(
+            f"{name}: превышен бюджет выделений "
+            f"({blocks:.1f} блоков / {size:.0f} байт / пик {peak:.0f} байт за вызов, "
+            f"бюджет {max_blocks} блоков / {max_bytes} байт / пик {max_peak_bytes} байт)\n"
+            f"{tracker.get_report()}"
+        )
+    return tracker
+
+
+def check_basket_budget():
+    """
+    Проверка, что движение корзины и выдача её прямоугольников столкновений
+    не оставляют мусора - ни с изображением, ни в режиме палок. Бюджет пика
+    допускает лишь временные числа координат, но не Rect, списки и кортежи.
+
+    Возвращает число проверок, не уложившихся в бюджет.
+    """
+    import itertools
+    import pygame
+    from basket import StickBasket
+
+    failures = 0
+    use_images = config.USE_IMAGES
+    try:
+        for config.USE_IMAGES in (True, False):
+            basket = StickBasket()
+            mode = 'изображение' if basket.image is not None else 'палки'
+            # Цели чередуются, чтобы каждый вызов действительно сдвигал корзину
+            targets = itertools.cycle((config.WIDTH * 0.2, config.WIDTH * 0.8))
+            for name, func in (
+                ('StickBasket.move', lambda: basket.move(next(targets))),
+                ('StickBasket.get_collision_rects', basket.get_collision_rects),
+            ):
+                try:
+                    tracker = assert_allocation_budget(func, max_blocks=0,
+                                                       max_peak_bytes=config.ALLOC_PEAK_BUDGET_BASKET,
+                                                       calls=200)
+                    print(f"{name} ({mode}): {tracker.average_blocks():.1f} блоков, "
+                          f"пик {tracker.average_peak_bytes():.0f} байт/вызов - ok")
+                except AssertionError as e:
+                    print(e)
+                    failures += 1
+    finally:
+        config.USE_IMAGES = use_images
+        pygame.quit()
+    return failures
+
+
+def check_game_budgets():
+    """
+    Проверка бюджетов выделений игрового цикла на запущенной партии.
+
+    Возвращает число проверок, не уложившихся в бюджет.
+    """
+    import random
+    from main import Game
+
+    config.TELEMETRY_ENABLED = False  # Синтетическая партия не пишется в базу игрока
+    config.MUSIC_ENABLED = False  # Поток музыки выделяет память параллельно и сбивает пик
+    # Число блоков зависит от живых частиц и объектов: с одним и тем же
+    # зерном каждый запуск проверяет одну и ту же партию
+    random.seed(1)
+    game = Game()
+    game.game_state.set_difficulty(2)
+    game.game_state.show_difficulty_screen = False
+    game.game_state.restart_game()
+    # Без частиц и новых объектов число блоков зависит от случайных событий;
+    # бюджет проверяет установившийся цикл
+    for _ in range(120):
+        game.update()
+
+    failures = 0
+    for name, func, budget, peak_budget in (
+        ('GameState.update', game.game_state.update,
+         config.ALLOC_BUDGET_UPDATE, config.ALLOC_PEAK_BUDGET_UPDATE),
+        ('Game.draw', game.draw, config.ALLOC_BUDGET_DRAW, config.ALLOC_PEAK_BUDGET_DRAW),
+    ):
+        try:
+            tracker = assert_allocation_budget(func, max_blocks=budget, max_peak_bytes=peak_budget)
+            print(f"{name}: {tracker.average_blocks():.1f} блоков/кадр (бюджет {budget}), "
+                  f"пик {tracker.average_peak_bytes():.0f} байт (бюджет {peak_budget}) - ok")
+        except AssertionError as e:
+            print(e)
+            failures += 1
+    return failures
+
+
+if __name__ == "__main__":
+    # Все проверки выполняются и печатаются; превышение любого бюджета - код выхода 1
+    failed = check_basket_budget() + check_game_budgets()
+    if failed:
+        print(f"Превышены бюджеты выделений: {failed}")
+        sys.exit(1)
@@ -0,0 +1,211 @@
+"""
+Модуль для кэша изображений, заранее масштабированных под разрешение устройства
+
+Запуск как скрипта запекает изображения для текущего разрешения:
+    python asset_cache.py
+"""
+import hashlib
+import json
+import mmap
+import os
+import pygame
+import config
+from surfaces import convert_for_display
+
+
+# Версия формата блобов; при изменении старые записи не используются
+CACHE_FORMAT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# pygame.image.tobytes появился в pygame 2.1.3, раньше был tostring
+_image_tobytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+
+
+def resolve_asset_path(path: str) -> str:
+    """Путь к исходному изображению: как задан или внутри ASSETS_DIR"""
+    if os.path.exists(path):
+        return path
+    return os.path.join(config.ASSETS_DIR, path)
+
+
+class AssetCache:
+    """
+    Кэш изображений в виде готовых RGBA-блобов нужного размера.
+
+    Манифест связывает ключ (хэш исходного PNG + целевой размер) с файлом
+    блоба. Загрузка блоба - memory-map и pygame.image.frombuffer, без
+    декодирования PNG и масштабирования. Для нового размера блоб
+    запекается на лету и сохраняется.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir if cache_dir is not None else config.ASSET_CACHE_DIR
+        self.manifest_path = os.path.join(self.cache_dir, MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+
+        self._source_hashes = {}  # Путь -> хэш исходника (считается один раз за запуск)
+        self._surfaces = {}  # (путь, размер) -> готовая поверхность
+        self._mmaps = []  # Блобы, на которые ссылаются неконвертированные поверхности
+        self.hits = 0
+        self.bakes = 0
+
+    def _load_manifest(self) -> dict:
+        """Чтение манифеста (пустой, если его нет или он повреждён)"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != CACHE_FORMAT_VERSION:
+            return {}
+        return manifest.get('entries', {})
+
+    def _save_manifest(self):
+        """Атомарная запись манифеста"""
+        tmp_path = self.manifest_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_FORMAT_VERSION, 'entries': self.manifest},
+                          f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"Ошибка записи манифеста ассетов: {e}")
+
+    def source_hash(self, path: str) -> str:
+        """Хэш содержимого исходного изображения"""
+        source_path = resolve_asset_path(path)
+        digest = self._source_hashes.get(source_path)
+        if digest is None:
+            with open(source_path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+            self._source_hashes[source_path] = digest
+        return digest
+
+    def entry_key(self, path: str, size) -> str:
+        """Ключ записи манифеста"""
+        return f"{self.source_hash(path)}-{size[0]}x{size[1]}"
+
+    def get_image(self, path: str, size) -> pygame.Surface:
+        """
+        Изображение path, масштабированное до size, в формате дисплея.
+
+        Повторные запросы в рамках запуска отдают ту же поверхность.
+        """
+        size = (int(size[0]), int(size[1]))
+        surface = self._surfaces.get((path, size))
+        if surface is not None:
+            return surface
+
+        key = self.entry_key(path, size)
+        entry = self.manifest.get(key)
+        surface = None
+        if entry is not None:
+            surface = self._load_blob(entry, size)
+        if surface is None:
+            surface = self.bake(path, size)
+        else:
+            self.hits += 1
+
+        self._surfaces[(path, size)] = surface
+        return surface
+
+    def _load_blob(self, entry: dict, size):
+        """Поверхность из блоба через memory-map"""
+        blob_path = os.path.join(self.cache_dir, entry['file'])
+        try:
+            with open(blob_path, 'rb') as f:
+                blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(blob) != size[0] * size[1] * 4:
+            blob.close()
+            return None
+
+        surface = pygame.image.frombuffer(blob, size, 'RGBA')
+        converted = convert_for_display(surface, alpha=True)
+        if converted is surface:
+            # Без окна конвертировать некуда - поверхность ссылается на блоб
+            self._mmaps.append(blob)
+        else:
+            blob.close()
+        return converted
+
+    def bake(self, path: str, size) -> pygame.Surface:
+        """Декодирование, масштабирование и сохранение блоба для размера size"""
+        size = (int(size[0]), int(size[1]))
+        image = pygame.image.load(resolve_asset_path(path))
+        if image.get_bitsize() < 24:
+            # smoothscale работает только с 24/32-битными поверхностями
+            rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+            rgba.blit(image, (0, 0))
+            image = rgba
+        scaled = pygame.transform.smoothscale(image, size)
+        self.bakes += 1
+
+        key = self.entry_key(path, size)
+        file_name = f"{key}.rgba"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Старые блобы (в том числе битый блоб с тем же ключом) удаляются до
+            # записи нового, иначе удаление задело бы только что записанный файл
+            self._remove_stale(path, size)
+            tmp_path = os.path.join(self.cache_dir, file_name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_image_tobytes(scaled, 'RGBA'))
+            os.replace(tmp_path, os.path.join(self.cache_dir, file_name))
+            self.manifest[key] = {
+                'file': file_name,
+                'source': path,
+                'size': list(size),
+            }
+            self._save_manifest()
+        except OSError as e:
+            print(f"Ошибка записи кэша изображения '{path}': {e}")
+
+        return convert_for_display(scaled, alpha=True)
+
+    def _remove_stale(self, path: str, size):
+        """Удаление блобов того же изображения и размера от старой версии исходника"""
+        for key, entry in list(self.manifest.items()):
+            if entry['source'] == path and tuple(entry['size']) == tuple(size):
+                del self.manifest[key]
+                try:
+                    os.remove(os.path.join(self.cache_dir, entry['file']))
+                except OSError:
+                    pass
+
+
+_asset_cache = None
+
+
+def get_asset_cache() -> AssetCache:
+    """Общий кэш ассетов игры"""
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache()
+    return _asset_cache
+
+
+def default_bake_targets():
+    """Изображения и размеры, нужные игре при текущем разрешении"""
+    targets = [(config.BALL_IMAGE_PATH, (config.BALL_SIZE, config.BALL_SIZE))]
+    for settings in config.DIFFICULTY_SETTINGS.values():
+        targets.append((config.BASKET_IMAGE_PATH, (settings['basket_width'], config.BASKET_HEIGHT)))
+    if config.SHELF_TEXTURED:
+        targets.append((config.BOARD_IMAGE_PATH, (config.SHELF_MAX_WIDTH, config.SHELF_HEIGHT)))
+    return targets
+
+
+def bake_all(targets=None):
+    """Запекание всех изображений для текущего разрешения"""
+    cache = get_asset_cache()
+    for path, size in (targets if targets is not None else default_bake_targets()):
+        try:
+            cache.get_image(path, size)
+            print(f"{path} {size[0]}x{size[1]}: готово")
+        except (pygame.error, OSError) as e:
+            print(f"{path} {size[0]}x{size[1]}: ошибка {e}")
+
+
+if __name__ == "__main__":
+    bake_all()
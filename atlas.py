@@ -0,0 +1,138 @@
+"""
+Модуль для текстурного атласа спрайтов
+"""
+import pygame
+import config
+from asset_cache import get_asset_cache, default_bake_targets
+from surfaces import create_surface
+
+
+class TextureAtlas:
+    """Одна поверхность со всеми спрайтами и таблица их прямоугольников"""
+
+    def __init__(self, surface: pygame.Surface, rects: dict):
+        self.surface = surface
+        self.rects = rects
+
+    def __contains__(self, name) -> bool:
+        return name in self.rects
+
+    def get_rect(self, name) -> pygame.Rect:
+        """Прямоугольник спрайта внутри атласа"""
+        return self.rects[name]
+
+
+class AtlasBuilder:
+    """
+    Упаковка спрайтов в атлас по полкам.
+
+    Спрайты сортируются по высоте и раскладываются рядами шириной
+    не более max_width; каждый ряд имеет высоту самого высокого спрайта.
+    """
+
+    def __init__(self, max_width: int = None, padding: int = 1):
+        self.max_width = max_width if max_width is not None else config.ATLAS_MAX_WIDTH
+        self.padding = padding
+        self.items = {}
+
+    def add(self, name, surface: pygame.Surface):
+        """Добавить спрайт под именем name (любой хэшируемый ключ)"""
+        self.items[name] = surface
+
+    def build(self) -> TextureAtlas:
+        """Собрать атлас"""
+        order = sorted(self.items.items(), key=lambda item: item[1].get_height(), reverse=True)
+        rects = {}
+        x = y = 0
+        row_height = 0
+        atlas_width = 0
+        for name, surface in order:
+            width, height = surface.get_size()
+            if x > 0 and x + width > self.max_width:
+                # Новый ряд
+                y += row_height + self.padding
+                x = 0
+                row_height = 0
+            rects[name] = pygame.Rect(x, y, width, height)
+            x += width + self.padding
+            row_height = max(row_height, height)
+            atlas_width = max(atlas_width, x)
+
+        atlas_surface = create_surface((max(1, atlas_width), max(1, y + row_height)), alpha=True)
+        atlas_surface.fill((0, 0, 0, 0))
+        for name, surface in order:
+            atlas_surface.blit(surface, rects[name])
+        return TextureAtlas(atlas_surface, rects)
+
+
+class SpriteBatch:
+    """Накопитель блитов из атласа для одного слоя: один Surface.blits на слой"""
+
+    def __init__(self, atlas: TextureAtlas):
+        self.atlas = atlas
+        self.items = []
+
+    def has(self, name) -> bool:
+        """Есть ли спрайт в атласе"""
+        return name in self.atlas.rects
+
+    def add(self, name, position):
+        """Добавить спрайт в слой (position - точка левого верхнего угла или Rect)"""
+        self.items.append((self.atlas.surface, position, self.atlas.rects[name]))
+
+    def flush(self, renderer):
+        """Вывести накопленный слой одним пакетом"""
+        if self.items:
+            renderer.blits(self.items)
+            self.items.clear()
+
+
+def particle_sprite_name(color, size: int, alpha_level: int):
+    """Ключ спрайта частицы в атласе"""
+    return ('particle', tuple(color[:3]), size, alpha_level)
+
+
+def game_sprite_surfaces() -> list:
+    """Картинки игровых объектов для текущего разрешения (из кэша ассетов)"""
+    if not config.USE_IMAGES:
+        return []
+    cache = get_asset_cache()
+    surfaces = []
+    for path, size in default_bake_targets():
+        if path == config.BOARD_IMAGE_PATH:
+            continue  # Доска рисуется в слой полочек, а не из атласа
+        try:
+            surfaces.append(cache.get_image(path, size))
+        except (pygame.error, OSError) as e:
+            print(f"Изображение '{path}' не добавлено в атлас: {e}")
+    return surfaces
+
+
+def build_game_atlas(labels: dict = None, sprites=()) -> TextureAtlas:
+    """
+    Сборка атласа игры: спрайты частиц, статичные надписи UI и картинки.
+
+    :param labels: Имя -> (шрифт, текст, цвет) для статичных надписей.
+    :param sprites: Готовые поверхности (шар, корзина). Ключом в атласе служит
+        сама поверхность: объект, держащий её, проверяет batch.has(image).
+    """
+    builder = AtlasBuilder()
+
+    # Частицы: заранее нарисованные круги для каждого цвета, размера и уровня прозрачности
+    levels = config.PARTICLE_ALPHA_LEVELS
+    for color in config.PARTICLE_ATLAS_COLORS:
+        for size in range(config.PARTICLE_SIZE_MIN, config.PARTICLE_SIZE_MAX + 1):
+            for level in range(1, levels + 1):
+                alpha = 255 * level // levels
+                sprite = create_surface((size * 2, size * 2), alpha=True)
+                sprite.fill((0, 0, 0, 0))
+                pygame.draw.circle(sprite, (*color[:3], alpha), (size, size), size)
+                builder.add(particle_sprite_name(color, size, level), sprite)
+
+    for name, (font, text, color) in (labels or {}).items():
+        builder.add(name, font.render(text, True, color))
+
+    for surface in sprites:
+        builder.add(surface, surface)
+
+    return builder.build()
@@ -0,0 +1,181 @@
+"""
+Модуль для автоматического игрока (нагрузочные прогоны)
+"""
+import config
+
+
+class AutoPlayer:
+    """
+    Бот, который ведёт корзину под шары.
+
+    Для каждого шара прогнозируется, где и через сколько тиков он
+    пересечёт середину корзины: траектория между событиями прямолинейна,
+    а события - отскоки от стен, от верха экрана и от полочек - считаются
+    по тем же правилам, что и в Ball. Прогноз пересчитывается только когда
+    меняется состав шаров или полочек (удар о полочку её удаляет, поимка
+    меняет скорость шаров) и раз в REPLAN_TICKS тиков - чтобы поправить
+    расхождение непрерывного прогноза с пошаговой физикой игры.
+    Корзина идёт под шар, который упадёт раньше всех, но в пределах
+    допуска смещается в сторону следующего, чтобы успеть и к нему.
+    """
+
+    CATCH_TOLERANCE = 0.25  # Допустимое смещение от шара в долях ширины корзины
+
+    MAX_EVENTS = 64  # Ограничение числа отскоков в одном прогнозе
+    REPLAN_TICKS = 15
+
+    def __init__(self):
+        self.tick = 0
+        self.target_x = None
+        self.replans = 0
+        self._key = None
+        self._planned_tick = 0
+        self._landings = []  # (тик падения, x, шар) по всем шарам
+
+    def reset(self):
+        """Сброс прогнозов (например, при перезапуске игры)"""
+        self.tick = 0
+        self.target_x = None
+        self._key = None
+        self._landings = []
+
+    def predict_landing(self, ball, shelves, plane_y: float):
+        """
+        Прогноз пересечения шаром горизонтали plane_y при движении вниз.
+
+        :param shelves: Последовательность полочек (они не меняются в прогнозе,
+            но задетая полочка дальше не учитывается - в игре она удаляется).
+        :return: (тиков до пересечения, x) или None, если прогноз не сошёлся.
+        """
+        half = ball.size // 2
+        x, y = ball.x, ball.y
+        vx, vy = ball.speed_x, ball.speed_y
+        left_wall, right_wall = half, config.WIDTH - half
+        elapsed = 0.0
+        used = set()
+
+        for _ in range(self.MAX_EVENTS):
+            if abs(vy) < 1e-6:
+                return None
+
+            # Ближайшее событие: пересечение цели, стена, верх экрана или полочка
+            best_t = (plane_y - y) / vy if vy > 0 else float('inf')
+            event = 'land'
+            if vx > 0:
+                t = (right_wall - x) / vx
+                if t < best_t:
+                    best_t, event = t, 'wall'
+            elif vx < 0:
+                t = (left_wall - x) / vx
+                if t < best_t:
+                    best_t, event = t, 'wall'
+            if vy < 0:
+                t = (half - y) / vy
+                if t < best_t:
+                    best_t, event = t, 'top'
+
+            hit_shelf = None
+            hit_face = None
+            for shelf in shelves:
+                if shelf in used:
+                    continue
+                rect = shelf.rect
+                hit = self._ray_box(x, y, vx, vy,
+                                    rect.left - half, rect.right + half,
+                                    rect.top - half, rect.bottom + half)
+                if hit is not None and hit[0] < best_t:
+                    best_t, hit_face = hit
+                    hit_shelf = shelf
+            if hit_shelf is not None:
+                event = 'shelf'
+
+            best_t = max(best_t, 0.0)
+            x += vx * best_t
+            y += vy * best_t
+            elapsed += best_t
+
+            if event == 'land':
+                return elapsed, x
+            if event == 'wall':
+                vx = -vx
+            elif event == 'top':
+                vy = -vy
+            elif hit_face == 'top':
+                vy = -abs(vy) * config.BOUNCE_COEFF
+                vx *= config.FRICTION_COEFF
+                used.add(hit_shelf)
+            elif hit_face == 'bottom':
+                vy = abs(vy) * config.BOUNCE_COEFF
+                used.add(hit_shelf)
+            else:
+                vx = (-abs(vx) if hit_face == 'left' else abs(vx)) * config.BOUNCE_COEFF
+                used.add(hit_shelf)
+        return None
+
+    @staticmethod
+    def _ray_box(x, y, vx, vy, left, right, top, bottom):
+        """Время входа луча в прямоугольник и грань входа или None"""
+        if vx != 0:
+            tx1, tx2 = (left - x) / vx, (right - x) / vx
+            tx_enter, tx_exit = min(tx1, tx2), max(tx1, tx2)
+        elif left < x < right:
+            tx_enter, tx_exit = float('-inf'), float('inf')
+        else:
+            return None
+        ty1, ty2 = (top - y) / vy, (bottom - y) / vy
+        ty_enter, ty_exit = min(ty1, ty2), max(ty1, ty2)
+
+        enter = max(tx_enter, ty_enter)
+        if enter < 0 or enter >= min(tx_exit, ty_exit):
+            return None
+        if ty_enter >= tx_enter:
+            return enter, ('top' if vy > 0 else 'bottom')
+        return enter, ('left' if vx > 0 else 'right')
+
+    def _replan(self, game_state):
+        """Прогнозы для всех шаров"""
+        self.replans += 1
+        self._planned_tick = self.tick
+        basket = game_state.basket
+        plane_y = basket.rect.centery
+        shelves = game_state.shelves.items
+        landings = []
+        for ball in game_state.balls:
+            if not ball.active:
+                continue
+            prediction = self.predict_landing(ball, shelves, plane_y)
+            if prediction is not None:
+                landings.append((self.tick + prediction[0], prediction[1], ball))
+        landings.sort(key=lambda landing: landing[0])
+        self._landings = landings
+
+    def update(self, game_state):
+        """Один тик бота: выбор цели и движение корзины (вместо ввода игрока)"""
+        basket = game_state.basket
+        if basket is None:
+            return
+        self.tick += 1
+
+        key = (game_state.balls.version, game_state.shelves.version, basket.width)
+        if key != self._key or self.tick - self._planned_tick >= self.REPLAN_TICKS:
+            self._key = key
+            self._replan(game_state)
+
+        # Ближайший ещё не пролетевший корзину шар и следующий за ним
+        first = second = None
+        plane_y = basket.rect.centery
+        for _, x, ball in self._landings:
+            if ball.y <= plane_y:
+                if first is None:
+                    first = x
+                else:
+                    second = x
+                    break
+        if first is not None:
+            self.target_x = first
+            if second is not None:
+                tolerance = basket.width * self.CATCH_TOLERANCE
+                self.target_x = min(max(second, first - tolerance), first + tolerance)
+
+        if self.target_x is not None:
+            basket.move(self.target_x)
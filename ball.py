@@ -5,103 +5,99 @@ import pygame
 import random
 import math
 import config
+from asset_cache import get_asset_cache
+from masks import get_mask_cache
 
 
 class Ball:
     """Класс шара, падающего в игре"""
     
+    __slots__ = ('size', 'color', 'rect', 'image', 'mask', 'x', 'y', 'speed_x', 'speed_y',
+                 'active', 'prev_x', 'prev_y', 'handle')
+    
     def __init__(self, speed: float = None):
         self.size = config.BALL_SIZE
+        self.color = config.WHITE
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
+        self.handle = -1  # Дескриптор в EntityStore
+        
+        # Загрузка изображения
+        self.image = None
+        if config.USE_IMAGES:
+            self._load_image()
+        
+        # Маска для попиксельных столкновений (общая для всех шаров одного размера)
+        if config.USE_IMAGES and self.image:
+            self.mask = get_mask_cache().get_image_mask(config.BALL_IMAGE_PATH, (self.size, self.size))
+        else:
+            self.mask = get_mask_cache().get_circle_mask(self.size)
+        
+        self.reset(speed)
+    
+    def reset(self, speed: float = None):
+        """Переинициализация шара на месте (для повторного использования из пула)"""
         self.x = random.randint(self.size, config.WIDTH - self.size)
         self.y = -self.size
-        self.color = config.WHITE
         self.speed_y = speed if speed is not None else config.BALL_SPEED
         self.speed_x = random.uniform(-self.speed_y / 2, self.speed_y / 2)
-        self.rect = pygame.Rect(
-            self.x - self.size // 2,
-            self.y - self.size // 2,
-            self.size,
-            self.size
-        )
+        self.rect.x = self.x - self.size // 2
+        self.rect.y = self.y - self.size // 2
         self.active = True
         self.prev_x = self.x
         self.prev_y = self.y
-        
-        # Загрузка изображения
-        self.image = None
-        if config.USE_IMAGES:
-            self._load_image()
     
     def _load_image(self):
-        """Загрузка изображения шара"""
+        """Загрузка изображения шара (из кэша ассетов, один раз на размер)"""
         try:
-            original_image = pygame.image.load(config.BALL_IMAGE_PATH).convert_alpha()
-            self.image = pygame.transform.scale(
-                original_image,
+            self.image = get_asset_cache().get_image(
+                config.BALL_IMAGE_PATH,
                 (self.size, self.size)
             )
-        except pygame.error as e:
+        except (pygame.error, OSError) as e:
             print(f"Ошибка загрузки изображения шара '{config.BALL_IMAGE_PATH}': {e}")
             self.image = None
     
     def fall(self):
-        """Обновление позиции шара"""
-        if not self.active:
-            return
-        
-        # Сохраняем предыдущую позицию
-        self.prev_x = self.x
-        self.prev_y = self.y
-        
-        # Обновляем позицию
-        self.x += self.speed_x
-        self.y += self.speed_y
-        
-        # Отскок от боковых стен
-        if self.x - self.size // 2 < 0:
-            self.x = self.size // 2
-            self.speed_x *= -1
-        elif self.x + self.size // 2 > config.WIDTH:
-            self.x = config.WIDTH - self.size // 2
-            self.speed_x *= -1
-        
-        # Отскок от верхней части экрана
-        if self.y - self.size // 2 < 0:
-            self.y = self.size // 2
-            self.speed_y *= -1
-        
-        self.rect.x = int(self.x - self.size // 2)
-        self.rect.y = int(self.y - self.size // 2)
-        
-        # Деактивация, если шар упал слишком низко
-        if self.y - self.size // 2 > config.HEIGHT + 100:
-            self.active = False
+        """Обновление позиции шара (та же физика, что в update_balls_motion)"""
+        update_balls_motion((self,))
     
-    def draw(self, screen: pygame.Surface):
-        """Отрисовка шара"""
+    def draw(self, renderer, batch=None):
+        """Отрисовка шара (картинка - через слой атласа batch, если она там есть)"""
         if not self.active:
             return
         
         if config.USE_IMAGES and self.image:
-            screen.blit(self.image, self.rect)
+            if batch is not None and batch.has(self.image):
+                batch.add(self.image, self.rect)
+            else:
+                renderer.sprite(self.image, self.rect)
         else:
-            pygame.draw.circle(
-                screen,
+            renderer.circle(
                 self.color,
                 (int(self.x), int(self.y)),
                 self.size // 2
             )
     
     def check_collision_with_basket(self, basket) -> bool:
-        """Проверка столкновения с корзиной"""
+        """
+        Проверка столкновения с корзиной: быстрая проверка прямоугольников,
+        затем (при PIXEL_PERFECT_COLLISION) пересечение масок со смещением
+        """
+        if config.PIXEL_PERFECT_COLLISION:
+            basket_rect = basket.rect
+            if not self.rect.colliderect(basket_rect):
+                return False
+            offset = (self.rect.x - basket_rect.x, self.rect.y - basket_rect.y)
+            return basket.mask.overlap(self.mask, offset) is not None
+        
         for rect in basket.get_collision_rects():
             if self.rect.colliderect(rect):
                 return True
         return False
     
-    def handle_collisions_with_shelves(self, shelves, shelves_to_remove_list):
-        """Обработка столкновений с полочками"""
-        for shelf in shelves[:]:
+    def handle_collisions_with_shelves(self, shelves, hit_shelves: list):
+        """Обработка столкновений с полочками (задетая полочка добавляется в hit_shelves)"""
+        for shelf in shelves:
             if self.rect.colliderect(shelf.rect):
                 # Столкновение сверху (шар падает на полочку)
                 if self.prev_y + self.size // 2 <= shelf.rect.top:
@@ -124,12 +120,55 @@ class Ball:
                         self.speed_x = abs(self.speed_x) * config.BOUNCE_COEFF
                     self.rect.x = int(self.x - self.size // 2)
                 
-                # Добавляем полочку в список для удаления
-                if shelf not in shelves_to_remove_list:
-                    shelves_to_remove_list.append(shelf)
+                # Добавляем полочку в список для удаления (порядок удаления
+                # меняет порядок shelves.items, поэтому список, а не множество)
+                if shelf not in hit_shelves:
+                    hit_shelves.append(shelf)
                 break
     
     def update_speed(self, speed: float):
         """Обновление скорости шара"""
         self.speed_y = speed
 
+
+def update_balls_motion(balls):
+    """
+    Пакетное обновление позиций шаров и отскоков от стен.
+    
+    Единственная реализация движения шара (Ball.fall вызывает её для
+    одного шара): один цикл с константами в локальных переменных.
+    """
+    width = config.WIDTH
+    deactivate_y = config.HEIGHT + config.BALL_OFFSCREEN_MARGIN
+    for ball in balls:
+        if not ball.active:
+            continue
+        
+        half = ball.size // 2
+        x = ball.x
+        y = ball.y
+        ball.prev_x = x
+        ball.prev_y = y
+        x += ball.speed_x
+        y += ball.speed_y
+        
+        # Отскок от боковых стен
+        if x - half < 0:
+            x = half
+            ball.speed_x = -ball.speed_x
+        elif x + half > width:
+            x = width - half
+            ball.speed_x = -ball.speed_x
+        
+        # Отскок от верхней части экрана
+        if y - half < 0:
+            y = half
+            ball.speed_y = -ball.speed_y
+        
+        ball.x = x
+        ball.y = y
+        ball.rect.x = int(x - half)
+        ball.rect.y = int(y - half)
+        
+        if y - half > deactivate_y:
+            ball.active = False
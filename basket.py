@@ -4,20 +4,36 @@
 import pygame
 import math
 import config
+from asset_cache import get_asset_cache
+from masks import get_mask_cache
 
 
 class StickBasket:
-    """Класс корзины для ловли шаров"""
+    """
+    Класс корзины для ловли шаров.
+
+    Положение корзины - её self.rect (целые пиксели), плавное движение
+    копится целым числом в долях пикселя (SUBPIXELS): move() не создаёт
+    float и не хранит новых объектов, кроме этого счётчика.
+    """
+    
+    SUBPIXELS = 256  # Доли пикселя для накопления плавного движения
     
     def __init__(self, width: int = None, height: int = None):
         self.width = width if width is not None else config.BASKET_WIDTH
         self.height = height if height is not None else config.BASKET_HEIGHT
         self.y = config.BASKET_Y
-        self.x = config.WIDTH // 2 - self.width // 2
+        x = config.WIDTH // 2 - self.width // 2
         self.speed = 0
-        self.target_x = self.x
+        self._x_subpixels = x * self.SUBPIXELS
+        self._smoothness = round(config.BASKET_MOVE_SMOOTHNESS * self.SUBPIXELS)
+        # Границы движения храним готовыми: большие int на каждом кадре выделялись бы заново
+        self._half_width = self.width // 2
+        self._max_x = config.WIDTH - self.width
         
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect = pygame.Rect(x, self.y, self.width, self.height)
+        # В режиме изображения корзина сталкивается одним прямоугольником
+        self._image_collision_rects = [self.rect]
         
         # Загрузка изображения
         self.image = None
@@ -25,30 +41,56 @@ class StickBasket:
             self._load_image()
         
         # Инициализация палок и полигонов
+        self.sticks = []
         if not config.USE_IMAGES or self.image is None:
-            self.sticks = []
             self.create_sticks()
-        else:
-            self.sticks = []
+        
+        # Маска столкновений в координатах self.rect
+        self.mask = None
+        self._update_mask()
+    
+    @property
+    def x(self) -> int:
+        """Левый край корзины (пиксели)"""
+        return self.rect.x
+    
+    @staticmethod
+    def _get_scaled_image(width: int, height: int):
+        """Получить изображение корзины нужного размера (из кэша ассетов)"""
+        return get_asset_cache().get_image(config.BASKET_IMAGE_PATH, (width, height))
     
     def _load_image(self):
         """Загрузка изображения корзины"""
         try:
-            original_image = pygame.image.load(config.BASKET_IMAGE_PATH).convert_alpha()
-            self.image = pygame.transform.scale(
-                original_image,
-                (self.width, self.height)
-            )
-        except pygame.error as e:
+            self.image = self._get_scaled_image(self.width, self.height)
+        except (pygame.error, OSError) as e:
             print(f"Ошибка загрузки изображения корзины '{config.BASKET_IMAGE_PATH}': {e}")
             self.image = None
-            if not hasattr(self, 'sticks'):
-                self.sticks = []
-                self.create_sticks()
+    
+    def _update_mask(self):
+        """Маска корзины текущего размера (из кэша масок)"""
+        cache = get_mask_cache()
+        if config.USE_IMAGES and self.image:
+            self.mask = cache.get_image_mask(config.BASKET_IMAGE_PATH, (self.width, self.height))
+            return
+        
+        # Без изображения: дно и наклонные стенки так же, как они рисуются
+        wall_dx = config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE)
+        wall_dy = config.BASKET_WALL_WIDTH * math.sin(config.BASKET_WALL_ANGLE)
+        bottom_y = self.height - config.STICK_THICKNESS
+        width = self.width
+        self.mask = cache.get_shape_mask(
+            ('basket_sticks', width, self.height),
+            (width, self.height),
+            rects=[(0, bottom_y, width, config.STICK_THICKNESS)],
+            polygons=[
+                [(0, 0), (wall_dx, wall_dy), (wall_dx, bottom_y), (0, bottom_y)],
+                [(width, 0), (width - wall_dx, wall_dy), (width - wall_dx, bottom_y), (width, bottom_y)],
+            ]
+        )
     
     def create_sticks(self):
         """Создание геометрических элементов корзины"""
-        self.sticks = []
         bottom = pygame.Rect(
             self.x,
             self.y + self.height - config.STICK_THICKNESS,
@@ -68,72 +110,81 @@ class StickBasket:
             config.STICK_THICKNESS,
             self.height
         )
-        self.sticks.extend([bottom, left_stick_approx, right_stick_approx])
+        self.sticks = [bottom, left_stick_approx, right_stick_approx]
+        
+        # Смещения наклонных стенок в локальных координатах считаются один раз
+        # на ширину; при движении точки полигонов только сдвигаются по x
+        self._wall_dx = round(config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE))
+        wall_dy = config.BASKET_WALL_WIDTH * math.sin(config.BASKET_WALL_ANGLE)
+        bottom_y = self.y + self.height - config.STICK_THICKNESS
         
-        # Координаты для отрисовки наклонных стенок
+        # Точки хранятся изменяемыми списками [x, y], y не меняется
         self.left_wall_points = [
-            (self.x, self.y),
-            (self.x + config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-             self.y + config.BASKET_WALL_WIDTH * math.sin(config.BASKET_WALL_ANGLE)),
-            (self.x + config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-             self.y + self.height - config.STICK_THICKNESS),
-            (self.x, self.y + self.height - config.STICK_THICKNESS)
+            [0, self.y],
+            [0, self.y + wall_dy],
+            [0, bottom_y],
+            [0, bottom_y]
         ]
         self.right_wall_points = [
-            (self.x + self.width, self.y),
-            (self.x + self.width - config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-             self.y + config.BASKET_WALL_WIDTH * math.sin(config.BASKET_WALL_ANGLE)),
-            (self.x + self.width - config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-             self.y + self.height - config.STICK_THICKNESS),
-            (self.x + self.width, self.y + self.height - config.STICK_THICKNESS)
+            [0, self.y],
+            [0, self.y + wall_dy],
+            [0, bottom_y],
+            [0, bottom_y]
         ]
+        self._translate_sticks()
+    
+    def _translate_sticks(self):
+        """Сдвиг прямоугольников и полигонов корзины к текущему x без новых объектов"""
+        x = self.x
+        right_x = x + self.width
+        wall_dx = self._wall_dx
+        
+        # x и смещения стенок - целые пиксели
+        self.sticks[0].x = x  # bottom
+        self.sticks[1].x = x  # left
+        self.sticks[2].x = right_x - config.STICK_THICKNESS  # right
+        
+        left = self.left_wall_points
+        left[0][0] = x
+        left[1][0] = x + wall_dx
+        left[2][0] = x + wall_dx
+        left[3][0] = x
+        
+        right = self.right_wall_points
+        right[0][0] = right_x
+        right[1][0] = right_x - wall_dx
+        right[2][0] = right_x - wall_dx
+        right[3][0] = right_x
     
     def move(self, target_x: float):
         """Плавное движение корзины к цели"""
-        self.target_x = max(0, min(target_x - self.width // 2, config.WIDTH - self.width))
-        # Интерполяция для плавности
-        self.x += (self.target_x - self.x) * config.BASKET_MOVE_SMOOTHNESS
-        self.rect.x = int(self.x)
+        target = max(0, min(int(target_x) - self._half_width, self._max_x))
+        # Интерполяция для плавности - в долях пикселя, целыми числами
+        subpixels = self.SUBPIXELS
+        self._x_subpixels += (target * subpixels - self._x_subpixels) * self._smoothness // subpixels
+        self.rect.x = (self._x_subpixels + subpixels // 2) // subpixels
         
         if not config.USE_IMAGES or self.image is None:
-            # Обновляем позиции прямоугольников
-            self.sticks[0].x = int(self.x)  # bottom
-            self.sticks[1].x = int(self.x)  # left
-            self.sticks[2].x = int(self.x + self.width - config.STICK_THICKNESS)  # right
-            
-            # Обновляем координаты наклонных стенок
-            self.left_wall_points = [
-                (self.x, self.y),
-                (self.x + config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-                 self.y + config.BASKET_WALL_WIDTH * math.sin(config.BASKET_WALL_ANGLE)),
-                (self.x + config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-                 self.y + self.height - config.STICK_THICKNESS),
-                (self.x, self.y + self.height - config.STICK_THICKNESS)
-            ]
-            self.right_wall_points = [
-                (self.x + self.width, self.y),
-                (self.x + self.width - config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-                 self.y + config.BASKET_WALL_WIDTH * math.sin(config.BASKET_WALL_ANGLE)),
-                (self.x + self.width - config.BASKET_WALL_WIDTH * math.cos(config.BASKET_WALL_ANGLE),
-                 self.y + self.height - config.STICK_THICKNESS),
-                (self.x + self.width, self.y + self.height - config.STICK_THICKNESS)
-            ]
+            self._translate_sticks()
     
-    def draw(self, screen: pygame.Surface):
-        """Отрисовка корзины"""
+    def draw(self, renderer, batch=None):
+        """Отрисовка корзины (картинка - через слой атласа batch, если она там есть)"""
         if config.USE_IMAGES and self.image:
-            screen.blit(self.image, self.rect)
+            if batch is not None and batch.has(self.image):
+                batch.add(self.image, self.rect)
+            else:
+                renderer.sprite(self.image, self.rect)
         else:
             # Рисуем дно
-            pygame.draw.rect(screen, config.STICK_COLOR, self.sticks[0])
+            renderer.rect(config.STICK_COLOR, self.sticks[0])
             # Рисуем наклонные стенки
-            pygame.draw.polygon(screen, config.STICK_COLOR, self.left_wall_points)
-            pygame.draw.polygon(screen, config.STICK_COLOR, self.right_wall_points)
+            renderer.polygon(config.STICK_COLOR, self.left_wall_points)
+            renderer.polygon(config.STICK_COLOR, self.right_wall_points)
     
     def get_collision_rects(self):
         """Получить прямоугольники для проверки столкновений"""
         if config.USE_IMAGES and self.image:
-            return [pygame.Rect(self.x, self.y, self.width, self.height)]
+            return self._image_collision_rects
         else:
             return self.sticks
     
@@ -141,18 +192,16 @@ class StickBasket:
         """Обновление размера корзины"""
         self.width = new_width
         self.rect.width = new_width
-        self.x = config.WIDTH // 2 - self.width // 2
-        self.rect.x = int(self.x)
+        self._half_width = self.width // 2
+        self._max_x = config.WIDTH - self.width
+        self.rect.x = config.WIDTH // 2 - self.width // 2
+        self._x_subpixels = self.rect.x * self.SUBPIXELS
         
         if config.USE_IMAGES and self.image:
             try:
-                original_image = pygame.image.load(config.BASKET_IMAGE_PATH).convert_alpha()
-                self.image = pygame.transform.scale(
-                    original_image,
-                    (self.width, self.height)
-                )
-            except pygame.error:
+                self.image = self._get_scaled_image(self.width, self.height)
+            except (pygame.error, OSError):
                 pass
         else:
             self.create_sticks()
-
+        self._update_mask()
@@ -0,0 +1,117 @@
+"""
+Замер выигрыша от атласа: отдельные блиты против одного Surface.blits на слой
+
+Запуск:
+    python bench_atlas.py [число_кадров] [число_частиц]
+"""
+import random
+import sys
+import time
+import pygame
+import config
+from atlas import SpriteBatch, build_game_atlas, game_sprite_surfaces, particle_sprite_name
+from renderer import PygameRenderer
+
+
+def _make_frame(atlas, labels, sprites, particle_count):
+    """Содержимое типичного игрового кадра: (имя в атласе, позиция)"""
+    rng = random.Random(1)
+    items = []
+    for surface in sprites:
+        items.append((surface, (rng.randrange(config.WIDTH), rng.randrange(config.HEIGHT))))
+    for name in labels:
+        items.append((name, (rng.randrange(config.WIDTH), rng.randrange(config.HEIGHT))))
+    for _ in range(particle_count):
+        color = rng.choice(config.PARTICLE_ATLAS_COLORS)
+        size = rng.randint(config.PARTICLE_SIZE_MIN, config.PARTICLE_SIZE_MAX)
+        level = rng.randint(1, config.PARTICLE_ALPHA_LEVELS)
+        items.append((particle_sprite_name(color, size, level),
+                      (rng.randrange(config.WIDTH), rng.randrange(config.HEIGHT))))
+    return [(name, pos) for name, pos in items if name in atlas]
+
+
+def _run(name, frames, draw_frame):
+    """Прогон frames кадров, время на кадр в миллисекундах"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw_frame()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / frames
+    return name, elapsed_ms
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    particle_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    pygame.init()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    font = pygame.font.Font(None, config.FONT_SIZE)
+    labels = {
+        f'label_{i}': (font, text, config.WHITE)
+        for i, text in enumerate(["Олег «СТК»", "Выйти", "Пауза", "Продолжить игру",
+                                  "Легкий", "Средний", "Сложный", "Да", "Нет"])
+    }
+    sprites = game_sprite_surfaces()
+    atlas = build_game_atlas(labels, sprites)
+    frame = _make_frame(atlas, labels, sprites, particle_count)
+
+    # Отдельные поверхности для каждого элемента (как без атласа)
+    separate = []
+    for name, pos in frame:
+        separate.append((atlas.surface.subsurface(atlas.get_rect(name)).copy(), pos))
+
+    # Прежний путь: частицы рисуются полупрозрачными кругами, остальное - отдельными спрайтами
+    levels = config.PARTICLE_ALPHA_LEVELS
+    legacy = []
+    for (name, pos), (surface, _) in zip(frame, separate):
+        if isinstance(name, tuple) and name[0] == 'particle':
+            _, color, size, level = name
+            legacy.append(('circle', (*color, 255 * level // levels), (pos[0] + size, pos[1] + size), size))
+        else:
+            legacy.append(('sprite', surface, pos, None))
+
+    renderer = PygameRenderer(screen)
+    batch = SpriteBatch(atlas)
+
+    def draw_legacy():
+        screen.fill(config.MAROON)
+        for kind, a, b, c in legacy:
+            if kind == 'circle':
+                renderer.circle(a, b, c)
+            else:
+                renderer.sprite(a, b)
+
+    def draw_separate():
+        screen.fill(config.MAROON)
+        for surface, pos in separate:
+            renderer.sprite(surface, pos)
+
+    def draw_atlas_single():
+        screen.fill(config.MAROON)
+        for name, pos in frame:
+            renderer.blits(((atlas.surface, pos, atlas.get_rect(name)),))
+
+    def draw_atlas_batched():
+        screen.fill(config.MAROON)
+        for name, pos in frame:
+            batch.add(name, pos)
+        batch.flush(renderer)
+
+    print(f"Атлас {atlas.surface.get_width()}x{atlas.surface.get_height()}, "
+          f"спрайтов {len(atlas.rects)}; в кадре {len(frame)} элементов, кадров {frames}")
+    print(f"{'Вариант':<34}{'мс/кадр':>10}{'вызовов':>10}")
+    for draw_frame, title in ((draw_legacy, "без атласа, частицы кругами"),
+                              (draw_separate, "отдельные поверхности"),
+                              (draw_atlas_single, "атлас, блит на спрайт"),
+                              (draw_atlas_batched, "атлас, один blits на слой")):
+        renderer.begin_frame()
+        draw_frame()
+        calls = renderer.frame_draw_calls
+        name, ms = _run(title, frames, draw_frame)
+        print(f"{name:<34}{ms:>10.3f}{calls:>10}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
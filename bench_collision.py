@@ -0,0 +1,69 @@
+"""
+Замер стоимости проверки столкновения шара с корзиной: прямоугольники против масок
+
+Запуск:
+    python bench_collision.py [число_шаров] [число_тиков]
+"""
+import random
+import sys
+import time
+import pygame
+import config
+from ball import Ball
+from basket import StickBasket
+
+
+def _place_balls(balls, basket, rng, near_share: float):
+    """Расстановка шаров: доля near_share - в районе корзины, остальные - где угодно"""
+    area = basket.rect.inflate(config.BALL_SIZE * 2, config.BALL_SIZE * 2)
+    for ball in balls:
+        if rng.random() < near_share:
+            ball.x = rng.uniform(area.left, area.right)
+            ball.y = rng.uniform(area.top, area.bottom)
+        else:
+            ball.x = rng.uniform(0, config.WIDTH)
+            ball.y = rng.uniform(0, config.HEIGHT)
+        ball.rect.x = int(ball.x - ball.size // 2)
+        ball.rect.y = int(ball.y - ball.size // 2)
+
+
+def _measure(balls, basket, ticks: int, pixel_perfect: bool):
+    """Время всех проверок за тик (мкс) и число срабатываний"""
+    config.PIXEL_PERFECT_COLLISION = pixel_perfect
+    hits = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for ball in balls:
+            if ball.check_collision_with_basket(basket):
+                hits += 1
+    elapsed_us = (time.perf_counter() - start) * 1e6 / ticks
+    return elapsed_us, hits // ticks
+
+
+def main():
+    ball_counts = [int(sys.argv[1])] if len(sys.argv) > 1 else [config.MAX_BALLS, 100, 1000]
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    pygame.init()
+    pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    rng = random.Random(1)
+    budget_us = 1e6 / config.FPS
+
+    print(f"{'Шаров':>7}{'около корзины':>15}{'режим':>18}{'мкс/тик':>10}{'% бюджета':>11}{'попаданий':>11}")
+    for use_images in (True, False):
+        config.USE_IMAGES = use_images
+        basket = StickBasket(width=config.DIFFICULTY_SETTINGS[2]['basket_width'])
+        for count in ball_counts:
+            balls = [Ball() for _ in range(count)]
+            for near_share in (0.1, 1.0):
+                _place_balls(balls, basket, rng, near_share)
+                for pixel_perfect in (False, True):
+                    us, hits = _measure(balls, basket, ticks, pixel_perfect)
+                    mode = ('маска' if pixel_perfect else 'прямоуг.') + (' (карт.)' if use_images else '')
+                    print(f"{count:>7}{near_share:>15.0%}{mode:>18}{us:>10.1f}"
+                          f"{us / budget_us * 100:>11.3f}{hits:>11}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
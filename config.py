@@ -2,8 +2,22 @@
 Конфигурационный файл игры
 Содержит все константы и настройки
 """
+import os
+import sys
 import pygame
 
+# Диагностические скрипты работают без звука, симуляция и прогон сценариев
+# (кроме режима render) - ещё и без окна. pygame.init() ниже открывает
+# устройства, поэтому драйверы SDL выбираются здесь, по имени запущенного скрипта
+HEADLESS_AUDIO_SCRIPTS = ('alloc_tracker', 'bench_atlas', 'bench_collision', 'gc_control',
+                          'latency', 'scenario_runner', 'simulator')
+HEADLESS_VIDEO_SCRIPTS = ('scenario_runner', 'simulator')
+_script = os.path.splitext(os.path.basename(sys.argv[0]))[0] if sys.argv and sys.argv[0] else ''
+if _script in HEADLESS_AUDIO_SCRIPTS:
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+if _script in HEADLESS_VIDEO_SCRIPTS and sys.argv[1:2] != ['render']:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
 # Инициализация pygame для получения информации о дисплее
 pygame.init()
 info = pygame.display.Info()
@@ -13,6 +27,8 @@ USE_IMAGES = True
 BALL_IMAGE_PATH = 'Яйцо.png'
 BASKET_IMAGE_PATH = 'Корзина.png'
 BOARD_IMAGE_PATH = 'Доска.png' # Новая переменная для изображения доски
+ASSETS_DIR = 'assets'  # Где искать изображения, если их нет в рабочем каталоге
+ASSET_CACHE_DIR = 'cache/assets'  # Изображения, масштабированные под разрешение
 
 # Цвета
 WHITE = (255, 255, 255)
@@ -28,22 +44,82 @@ DARK_GREEN = (0, 100, 0)
 ORANGE = (255, 165, 0)
 PURPLE = (128, 0, 128)
 
+# Бэкенд отрисовки: 'pygame', 'null' (только подсчёт вызовов) или 'recording'
+RENDER_BACKEND = os.environ.get('CATCHBALL_RENDER_BACKEND', 'pygame')
+# Отладка: логировать блиты, формат источника которых не совпадает с экраном
+SURFACE_AUDIT = os.environ.get('CATCHBALL_SURFACE_AUDIT') == '1'
+# Диагностика: учёт выделений памяти за кадр (tracemalloc, сильно замедляет игру)
+ALLOC_TRACKING = os.environ.get('CATCHBALL_ALLOC_TRACKING') == '1'
+# Сборщик мусора: 'managed' (сборки в меню и в свободное время кадра) или 'auto' (как в CPython)
+GC_MODE = os.environ.get('CATCHBALL_GC_MODE', 'managed')
+# Автоигра: корзиной управляет бот (для долгих нагрузочных прогонов)
+AUTOPLAY = os.environ.get('CATCHBALL_AUTOPLAY') == '1'
+AUTOPLAY_DIFFICULTY = 2
+SCENARIOS_DIR = 'scenarios'  # Нагрузочные сценарии для scenario_runner.py
+# Профилирование N кадров: фаза из переменной окружения (frame, events, update, draw)
+# включает запись при запуске, клавиша PROFILE_KEY - в любой момент игры
+PROFILE_PHASE = os.environ.get('CATCHBALL_PROFILE', '')
+PROFILE_DEFAULT_PHASE = PROFILE_PHASE or 'frame'
+PROFILE_FRAMES = int(os.environ.get('CATCHBALL_PROFILE_FRAMES', '300'))
+PROFILE_KEY = pygame.K_F9
+PROFILE_SAMPLE_INTERVAL_MS = 2  # Период потока-сэмплера для свёрнутых стеков
+PROFILE_PRINT_TOP = 15  # Сколько строк pstats печатать по окончании записи
+PROFILE_DIR = 'cache/profiles'
+
 # Размеры окна (адаптивно к экрану)
-WIDTH = info.current_w
-HEIGHT = info.current_h
+DISPLAY_WIDTH = info.current_w
+DISPLAY_HEIGHT = info.current_h
+
+# Внутреннее разрешение отрисовки - доля от разрешения экрана; кадр
+# растягивается на окно один раз при выводе. Вся игровая геометрия ниже
+# считается в координатах внутреннего разрешения: размеры - от WIDTH/HEIGHT,
+# скорости - от размеров экрана с множителем RENDER_SCALE (без округления,
+# чтобы темп игры не зависел от масштаба), фиксированные отступы - через _px
+try:
+    RENDER_SCALE = min(1.0, max(0.1, float(os.environ.get('CATCHBALL_RENDER_SCALE', '1.0'))))
+except ValueError:
+    print(f"Неверное значение CATCHBALL_RENDER_SCALE: {os.environ['CATCHBALL_RENDER_SCALE']!r}, используется 1.0")
+    RENDER_SCALE = 1.0
+RENDER_SCALE_SMOOTH = True  # smoothscale; False - без сглаживания (для целых кратностей)
+WIDTH = max(1, int(DISPLAY_WIDTH * RENDER_SCALE))
+HEIGHT = max(1, int(DISPLAY_HEIGHT * RENDER_SCALE))
+
+
+def _px(value: float) -> int:
+    """Отступ или толщина в пикселях экрана -> пиксели внутреннего разрешения (не меньше 1)"""
+    return max(1, round(value * RENDER_SCALE))
+
 
 # Настройки корзины
 BASKET_WIDTH = WIDTH // 6
 BASKET_HEIGHT = HEIGHT // 12
 BASKET_Y = HEIGHT - BASKET_HEIGHT - HEIGHT // 15
-BASKET_SPEED = WIDTH // 40
-STICK_THICKNESS = 8
+BASKET_SPEED = DISPLAY_WIDTH // 40 * RENDER_SCALE
+STICK_THICKNESS = _px(8)
 STICK_COLOR = BLUE
-BASKET_MOVE_SMOOTHNESS = 0.3  # Коэффициент плавности движения корзины
+BASKET_MOVE_SMOOTHNESS = 0.3  # Коэффициент плавности движения корзины (за тик)
+INPUT_COALESCE_WINDOW = 240  # Окно статистики схлопывания ввода (число применений)
+INPUT_LATENCY_SMOOTHING = 0.1  # Сглаживание измеренного отклика (LatencyTracker) для выноса цели
+# Предсказание движения пальца: фильтр One-Euro и вынос цели на задержку конвейера.
+# Параметры по умолчанию; уровни сложности переопределяют их ключами input_*
+INPUT_PREDICTION = os.environ.get('CATCHBALL_INPUT_PREDICTION') == '1'
+INPUT_MIN_CUTOFF = 1.0  # Частота среза на медленном движении (Гц)
+INPUT_BETA = 0.01  # Рост частоты среза со скоростью пальца (на пиксель экрана в секунду)
+INPUT_D_CUTOFF = 5.0  # Частота среза для скорости: ниже - запаздывает вынос на разворотах
+INPUT_PREDICTION_MAX_LEAD_MS = 120  # Предел выноса цели вперёд
+INPUT_PREDICTION_MAX_OFFSET = WIDTH // 10  # Предел выноса в пикселях (рывки и новые касания)
+INPUT_PREDICTION_IDLE_MS = 50  # Без событий дольше этого палец считается остановившимся
+INPUT_PRESENT_DELAY_MS = 16  # Задержка до кадра на экране (около кадра при 60 FPS), пока отклик не измерен
+# Задержка "касание -> кадр на экране" (отчёт при выходе из игры)
+LATENCY_TRACKING = os.environ.get('CATCHBALL_LATENCY') == '1'
+LATENCY_WINDOW = 600  # Окно замеров
+LATENCY_SETTLE_PX = _px(4)  # Корзина "дошла" до пальца, если ближе этого
+LATENCY_HISTOGRAM_BINS_MS = (8, 16, 25, 33, 50, 67, 100, 150, 200, 300)
 
 # Настройки шара
 BALL_SIZE = WIDTH // 30
-BALL_SPEED = HEIGHT // 125  # Базовая скорость
+BALL_SPEED = DISPLAY_HEIGHT // 125 * RENDER_SCALE  # Базовая скорость (пикселей за тик)
+BALL_OFFSCREEN_MARGIN = _px(100)  # Шар, ушедший ниже экрана на столько, выбывает
 BOUNCE_COEFF = 0.7  # Коэффициент упругости при отскоке от полочек
 FRICTION_COEFF = 0.98  # Коэффициент трения при отскосе
 
@@ -52,34 +128,50 @@ SHELF_MIN_WIDTH = WIDTH // 8
 SHELF_MAX_WIDTH = WIDTH // 4
 SHELF_HEIGHT = HEIGHT // 50
 SHELF_SPAWN_PROBABILITY = 0.004  # Вероятность появления полочки за кадр
-MAX_SHELVES = 10
+MAX_SHELVES = int(os.environ.get('CATCHBALL_MAX_SHELVES', '10'))
 # Цвет полочек можно изменить или использовать прозрачность, если будет изображение
 SHELF_COLOR = MAROON 
+SHELF_LAYER_ENABLED = True  # Полочки рисуются одним кэшированным слоем
+SHELF_TEXTURED = True  # Текстура доски (BOARD_IMAGE_PATH) вместо заливки
 
 # Настройки игры
 INITIAL_LIVES = 3
-MAX_BALLS = 3
+MAX_BALLS = int(os.environ.get('CATCHBALL_MAX_BALLS', '3'))
 BALL_CREATION_DELAY = 30  # Задержка перед созданием нового шара
 FPS = 60
 
+# Статичные экраны (меню, пауза, конец игры): ожидание ввода вместо отрисовки каждого кадра
+IDLE_RENDER_ENABLED = True
+IDLE_FPS = 30  # Предел частоты перерисовки при непрерывном вводе
+IDLE_WAIT_TIMEOUT_MS = 100  # Не дольше шага музыки, чтобы её поток не прерывался
+
 # Настройки сложности
 DIFFICULTY_SETTINGS = {
     1: {  # Легкий
-        'ball_speed': HEIGHT // 150,
+        'ball_speed': DISPLAY_HEIGHT // 150 * RENDER_SCALE,
         'basket_width': WIDTH // 4,
         'shelf_spawn_prob': 0.002,
+        'input_min_cutoff': 0.8,  # Медленная игра: сильнее гасим дрожание
+        'input_beta': 0.005,
+        'input_lead_scale': 0.7,
         'name': 'Легкий'
     },
     2: {  # Средний
-        'ball_speed': HEIGHT // 125,
+        'ball_speed': DISPLAY_HEIGHT // 125 * RENDER_SCALE,
         'basket_width': WIDTH // 6,
         'shelf_spawn_prob': 0.004,
+        'input_min_cutoff': 1.0,
+        'input_beta': 0.01,
+        'input_lead_scale': 1.0,
         'name': 'Средний'
     },
     3: {  # Сложный
-        'ball_speed': HEIGHT // 100,
+        'ball_speed': DISPLAY_HEIGHT // 100 * RENDER_SCALE,
         'basket_width': WIDTH // 8,
         'shelf_spawn_prob': 0.006,
+        'input_min_cutoff': 1.5,  # Быстрая игра: меньше запаздывания, полный вынос
+        'input_beta': 0.02,
+        'input_lead_scale': 1.0,
         'name': 'Сложный'
     }
 }
@@ -92,14 +184,14 @@ DIFFICULTY_INCREASE_FACTOR = 1.1  # Множитель увеличения ск
 FONT_SIZE = WIDTH // 25
 EXIT_BUTTON_WIDTH = WIDTH // 10
 EXIT_BUTTON_HEIGHT = HEIGHT // 30
-EXIT_BUTTON_X = 35
-EXIT_BUTTON_Y = 70
+EXIT_BUTTON_X = _px(35)
+EXIT_BUTTON_Y = _px(70)
 EXIT_BUTTON_COLOR = LIGHT_GRAY
 EXIT_BUTTON_TEXT_COLOR = BLACK
 
 PAUSE_BUTTON_SIZE = EXIT_BUTTON_HEIGHT
-PAUSE_BUTTON_X = WIDTH - PAUSE_BUTTON_SIZE - 30
-PAUSE_BUTTON_Y = 70
+PAUSE_BUTTON_X = WIDTH - PAUSE_BUTTON_SIZE - _px(30)
+PAUSE_BUTTON_Y = EXIT_BUTTON_Y
 
 # Кнопка переключения звука
 SOUND_TOGGLE_BUTTON_WIDTH = WIDTH // 10
@@ -121,10 +213,21 @@ CONFIRM_BUTTON_WIDTH = DIFFICULTY_BUTTON_WIDTH // 2
 CONFIRM_BUTTON_HEIGHT = DIFFICULTY_BUTTON_HEIGHT
 CONFIRM_BUTTON_SPACING = WIDTH // 20
 
+# Отступы HUD (счёт, индикатор сложности, прогресс до следующего уровня)
+HUD_MARGIN = _px(20)  # От краёв экрана
+HUD_INFO_OFFSET = _px(10)  # Строка счёта - под кнопкой выхода
+HUD_MULTIPLIER_OFFSET = _px(50)
+HUD_PROGRESS_OFFSET = _px(75)
+HUD_PROGRESS_WIDTH = _px(200)
+HUD_PROGRESS_HEIGHT = _px(8)
+HUD_PROGRESS_TEXT_GAP = _px(5)
+HUD_LEVEL_UP_BAND_HEIGHT = _px(100)  # Полоса уведомления о повышении сложности
+LEVEL_UP_BURST_RADIUS = _px(100)  # Радиус кольца взрывов при повышении сложности
+
 # Настройки фона
 NUM_BACKGROUND_SQUARES = 30
-SQUARE_MIN_SIZE = 15
-SQUARE_MAX_SIZE = 40
+SQUARE_MIN_SIZE = _px(15)
+SQUARE_MAX_SIZE = _px(40)
 SQUARE_ALPHA = 80
 
 # Угол наклона стенок корзины
@@ -138,9 +241,107 @@ SOUND_MISS = None  # 'sounds/miss.wav'
 SOUND_BOUNCE = None  # 'sounds/bounce.wav'
 SOUND_MUSIC = None  # 'sounds/music.mp3'
 
+# Кэш синтезированных звуков (PCM-буферы на диске, ключ - хэш параметров)
+SOUND_CACHE_ENABLED = True
+SOUND_CACHE_DIR = 'cache/sounds'
+
+# Пулы зарезервированных каналов микшера по категориям эффектов
+SOUND_VOICE_CATEGORIES = {
+    'ui': 1,
+    'gameplay': 4,
+    'events': 2,
+    'music': 1,
+}
+# Ограничения эффектов: категория, полифония, кулдаун (мс), приоритет вытеснения
+SOUND_EFFECT_SETTINGS = {
+    'catch': {'category': 'gameplay', 'max_voices': 2, 'cooldown_ms': 40, 'priority': 2},
+    'miss': {'category': 'gameplay', 'max_voices': 1, 'cooldown_ms': 100, 'priority': 3},
+    'bounce': {'category': 'gameplay', 'max_voices': 2, 'cooldown_ms': 30, 'priority': 1},
+    'levelup': {'category': 'events', 'max_voices': 1, 'cooldown_ms': 500, 'priority': 4},
+    'confirm': {'category': 'ui', 'max_voices': 1, 'cooldown_ms': 50, 'priority': 2},
+    'gameover': {'category': 'events', 'max_voices': 1, 'cooldown_ms': 1000, 'priority': 5},
+}
+
+# Процедурная музыка (используется, если SOUND_MUSIC не задан). По умолчанию
+# игра без музыки; включение - CATCHBALL_MUSIC=1
+MUSIC_ENABLED = os.environ.get('CATCHBALL_MUSIC') == '1'
+MUSIC_BASE_TEMPO = 110  # Удары в минуту при множителе сложности 1.0
+MUSIC_MAX_TEMPO_SCALE = 1.6
+MUSIC_LOOKAHEAD_CHUNKS = 3  # Сколько фрагментов синтезируется заранее
+MUSIC_VOLUME = 0.08
+# Паттерны по восьмым долям (None - пауза); бас звучит по четвертям
+MUSIC_MELODY = [523.25, None, 659.25, 783.99, 659.25, None, 587.33, 523.25,
+                440.00, None, 523.25, 587.33, 659.25, 587.33, 523.25, None]
+MUSIC_BASS = [130.81, 130.81, 110.00, 110.00, 87.31, 87.31, 98.00, 98.00]
+
+# Пулы объектов: сколько освобождённых объектов хранить для повторного использования
+POOL_MAX_BALLS = 32
+POOL_MAX_SHELVES = 32
+POOL_MAX_PARTICLES = 1000
+
+# Замер времени кадров
+FRAME_TIMING_WINDOW = 120  # Окно статистики (кадры)
+
+# Учёт выделений памяти за кадр
+ALLOC_TRACKING_WINDOW = 120  # Окно усреднения (кадры)
+ALLOC_REPORT_INTERVAL = 600  # Печать отчёта раз в столько кадров
+# Бюджеты выделений за кадр (alloc_tracker.py): выживших блоков и пикового прироста
+# памяти внутри вызова (временные объекты). Замер на партии с зерном 1: update -
+# ~9 блоков и ~400 байт пика, draw - ~4.5 блоков и ~1800 байт пика
+ALLOC_BUDGET_UPDATE = 12  # Бюджет новых блоков за GameState.update
+ALLOC_BUDGET_DRAW = 6  # Бюджет новых блоков за Game.draw
+ALLOC_PEAK_BUDGET_UPDATE = 1024  # Бюджет пика (байт) за GameState.update
+ALLOC_PEAK_BUDGET_DRAW = 3072  # Бюджет пика (байт) за Game.draw
+# Движение корзины: ни одного выжившего блока, временные int координат - в пределах пика
+ALLOC_PEAK_BUDGET_BASKET = 256  # Бюджет пика (байт) за вызов метода корзины
+
+# Телеметрия партий: CATCHBALL_TELEMETRY=0 выключает её, CATCHBALL_TELEMETRY_DB - другой файл базы.
+# Стенды (alloc_tracker, gc_control, latency, scenario_runner) выключают её сами
+TELEMETRY_ENABLED = os.environ.get('CATCHBALL_TELEMETRY', '1') != '0'
+# Своя база: PRAGMA synchronous = OFF при сбое может испортить весь файл, рекорды - не трогаем
+TELEMETRY_DB_PATH = os.environ.get('CATCHBALL_TELEMETRY_DB', 'telemetry.db')
+TELEMETRY_SAMPLE_INTERVAL = 1.0  # Замер производительности раз в секунду
+TELEMETRY_FLUSH_INTERVAL = 10.0  # Сброс буфера в базу раз в 10 секунд
+TELEMETRY_MAX_BUFFER = 500  # ...или при накоплении стольких записей
+
+# Управление сборщиком мусора (режим GC_MODE)
+GC_PAUSE_WINDOW = 600  # Сколько последних пауз хранить для отчёта
+GC_SPARE_RATIO = 0.5  # Собирать во время игры, если кадр занял меньше половины бюджета
+GC_FORCE_FACTOR = 10  # Принудительная сборка, если счётчик превысил порог в 10 раз
+
+# Адаптивное качество графики (от низкого к высокому)
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_LEVELS = [
+    {'name': 'low', 'particle_scale': 0.3, 'max_particles': 80,
+     'background_squares': 0, 'alpha_overlays': False},
+    {'name': 'medium', 'particle_scale': 0.6, 'max_particles': 200,
+     'background_squares': 15, 'alpha_overlays': True},
+    {'name': 'high', 'particle_scale': 1.0, 'max_particles': 600,
+     'background_squares': NUM_BACKGROUND_SQUARES, 'alpha_overlays': True},
+]
+QUALITY_DEFAULT_LEVEL = 2
+QUALITY_SMOOTHING = 0.1  # Коэффициент сглаживания времени кадра
+QUALITY_DOWNGRADE_RATIO = 0.9  # Снижать качество, если кадр дольше 90% бюджета
+QUALITY_UPGRADE_RATIO = 0.5  # Повышать, если кадр короче 50% бюджета
+QUALITY_DOWNGRADE_FRAMES = 30
+QUALITY_UPGRADE_FRAMES = 300
+QUALITY_COOLDOWN_FRAMES = 120  # Пауза после смены уровня
+QUALITY_TRANSITION_HISTORY = 64  # Сколько последних смен уровня хранить
+
+# Попиксельные столкновения шара с корзиной (маски); False - только прямоугольники
+PIXEL_PERFECT_COLLISION = True
+MASK_ALPHA_THRESHOLD = 127  # Пиксель считается непрозрачным при альфе выше порога
+
 # Настройки частиц
 PARTICLES_ENABLED = True
 PARTICLE_COUNT = 25  # Увеличено для более заметного эффекта
 PARTICLE_LIFETIME = 40  # Увеличено время жизни
-PARTICLE_SIZE_MIN = 3
-PARTICLE_SIZE_MAX = 8
+PARTICLE_SIZE_MIN = _px(3)
+PARTICLE_SIZE_MAX = _px(8)
+PARTICLE_GRAVITY = 0.2 * RENDER_SCALE  # Пикселей за тик за тик
+
+# Текстурный атлас (спрайты, статичные надписи UI, частицы)
+ATLAS_ENABLED = True
+ATLAS_MAX_WIDTH = 1024  # Ширина атласа (пиксели)
+PARTICLE_ALPHA_LEVELS = 8  # Уровней прозрачности заранее нарисованных частиц
+PARTICLE_ATLAS_COLORS = [YELLOW, GREEN, RED, ORANGE]
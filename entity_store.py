@@ -0,0 +1,85 @@
+"""
+Модуль для плотного хранения игровых сущностей
+"""
+
+
+class EntityStore:
+    """
+    Плотное хранилище сущностей со стабильными дескрипторами.
+
+    Сущности лежат подряд в списке items, поэтому пакетные функции обходят
+    их одним циклом. Удаление - перестановкой последнего элемента на место
+    удаляемого (O(1)); дескриптор сущности (атрибут handle) при этом
+    не меняется. Порядок элементов после удаления не сохраняется.
+    Счётчик version растёт при каждом изменении состава - по нему
+    кэши, построенные из содержимого хранилища, узнают, что устарели.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.version = 0
+        self._slots = []  # Дескриптор -> индекс в items (-1, если свободен)
+        self._free_handles = []
+
+    def add(self, entity) -> int:
+        """Добавить сущность; возвращает её дескриптор"""
+        if self._free_handles:
+            handle = self._free_handles.pop()
+            self._slots[handle] = len(self.items)
+        else:
+            handle = len(self._slots)
+            self._slots.append(len(self.items))
+        entity.handle = handle
+        self.items.append(entity)
+        self.version += 1
+        return handle
+
+    def remove(self, entity) -> bool:
+        """Удалить сущность (swap-remove). Возвращает False, если её нет в хранилище"""
+        if not self.contains(entity):
+            return False
+        handle = entity.handle
+        slot = self._slots[handle]
+        last = self.items[-1]
+        self.items[slot] = last
+        self._slots[last.handle] = slot
+        self.items.pop()
+
+        self._slots[handle] = -1
+        self._free_handles.append(handle)
+        entity.handle = -1
+        self.version += 1
+        return True
+
+    def contains(self, entity) -> bool:
+        """Проверка принадлежности сущности хранилищу за O(1)"""
+        handle = entity.handle
+        if handle < 0 or handle >= len(self._slots):
+            return False
+        slot = self._slots[handle]
+        return slot >= 0 and self.items[slot] is entity
+
+    def get(self, handle: int):
+        """Сущность по дескриптору или None"""
+        if handle < 0 or handle >= len(self._slots):
+            return None
+        slot = self._slots[handle]
+        return self.items[slot] if slot >= 0 else None
+
+    def clear(self):
+        """Удалить все сущности"""
+        for entity in self.items:
+            entity.handle = -1
+        self.items.clear()
+        self._slots.clear()
+        self._free_handles.clear()
+        self.version += 1
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index: int):
+        return self.items[index]
@@ -0,0 +1,125 @@
+"""
+Модуль для измерения времени кадров
+"""
+import time
+from collections import deque
+import config
+
+
+class FrameTimer:
+    """
+    Замер времени работы кадра (без ожидания в clock.tick) по скользящему окну.
+
+    Отдельно запоминается время работы до вывода кадра (last_work_ms): с
+    vsync display.flip блокируется до обратного хода луча, и полное время
+    кадра тогда показывает частоту экрана, а не нагрузку.
+    """
+
+    def __init__(self, window: int = None):
+        self.samples = deque(maxlen=window if window is not None else config.FRAME_TIMING_WINDOW)
+        self.frame_index = 0
+        self.last_frame_ms = 0.0
+        self.last_work_ms = 0.0  # Время кадра до display.flip
+        self._frame_start = None
+        self._work_ms = None
+        # Паузы сборщика мусора: (номер кадра, поколение, длительность в мс)
+        self.gc_events = deque(maxlen=self.samples.maxlen)
+        self.frame_gc_ms = 0.0  # Суммарная пауза GC в текущем кадре
+        self.last_frame_gc_ms = 0.0
+
+    @property
+    def budget_ms(self) -> float:
+        """Бюджет времени на кадр при целевом FPS"""
+        return 1000.0 / config.FPS
+
+    def begin_frame(self):
+        """Начало замера кадра"""
+        self._frame_start = time.perf_counter()
+
+    def mark_work_end(self):
+        """Работа кадра закончена, дальше - вывод на экран (display.flip)"""
+        if self._frame_start is not None:
+            self._work_ms = (time.perf_counter() - self._frame_start) * 1000.0
+
+    def end_frame(self) -> float:
+        """Конец замера кадра; возвращает длительность в миллисекундах"""
+        if self._frame_start is None:
+            return 0.0
+        self.last_frame_ms = (time.perf_counter() - self._frame_start) * 1000.0
+        self.last_work_ms = self._work_ms if self._work_ms is not None else self.last_frame_ms
+        self._frame_start = None
+        self._work_ms = None
+        self.samples.append(self.last_frame_ms)
+        self.last_frame_gc_ms = self.frame_gc_ms
+        self.frame_gc_ms = 0.0
+        self.frame_index += 1
+        return self.last_frame_ms
+
+    def record_gc(self, generation: int, duration_ms: float):
+        """Учёт паузы сборщика мусора в текущем кадре"""
+        self.gc_events.append((self.frame_index, generation, duration_ms))
+        self.frame_gc_ms += duration_ms
+
+    def average_ms(self) -> float:
+        """Среднее время кадра по окну"""
+        if not self.samples:
+            return 0.0
+        return sum(self.samples) / len(self.samples)
+
+    def percentile_ms(self, percent: float) -> float:
+        """Перцентиль времени кадра по окну (percent от 0 до 100)"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100.0))
+        return ordered[index]
+
+    def max_ms(self) -> float:
+        """Худшее время кадра по окну"""
+        return max(self.samples) if self.samples else 0.0
+
+
+class LoadProfile:
+    """
+    Время кадров (тиков) в разрезе множителя сложности (или другого ключа,
+    например числа объектов) вместе со средним числом объектов - чтобы
+    видеть, как дорожает кадр по ходу партии
+    """
+
+    def __init__(self, key=None, label: str = 'Множитель'):
+        """
+        :param key: Функция game_state -> ключ строки таблицы
+            (по умолчанию множитель сложности).
+        :param label: Заголовок столбца ключа.
+        """
+        self.key = key
+        self.label = label
+        # Ключ -> [кадров, сумма мс, худший мс, сумма шаров, сумма полочек, сумма частиц]
+        self.rows = {}
+
+    def add(self, game_state, frame_ms: float):
+        """Учёт кадра"""
+        key = self.key(game_state) if self.key is not None else game_state.difficulty_multiplier
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = [0, 0.0, 0.0, 0, 0, 0]
+        row[0] += 1
+        row[1] += frame_ms
+        if frame_ms > row[2]:
+            row[2] = frame_ms
+        row[3] += len(game_state.balls)
+        row[4] += len(game_state.shelves)
+        row[5] += len(game_state.particle_system.particles)
+
+    def get_report(self) -> str:
+        """Таблица по значениям ключа"""
+        lines = [f"{self.label:>10}{'кадров':>9}{'мс':>9}{'худший':>9}"
+                 f"{'шаров':>8}{'полочек':>9}{'частиц':>8}"]
+        for key in sorted(self.rows):
+            count, total_ms, worst_ms, balls, shelves, particles = self.rows[key]
+            key_text = f"{key:.1f}" if isinstance(key, float) else str(key)
+            lines.append(
+                f"{key_text:>10}{count:>9}{total_ms / count:>9.3f}{worst_ms:>9.3f}"
+                f"{balls / count:>8.1f}{shelves / count:>9.1f}{particles / count:>8.0f}"
+            )
+        return '\n'.join(lines)
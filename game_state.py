@@ -4,10 +4,12 @@
 import random
 import math
 import config
-from ball import Ball
+from ball import Ball, update_balls_motion
 from basket import StickBasket
 from shelf import Shelf
 from particles import ParticleSystem
+from pools import ObjectPool
+from entity_store import EntityStore
 
 
 class GameState:
@@ -26,10 +28,16 @@ class GameState:
         
         # Игровые объекты
         self.basket = None
-        self.balls = []
-        self.shelves = []
+        self.balls = EntityStore()
+        self.shelves = EntityStore()
+        self._hit_shelves = []  # Полочки, задетые за текущий тик, в порядке попаданий
         self.particle_system = ParticleSystem()
         self.sound_manager = None  # Будет установлен извне
+        self.telemetry = None  # Будет установлен извне
+        
+        # Пулы объектов, чтобы не выделять память во время игры
+        self.ball_pool = ObjectPool(Ball, config.POOL_MAX_BALLS, 'balls')
+        self.shelf_pool = ObjectPool(Shelf, config.POOL_MAX_SHELVES, 'shelves')
         
         # Таймеры
         self.ball_creation_timer = 0
@@ -64,8 +72,11 @@ class GameState:
         settings = config.DIFFICULTY_SETTINGS[self.current_difficulty]
         
         self.basket = StickBasket(width=settings['basket_width'])
-        self.balls = [Ball(speed=self.current_ball_speed)]
-        self.shelves = []
+        self.ball_pool.release_all(self.balls)
+        self.shelf_pool.release_all(self.shelves)
+        self.balls.clear()
+        self.shelves.clear()
+        self.balls.add(self.ball_pool.acquire(self.current_ball_speed))
         self.particle_system.clear()
         
         self.score = 0
@@ -77,6 +88,10 @@ class GameState:
         self.base_ball_speed = settings['ball_speed']
         self.current_ball_speed = self.base_ball_speed
         self.difficulty_multiplier = 1.0
+        if self.sound_manager:
+            self.sound_manager.set_music_tempo(self.difficulty_multiplier)
+        if self.telemetry:
+            self.telemetry.start_session(self.current_difficulty)
     
     def update_difficulty_progression(self):
         """Обновление прогрессии сложности на основе счета"""
@@ -93,8 +108,8 @@ class GameState:
                 # Большой взрыв частиц в центре экрана
                 for i in range(8):
                     angle = (i / 8) * 2 * math.pi
-                    x = config.WIDTH // 2 + math.cos(angle) * 100
-                    y = config.HEIGHT // 2 + math.sin(angle) * 100
+                    x = config.WIDTH // 2 + math.cos(angle) * config.LEVEL_UP_BURST_RADIUS
+                    y = config.HEIGHT // 2 + math.sin(angle) * config.LEVEL_UP_BURST_RADIUS
                     self.particle_system.add_explosion(
                         x, y,
                         count=15,
@@ -105,11 +120,16 @@ class GameState:
                 # Звук повышения сложности
                 if self.sound_manager:
                     self.sound_manager.play_sound('levelup')
+                if self.telemetry:
+                    self.telemetry.record_event('level_up', new_multiplier)
+            # Темп музыки следует за сложностью
+            if self.sound_manager:
+                self.sound_manager.set_music_tempo(self.difficulty_multiplier)
     
     def create_new_ball(self):
         """Создание нового шара"""
         if len(self.balls) < config.MAX_BALLS:
-            self.balls.append(Ball(speed=self.current_ball_speed))
+            self.balls.add(self.ball_pool.acquire(self.current_ball_speed))
             self.ball_creation_timer = config.BALL_CREATION_DELAY
     
     def create_shelf(self):
@@ -119,15 +139,21 @@ class GameState:
         
         if (random.random() < spawn_prob and 
             len(self.shelves) < config.MAX_SHELVES):
-            self.shelves.append(Shelf())
+            self.shelves.add(self.shelf_pool.acquire())
     
     def update_balls(self):
         """Обновление всех шаров"""
-        shelves_to_remove = []
+        balls = self.balls.items
+        hit_shelves = self._hit_shelves
+        
+        # Движение и отскоки от стен - одним пакетом
+        update_balls_motion(balls)
         
-        for ball in self.balls[:]:
-            ball.fall()
-            ball.handle_collisions_with_shelves(self.shelves, shelves_to_remove)
+        # Обход с конца: при swap-remove на место удалённого шара
+        # встаёт уже обработанный шар из хвоста
+        for i in range(len(balls) - 1, -1, -1):
+            ball = balls[i]
+            ball.handle_collisions_with_shelves(self.shelves.items, hit_shelves)
             
             # Проверка столкновения с корзиной
             if ball.check_collision_with_basket(self.basket):
@@ -142,12 +168,14 @@ class GameState:
                 # Звук поимки
                 if self.sound_manager:
                     self.sound_manager.play_sound('catch')
+                if self.telemetry:
+                    self.telemetry.record_event('catch', self.score)
                 self.update_difficulty_progression()
             
             # Удаление неактивных шаров
+            removed = False
             if not ball.active:
-                if ball in self.balls:
-                    self.balls.remove(ball)
+                removed = True
                 self.ball_creation_timer = config.BALL_CREATION_DELAY
             
             # Проверка потери жизни
@@ -162,17 +190,34 @@ class GameState:
                 # Звук промаха
                 if self.sound_manager:
                     self.sound_manager.play_sound('miss')
-                if ball in self.balls:
-                    self.balls.remove(ball)
+                if self.telemetry:
+                    self.telemetry.record_event('miss', self.lives)
+                removed = True
                 self.ball_creation_timer = config.BALL_CREATION_DELAY
                 
                 if self.lives <= 0:
                     self.game_over = True
+                    if self.telemetry:
+                        self.telemetry.record_event('game_over', self.score)
+                        self.telemetry.end_session(self.score)
+            
+            if removed and self.balls.remove(ball):
+                self.ball_pool.release(ball)
         
         # Удаление полочек
-        for shelf in shelves_to_remove:
-            if shelf in self.shelves:
-                self.shelves.remove(shelf)
+        if hit_shelves:
+            for shelf in hit_shelves:
+                if self.shelves.remove(shelf):
+                    self.shelf_pool.release(shelf)
+            hit_shelves.clear()
+    
+    def get_pool_stats(self) -> list:
+        """Статистика пулов объектов"""
+        return [
+            self.ball_pool.get_stats(),
+            self.shelf_pool.get_stats(),
+            self.particle_system.pool.get_stats(),
+        ]
     
     def update_timers(self):
         """Обновление таймеров"""
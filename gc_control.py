@@ -0,0 +1,223 @@
+"""
+Модуль для управления сборщиком мусора и замера его пауз
+
+Запуск как скрипта сравнивает паузы GC без управления и с управлением:
+    python gc_control.py [число_кадров] [мусорных_объектов_за_кадр]
+"""
+import gc
+import sys
+import time
+from collections import deque
+import config
+
+
+GC_MODES = ('auto', 'managed')
+
+
+class GCController:
+    """
+    Управление циклическим сборщиком мусора вокруг игрового цикла.
+
+    Режим 'auto' оставляет сборщик CPython как есть и только замеряет
+    паузы. В режиме 'managed' автоматическая сборка выключена: объекты,
+    созданные при запуске, замораживаются (gc.freeze), а сборки нужных
+    поколений запускаются в меню и на паузе или в кадрах с запасом
+    времени. Если мусора накопилось слишком много, сборка выполняется
+    принудительно. Каждая сборка через gc.callbacks записывается с
+    поколением и длительностью в данные FrameTimer.
+    """
+
+    def __init__(self, frame_timer=None, mode: str = None):
+        self.frame_timer = frame_timer
+        self.mode = mode if mode is not None else config.GC_MODE
+        if self.mode not in GC_MODES:
+            print(f"Неизвестный режим GC '{self.mode}', используется auto")
+            self.mode = 'auto'
+
+        self.pauses = deque(maxlen=config.GC_PAUSE_WINDOW)  # (поколение, мс)
+        self.collections = [0, 0, 0]
+        self.worst_pause_ms = 0.0
+        self.worst_pause_generation = None
+        self.scheduled_collections = 0  # Сборки в меню или в кадрах с запасом
+        self.forced_collections = 0  # Сборки из-за превышения лимита
+        self.frozen_objects = 0
+
+        self._thresholds = gc.get_threshold()
+        self._collection_start = None
+        self._installed = False
+        self._was_enabled = gc.isenabled()
+
+    def install(self):
+        """Подключение замера пауз и (в режиме managed) отключение автосборки"""
+        if self._installed:
+            return
+        gc.callbacks.append(self._on_gc)
+        self._was_enabled = gc.isenabled()
+        if self.mode == 'managed':
+            gc.disable()
+        self._installed = True
+
+    def uninstall(self):
+        """Возврат сборщика в исходное состояние"""
+        if not self._installed:
+            return
+        gc.callbacks.remove(self._on_gc)
+        if self.mode == 'managed':
+            gc.unfreeze()
+            if self._was_enabled:
+                gc.enable()
+        self._installed = False
+
+    def freeze(self):
+        """
+        Заморозка объектов, созданных при запуске и загрузке ресурсов:
+        сборщик больше не обходит их при каждой сборке
+        """
+        if self.mode != 'managed':
+            return
+        gc.collect()
+        gc.freeze()
+        self.frozen_objects = gc.get_freeze_count()
+
+    def _on_gc(self, phase: str, info: dict):
+        """Обработчик gc.callbacks"""
+        if phase == 'start':
+            self._collection_start = time.perf_counter()
+            return
+        if self._collection_start is None:
+            return
+        duration_ms = (time.perf_counter() - self._collection_start) * 1000.0
+        self._collection_start = None
+        generation = info['generation']
+
+        self.collections[generation] += 1
+        self.pauses.append((generation, duration_ms))
+        if duration_ms > self.worst_pause_ms:
+            self.worst_pause_ms = duration_ms
+            self.worst_pause_generation = generation
+        if self.frame_timer is not None:
+            self.frame_timer.record_gc(generation, duration_ms)
+
+    def _due_generation(self, scale: float = 1.0) -> int:
+        """Старшее поколение, счётчик которого превысил порог (умноженный на scale), или -1"""
+        counts = gc.get_count()
+        for generation in (2, 1, 0):
+            threshold = self._thresholds[generation]
+            if threshold and counts[generation] >= threshold * scale:
+                return generation
+        return -1
+
+    def on_frame_end(self, frame_ms: float, idle: bool):
+        """
+        Решение о сборке после кадра (вызывается раз в кадр).
+
+        :param frame_ms: Время работы кадра до display.flip (FrameTimer.last_work_ms):
+            полное время кадра с vsync включает ожидание экрана, и запаса
+            на сборку по нему никогда не оставалось бы.
+        :param idle: Статичный экран (меню, пауза) - можно собрать всё.
+        """
+        if self.mode != 'managed':
+            return
+
+        forced = self._due_generation(config.GC_FORCE_FACTOR)
+        if forced >= 0:
+            self.forced_collections += 1
+            gc.collect(forced)
+            return
+
+        generation = self._due_generation()
+        if generation < 0:
+            return
+        if idle:
+            self.scheduled_collections += 1
+            gc.collect(generation)
+            return
+
+        # Во время игры - только молодые поколения и только при запасе времени
+        budget_ms = 1000.0 / config.FPS
+        if budget_ms - frame_ms >= budget_ms * config.GC_SPARE_RATIO:
+            self.scheduled_collections += 1
+            gc.collect(min(generation, 1))
+
+    def get_telemetry(self) -> dict:
+        """Статистика сборок для отладки"""
+        return {
+            'mode': self.mode,
+            'collections': list(self.collections),
+            'worst_pause_ms': self.worst_pause_ms,
+            'worst_pause_generation': self.worst_pause_generation,
+            'scheduled': self.scheduled_collections,
+            'forced': self.forced_collections,
+            'frozen_objects': self.frozen_objects,
+        }
+
+    def get_report(self) -> str:
+        """Текстовый отчёт о паузах"""
+        telemetry = self.get_telemetry()
+        durations = sorted(duration for _, duration in self.pauses)
+        p99 = durations[min(len(durations) - 1, int(len(durations) * 0.99))] if durations else 0.0
+        return (
+            f"GC ({telemetry['mode']}): сборок по поколениям {telemetry['collections']}, "
+            f"худшая пауза {telemetry['worst_pause_ms']:.2f} мс "
+            f"(поколение {telemetry['worst_pause_generation']}), p99 {p99:.2f} мс, "
+            f"плановых {telemetry['scheduled']}, принудительных {telemetry['forced']}, "
+            f"заморожено объектов {telemetry['frozen_objects']}"
+        )
+
+
+class _Node:
+    """Узел циклического мусора для нагрузочного прогона"""
+
+    def __init__(self):
+        self.link = self
+
+
+def compare_modes(frames: int = 1800, garbage_per_frame: int = 0):
+    """
+    Прогон одной и той же партии без управления GC и с ним.
+
+    :param garbage_per_frame: Сколько объектов с циклическими ссылками
+        создавать за кадр, имитируя игровой цикл с высоким темпом выделений.
+    """
+    import random
+    import pygame
+    import main
+
+    config.TELEMETRY_ENABLED = False  # Синтетические партии не пишутся в базу игрока
+    rows = []
+    for mode in GC_MODES:
+        config.GC_MODE = mode
+        random.seed(1)
+        game = main.Game()
+        game.game_state.set_difficulty(2)
+        game.game_state.show_difficulty_screen = False
+        game.game_state.restart_game()
+        for _ in range(frames):
+            game.frame_timer.begin_frame()
+            pygame.event.post(pygame.event.Event(
+                pygame.MOUSEMOTION, pos=(random.randint(0, config.WIDTH), config.HEIGHT // 2),
+                rel=(0, 0), buttons=(0, 0, 0)))
+            game.handle_events()
+            game.update()
+            game.draw()
+            for _ in range(garbage_per_frame):
+                _Node()
+            game.frame_timer.end_frame()
+            game.gc_control.on_frame_end(game.frame_timer.last_work_ms, game.is_idle())
+            if game.game_state.game_over:
+                game.game_state.restart_game()
+        control = game.gc_control
+        rows.append((mode, control.collections, control.worst_pause_ms, game.frame_timer.max_ms()))
+        print(control.get_report())
+        control.uninstall()
+        pygame.quit()
+
+    print(f"{'Режим':<10}{'сборки (0/1/2)':>18}{'худшая пауза, мс':>20}{'худший кадр, мс':>18}")
+    for mode, collections, worst_pause, worst_frame in rows:
+        counts = '/'.join(str(count) for count in collections)
+        print(f"{mode:<10}{counts:>18}{worst_pause:>20.2f}{worst_frame:>18.2f}")
+
+
+if __name__ == "__main__":
+    compare_modes(int(sys.argv[1]) if len(sys.argv) > 1 else 1800,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 0)
@@ -0,0 +1,211 @@
+"""
+Модуль для обработки ввода движения корзины
+"""
+import math
+import time
+from collections import deque
+import pygame
+import config
+from latency import LatencyTracker
+from render_scale import to_render_pos
+
+
+class OneEuroFilter:
+    """
+    Фильтр One-Euro для координаты пальца.
+
+    Сглаживание адаптивное: на медленном движении частота среза низкая
+    (дрожание подавляется), на быстром растёт пропорционально скорости
+    (beta), чтобы фильтр не запаздывал. Заодно даёт сглаженную скорость
+    для экстраполяции.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.0, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        """Сброс состояния"""
+        self.x = None  # Отфильтрованная координата
+        self.raw_x = None  # Последний отсчёт без фильтрации
+        self.velocity = 0.0  # Отфильтрованная скорость (пикселей в секунду)
+        self.lag_ms = 0.0  # Отставание координаты от пальца при равномерном движении
+        self.last_stamp = None  # Время последнего отсчёта (мс)
+
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def add(self, x: float, stamp: float) -> float:
+        """Новый отсчёт x в момент stamp (мс); возвращает отфильтрованную координату"""
+        if self.x is None:
+            self.x = x
+            self.raw_x = x
+            self.last_stamp = stamp
+            return x
+        dt = (stamp - self.last_stamp) / 1000.0
+        if dt <= 0:
+            # Отсчёт в тот же момент ничего не говорит о скорости: деление на
+            # почти нулевой dt завысило бы её во столько раз, сколько отсчётов пришло
+            return self.x
+        self.last_stamp = stamp
+
+        # Скорость - по сырым отсчётам: разность с отфильтрованной координатой
+        # включала бы её отставание и завышала скорость в 1 / alpha раз
+        raw_velocity = (x - self.raw_x) / dt
+        self.raw_x = x
+        alpha = self._alpha(self.d_cutoff, dt)
+        self.velocity += alpha * (raw_velocity - self.velocity)
+        cutoff = self.min_cutoff + self.beta * abs(self.velocity)
+        alpha = self._alpha(cutoff, dt)
+        self.x += alpha * (x - self.x)
+        # Экспоненциальное сглаживание отстаёт на (1 - alpha) / alpha шагов
+        self.lag_ms = dt * 1000.0 * (1.0 - alpha) / alpha
+        return self.x
+
+
+class InputController:
+    """
+    Слой ввода для управления корзиной.
+
+    События движения (мышь, касания) за кадр сводятся к последней позиции,
+    а корзина двигается ровно один раз за тик симуляции в apply(). Так
+    плавность BASKET_MOVE_SMOOTHNESS зависит от времени, а не от частоты событий.
+    Счётчики схлопывания (get_coalescing_stats, выводятся в отчёте
+    LatencyTracker) - не задержка ввода: события выбираются из очереди в
+    том же кадре, где применяются, и метки времени SDL pygame не отдаёт.
+    Задержку до экрана измеряет LatencyTracker.
+
+    В режиме предсказания (INPUT_PREDICTION) позиция пальца раз за тик
+    (последняя из схлопнутых, с временем тика по clock) проходит через
+    фильтр One-Euro: метки событий в pygame - момент выборки из очереди,
+    у всех событий кадра они одинаковы и скорость по ним не посчитать.
+    Цель корзины выносится вперёд по скорости фильтра на
+    задержку конвейера: отклик "выборка -> кадр на экране", измеренный
+    LatencyTracker (до первого замера - INPUT_PRESENT_DELAY_MS),
+    отставание самого фильтра и отставание от сглаживания корзины.
+    Параметры фильтра и доля выноса задаются для каждого уровня сложности.
+    """
+
+    def __init__(self, clock=None):
+        """
+        :param clock: Источник времени в секундах для фильтра предсказания
+            (по умолчанию time.perf_counter).
+        """
+        self.clock = clock if clock is not None else time.perf_counter
+        self.target_x = None
+        self.pending_x = None
+        self.pending_since = None  # Время самого раннего необработанного события (мс)
+
+        # Схлопывание: сколько событий пришло, сколько поглощено следующими и
+        # сколько самое раннее из них ждало применения (мс, в пределах кадра)
+        self.coalesce_delay_samples = deque(maxlen=config.INPUT_COALESCE_WINDOW)
+        self.events_received = 0
+        self.events_coalesced = 0
+        self.latency = None  # LatencyTracker, будет установлен извне
+
+        # Предсказание движения пальца
+        self.prediction_enabled = config.INPUT_PREDICTION
+        self.lead_scale = 1.0
+        self.filter = OneEuroFilter(d_cutoff=config.INPUT_D_CUTOFF)
+        self.set_difficulty(config.DIFFICULTY_SETTINGS[2])
+
+    def set_difficulty(self, settings: dict):
+        """Настройки предсказания для уровня сложности (из DIFFICULTY_SETTINGS)"""
+        self.filter.min_cutoff = settings.get('input_min_cutoff', config.INPUT_MIN_CUTOFF)
+        # beta задан на пиксель экрана в секунду, а скорость фильтра - во внутреннем разрешении
+        self.filter.beta = settings.get('input_beta', config.INPUT_BETA) / config.RENDER_SCALE
+        self.lead_scale = settings.get('input_lead_scale', 1.0)
+
+    def handle_event(self, event) -> bool:
+        """
+        Учесть событие движения. Возвращает True, если событие относится к корзине.
+        """
+        if event.type == pygame.FINGERDOWN or event.type == pygame.FINGERMOTION:
+            # Координаты касания нормированы, поэтому сразу во внутреннем разрешении
+            x = event.x * config.WIDTH
+        elif event.type == pygame.MOUSEMOTION:
+            x = to_render_pos(event.pos)[0]
+        else:
+            return False
+
+        # pygame 2.6 не отдаёт метку времени SDL (event.timestamp нет), поэтому
+        # метка - момент выборки события из очереди. Задержка до события в
+        # ОС и в очереди SDL в замеры не попадает
+        stamp = pygame.time.get_ticks()
+
+        self.events_received += 1
+        if self.pending_x is not None:
+            self.events_coalesced += 1
+        if self.pending_since is None:
+            self.pending_since = stamp
+        self.pending_x = x
+        if self.prediction_enabled and event.type == pygame.FINGERDOWN:
+            self.filter.reset()  # Новое касание - скорость прошлого не переносится
+        return True
+
+    def get_lead_ms(self) -> float:
+        """На сколько миллисекунд вперёд выносить цель корзины"""
+        frame_ms = 1000.0 / config.FPS
+        smoothness = config.BASKET_MOVE_SMOOTHNESS
+        # Экспоненциальное сглаживание отстаёт на (1 - s) / s кадров при равномерном движении
+        smoothing_lag_ms = frame_ms * (1.0 - smoothness) / smoothness if smoothness > 0 else 0.0
+        # Отклик от выборки события до кадра с движением корзины - замер LatencyTracker
+        response_ms = None
+        if self.latency is not None:
+            response_ms = self.latency.response_ema
+        if response_ms is None:
+            response_ms = config.INPUT_PRESENT_DELAY_MS
+        lead_ms = (response_ms + smoothing_lag_ms + self.filter.lag_ms) * self.lead_scale
+        return min(lead_ms, config.INPUT_PREDICTION_MAX_LEAD_MS)
+
+    def _predict(self, now: float) -> float:
+        """Цель корзины с учётом скорости пальца (now - время тика в мс)"""
+        if now - self.filter.last_stamp > config.INPUT_PREDICTION_IDLE_MS:
+            # Палец остановился: выносить некуда, цель - сглаженная позиция
+            self.filter.velocity = 0.0
+            return self.filter.x
+        offset = self.filter.velocity * self.get_lead_ms() / 1000.0
+        limit = config.INPUT_PREDICTION_MAX_OFFSET
+        predicted = self.filter.x + max(-limit, min(offset, limit))
+        return max(0.0, min(predicted, config.WIDTH))
+
+    def apply(self, basket):
+        """Применить накопленный ввод к корзине (один раз за тик)"""
+        now = self.clock() * 1000.0
+        if self.pending_x is not None:
+            if self.prediction_enabled:
+                self.filter.add(self.pending_x, now)
+            self.target_x = self.pending_x
+            self.coalesce_delay_samples.append(pygame.time.get_ticks() - self.pending_since)
+            if self.latency is not None and basket is not None:
+                self.latency.on_input_applied(self.pending_since, self.pending_x, basket)
+            self.pending_x = None
+            self.pending_since = None
+
+        # Предсказание пересчитывается каждый тик: вынос затухает, когда палец стоит
+        if self.prediction_enabled and self.filter.x is not None:
+            self.target_x = self._predict(now)
+
+        if self.target_x is not None and basket is not None:
+            basket.move(self.target_x)
+
+    def reset(self):
+        """Сброс цели (например, при перезапуске игры)"""
+        self.target_x = None
+        self.pending_x = None
+        self.pending_since = None
+        self.filter.reset()
+
+    def get_coalescing_stats(self) -> dict:
+        """
+        Счётчики схлопывания событий и ожидание схлопнутого события до
+        apply() (мс) по скользящему окну. Ожидание укладывается в один кадр
+        и задержкой ввода не является.
+        """
+        stats = {'received': self.events_received, 'coalesced': self.events_coalesced}
+        stats.update(LatencyTracker._stats(self.coalesce_delay_samples))
+        return stats
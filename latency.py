@@ -0,0 +1,249 @@
+"""
+Модуль для замера задержки от касания до кадра на экране
+
+Запуск как скрипта сравнивает коэффициенты плавности корзины (без
+предсказания движения пальца и с ним) на синтетическом вводе:
+    python latency.py [число_кадров] [плавность ...]
+
+Проверка оценки скорости пальца при нескольких событиях за кадр (при
+ошибке больше допуска - код выхода 1):
+    python latency.py check
+"""
+import sys
+from collections import deque
+import pygame
+import config
+
+
+class LatencyTracker:
+    """
+    Задержка "ввод -> фотон" для корзины.
+
+    Метка события - момент его выборки из очереди (pygame 2.6 не отдаёт
+    метку времени SDL, так что задержка в ОС и очереди SDL не видна) - проходит
+    через схлопывание событий в InputController (берётся самая ранняя
+    необработанная), применение к корзине (StickBasket.move) и кадр,
+    который после display.flip показывает сдвинутую корзину. Считаются:
+      - отклик: от выборки события до первого кадра с движением корзины;
+      - установление: от выборки первого события, отведшего палец от корзины,
+        до кадра, где корзина подошла к пальцу ближе LATENCY_SETTLE_PX;
+      - ошибка слежения: расстояние от корзины до пальца в каждом кадре.
+    Момент возврата из flip - приближение "фотона": без учёта vsync
+    и задержки самого экрана. Сглаженный отклик (response_ema) использует
+    InputController для выноса цели корзины.
+    """
+
+    def __init__(self, window: int = None):
+        window = window if window is not None else config.LATENCY_WINDOW
+        self.response_samples = deque(maxlen=window)
+        self.settle_samples = deque(maxlen=window)
+        self.tracking_error = deque(maxlen=window)
+        self.response_ema = None  # Сглаженный отклик (мс), None до первого замера
+
+        self._response_stamp = None  # Самая ранняя метка, ещё не показанная на экране
+        self._response_from_x = None
+        self._settle_stamp = None  # Метка первого ввода, с которого корзина отстаёт от пальца
+        self._finger_x = None
+
+    def on_input_applied(self, stamp: int, finger_x: float, basket):
+        """Ввод применён к корзине (вызывается из InputController.apply перед move)"""
+        if self._response_stamp is None:
+            self._response_stamp = stamp
+            self._response_from_x = basket.rect.x
+        self._finger_x = finger_x
+        if self._settle_stamp is None and self._error(basket) > config.LATENCY_SETTLE_PX:
+            self._settle_stamp = stamp
+
+    def _error(self, basket) -> float:
+        """Расстояние от центра корзины до пальца (палец у края - до ближайшей достижимой точки)"""
+        half = basket.width / 2
+        target = min(max(self._finger_x, half), config.WIDTH - half)
+        return abs(basket.rect.centerx - target)
+
+    def on_present(self, basket):
+        """Кадр выведен на экран"""
+        if basket is None or self._finger_x is None:
+            return
+        now = pygame.time.get_ticks()
+        error = self._error(basket)
+        self.tracking_error.append(error)
+        settled = error <= config.LATENCY_SETTLE_PX
+
+        if self._response_stamp is not None:
+            if basket.rect.x != self._response_from_x:
+                response = now - self._response_stamp
+                self.response_samples.append(response)
+                if self.response_ema is None:
+                    self.response_ema = float(response)
+                else:
+                    self.response_ema += (response - self.response_ema) * config.INPUT_LATENCY_SMOOTHING
+                self._response_stamp = None
+            elif settled:
+                self._response_stamp = None  # Двигаться было некуда - замера нет
+        if self._settle_stamp is not None and settled:
+            self.settle_samples.append(now - self._settle_stamp)
+            self._settle_stamp = None
+
+    def reset(self):
+        """Сброс незавершённых замеров (например, при перезапуске игры)"""
+        self._response_stamp = None
+        self._settle_stamp = None
+        self._finger_x = None
+
+    @staticmethod
+    def _stats(samples) -> dict:
+        if not samples:
+            return {'count': 0, 'mean': 0.0, 'p50': 0, 'p95': 0, 'max': 0}
+        ordered = sorted(samples)
+        count = len(ordered)
+        return {
+            'count': count,
+            'mean': sum(ordered) / count,
+            'p50': ordered[count // 2],
+            'p95': ordered[min(count - 1, int(count * 0.95))],
+            'max': ordered[-1],
+        }
+
+    def get_stats(self) -> dict:
+        """Статистика по скользящим окнам"""
+        return {
+            'response': self._stats(self.response_samples),
+            'settle': self._stats(self.settle_samples),
+            'tracking_error': self._stats(self.tracking_error),
+        }
+
+    @staticmethod
+    def histogram(samples, bins=None) -> list:
+        """Пары (верхняя граница корзины гистограммы в мс или None для хвоста, число)"""
+        bins = bins if bins is not None else config.LATENCY_HISTOGRAM_BINS_MS
+        counts = [0] * (len(bins) + 1)
+        for value in samples:
+            for index, upper in enumerate(bins):
+                if value <= upper:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return list(zip(list(bins) + [None], counts))
+
+    def get_report(self, coalescing: dict = None) -> str:
+        """
+        Текстовый отчёт с гистограммами.
+
+        :param coalescing: Счётчики схлопывания ввода
+            (InputController.get_coalescing_stats), если нужны в отчёте.
+        """
+        stats = self.get_stats()
+        lines = ["Задержки от выборки события из очереди до кадра на экране"]
+        for name, title in (('response', 'Отклик'), ('settle', 'Установление')):
+            item = stats[name]
+            lines.append(f"{title}: {item['count']} замеров, среднее {item['mean']:.1f} мс, "
+                         f"p50 {item['p50']} мс, p95 {item['p95']} мс, макс {item['max']} мс")
+            samples = self.response_samples if name == 'response' else self.settle_samples
+            total = max(1, len(samples))
+            lower = 0
+            for upper, count in self.histogram(samples):
+                label = f"{lower}-{upper} мс" if upper is not None else f">{lower} мс"
+                bar = '#' * round(40 * count / total)
+                lines.append(f"  {label:>12} {count:>6} {bar}")
+                if upper is not None:
+                    lower = upper
+        error = stats['tracking_error']
+        lines.append(f"Ошибка слежения: среднее {error['mean']:.1f} px, p95 {error['p95']:.0f} px")
+        if coalescing is not None:
+            lines.append(f"Схлопывание ввода: {coalescing['received']} событий, "
+                         f"{coalescing['coalesced']} поглощено следующими; ожидание до применения "
+                         f"среднее {coalescing['mean']:.1f} мс, p95 {coalescing['p95']} мс, "
+                         f"макс {coalescing['max']} мс")
+        return '\n'.join(lines)
+
+
+def compare_smoothing(frames: int = 600, values=(0.3, 0.5, 1.0)):
+    """
+    Прогон игры с синтетическим вводом для нескольких BASKET_MOVE_SMOOTHNESS,
+    каждый - без предсказания движения пальца и с ним.
+
+    Палец плавно водят из стороны в сторону (сумма двух синусоид), кадры
+    идут с частотой FPS (clock.tick), как в игре.
+    """
+    import math
+    import random
+    import main
+
+    config.LATENCY_TRACKING = True
+    config.TELEMETRY_ENABLED = False  # Синтетические партии не пишутся в базу игрока
+    rows = []
+    for smoothness, prediction in [(value, flag) for value in values for flag in (False, True)]:
+        config.BASKET_MOVE_SMOOTHNESS = smoothness
+        config.INPUT_PREDICTION = prediction
+        random.seed(1)
+        game = main.Game()
+        game.game_state.set_difficulty(2)
+        game.game_state.show_difficulty_screen = False
+        game.game_state.restart_game()
+        for frame in range(frames):
+            game.clock.tick(config.FPS)
+            t = frame / config.FPS
+            x = config.WIDTH * (0.5 + 0.3 * math.sin(t * 2.1) + 0.1 * math.sin(t * 5.3))
+            pygame.event.post(pygame.event.Event(
+                pygame.MOUSEMOTION, pos=(int(x), config.HEIGHT // 2), rel=(0, 0), buttons=(0, 0, 0)))
+            game.handle_events()
+            game.update()
+            game.draw()
+            if game.game_state.game_over:
+                game.game_state.restart_game()
+        print(f"Плавность {smoothness}, предсказание {'вкл' if prediction else 'выкл'}:")
+        print(game.latency.get_report(game.input.get_coalescing_stats()))
+        stats = game.latency.get_stats()
+        rows.append((smoothness, prediction, stats['response'], stats['settle'], stats['tracking_error']))
+        game.gc_control.uninstall()
+        pygame.quit()
+
+    print(f"{'Плавность':>10}{'предсказ.':>11}{'отклик p95':>12}{'устан. p50':>12}"
+          f"{'устан. p95':>12}{'ошибка, px':>12}")
+    for smoothness, prediction, response, settle, error in rows:
+        print(f"{smoothness:>10.2f}{'вкл' if prediction else 'выкл':>11}{response['p95']:>12}"
+              f"{settle['p50']:>12}{settle['p95']:>12}{error['mean']:>12.1f}")
+
+
+def check_prediction_velocity(speed: float = 600.0, events_per_frame=(1, 2, 4),
+                              tolerance: float = 0.05) -> int:
+    """
+    Проверка, что скорость пальца в фильтре предсказания не зависит от
+    числа событий движения за кадр: палец равномерно идёт через экран со
+    скоростью speed (пикселей в секунду), события кадра, как и в pygame,
+    приходят в один тик. Возвращает число случаев с ошибкой больше
+    tolerance (доля от speed).
+    """
+    from input_controller import InputController
+
+    failures = 0
+    frame_s = 1.0 / config.FPS
+    start_x = config.WIDTH * 0.1
+    frames = int(config.WIDTH * 0.8 / speed * config.FPS)
+    for count in events_per_frame:
+        now = [0.0]
+        controller = InputController(clock=lambda: now[0])
+        controller.prediction_enabled = True
+        for frame in range(frames):
+            now[0] = frame * frame_s
+            for index in range(count):
+                # События равномерно между прошлым тиком и текущим
+                t = now[0] - frame_s * (count - 1 - index) / count
+                controller.handle_event(pygame.event.Event(
+                    pygame.MOUSEMOTION, pos=(start_x + speed * t, 0), rel=(0, 0), buttons=(0, 0, 0)))
+            controller.apply(None)
+        velocity = controller.filter.velocity
+        error = abs(velocity - speed) / speed
+        status = 'ok' if error <= tolerance else 'ошибка'
+        print(f"Событий за кадр {count}: скорость {velocity:.0f} px/s при истинной {speed:.0f} - {status}")
+        if error > tolerance:
+            failures += 1
+    return failures
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['check']:
+        sys.exit(1 if check_prediction_velocity() else 0)
+    compare_smoothing(int(sys.argv[1]) if len(sys.argv) > 1 else 600,
+                      [float(value) for value in sys.argv[2:]] or (0.3, 0.5, 1.0))
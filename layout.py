@@ -0,0 +1,140 @@
+"""
+Модуль для раскладки виджетов интерфейса
+"""
+from typing import Optional
+import pygame
+import config
+
+
+class ScreenLayout:
+    """Виджеты одного экрана: имя -> прямоугольник (в порядке отрисовки)"""
+
+    def __init__(self):
+        self.widgets = {}
+        self.values = {}  # Имя -> связанное значение (например, уровень сложности)
+
+    def add(self, name: str, rect, value=None) -> pygame.Rect:
+        """Добавление виджета"""
+        rect = pygame.Rect(rect)
+        self.widgets[name] = rect
+        if value is not None:
+            self.values[name] = value
+        return rect
+
+    def get(self, name: str) -> pygame.Rect:
+        """Прямоугольник виджета"""
+        return self.widgets[name]
+
+    def hit_test(self, pos) -> Optional[str]:
+        """Имя верхнего виджета под точкой pos или None"""
+        for name in reversed(self.widgets):
+            if self.widgets[name].collidepoint(pos):
+                return name
+        return None
+
+    def items(self):
+        """Пары (имя, прямоугольник) в порядке отрисовки"""
+        return self.widgets.items()
+
+
+class UILayout:
+    """
+    Раскладка всех экранов интерфейса.
+
+    Прямоугольники виджетов считаются один раз для размера области
+    отрисовки и пересчитываются только при его изменении (resize).
+    Отрисовка и проверка кликов берут их отсюда, поэтому обработчик
+    событий ничего не рисует.
+    """
+
+    HUD = 'hud'
+    DIFFICULTY = 'difficulty'
+    PAUSE = 'pause'
+    GAME_OVER = 'game_over'
+    EXIT_CONFIRM = 'exit_confirm'
+
+    def __init__(self, font: pygame.font.Font, size):
+        self.font = font
+        self.size = None
+        self.screens = {}
+        self.resize(size)
+
+    def resize(self, size) -> bool:
+        """Пересчёт раскладки под новый размер; False, если размер не изменился"""
+        size = (int(size[0]), int(size[1]))
+        if size == self.size:
+            return False
+        self.size = size
+        self._build()
+        return True
+
+    def screen(self, name: str) -> ScreenLayout:
+        """Раскладка экрана"""
+        return self.screens[name]
+
+    def get(self, screen: str, widget: str) -> pygame.Rect:
+        """Прямоугольник виджета экрана"""
+        return self.screens[screen].get(widget)
+
+    def hit_test(self, screen: str, pos) -> Optional[str]:
+        """Имя виджета экрана screen под точкой pos или None"""
+        return self.screens[screen].hit_test(pos)
+
+    def _text_button(self, text: str, center) -> pygame.Rect:
+        """Кнопка по размеру текста с отступами"""
+        rect = pygame.Rect((0, 0), self.font.size(text))
+        rect.center = center
+        return rect.inflate(20, 10)
+
+    def _build(self):
+        """Расчёт прямоугольников всех экранов"""
+        width, height = self.size
+        self.screens = {}
+
+        # Постоянные кнопки поверх игры
+        hud = ScreenLayout()
+        hud.add('exit', (config.EXIT_BUTTON_X, config.EXIT_BUTTON_Y,
+                         config.EXIT_BUTTON_WIDTH, config.EXIT_BUTTON_HEIGHT))
+        hud.add('pause', (config.PAUSE_BUTTON_X, config.PAUSE_BUTTON_Y,
+                          config.PAUSE_BUTTON_SIZE, config.PAUSE_BUTTON_SIZE))
+        self.screens[self.HUD] = hud
+
+        # Кнопки сложности - столбиком по центру экрана, сколько их есть в настройках
+        difficulty = ScreenLayout()
+        levels = sorted(config.DIFFICULTY_SETTINGS)
+        step = config.DIFFICULTY_BUTTON_HEIGHT + config.BUTTON_SPACING
+        total_height = len(levels) * step - config.BUTTON_SPACING
+        top = height // 2 - total_height // 2
+        for index, level in enumerate(levels):
+            difficulty.add(
+                f'difficulty_{level}',
+                (width // 2 - config.DIFFICULTY_BUTTON_WIDTH // 2, top + index * step,
+                 config.DIFFICULTY_BUTTON_WIDTH, config.DIFFICULTY_BUTTON_HEIGHT),
+                value=level
+            )
+        self.screens[self.DIFFICULTY] = difficulty
+
+        pause = ScreenLayout()
+        pause.add('continue', self._text_button(
+            "Продолжить игру", (width // 2, height // 2 + config.FONT_SIZE * 2)))
+        self.screens[self.PAUSE] = pause
+
+        game_over = ScreenLayout()
+        game_over.add('restart', self._text_button(
+            "Играть ещё раз", (width // 2, height // 2 + config.FONT_SIZE)))
+        self.screens[self.GAME_OVER] = game_over
+
+        exit_confirm = ScreenLayout()
+        exit_confirm.add('yes', (
+            width // 2 - config.CONFIRM_BUTTON_WIDTH - config.CONFIRM_BUTTON_SPACING // 2,
+            height // 2 + config.FONT_SIZE,
+            config.CONFIRM_BUTTON_WIDTH,
+            config.CONFIRM_BUTTON_HEIGHT
+        ))
+        exit_confirm.add('no', (
+            width // 2 + config.CONFIRM_BUTTON_SPACING // 2,
+            height // 2 + config.FONT_SIZE,
+            config.CONFIRM_BUTTON_WIDTH,
+            config.CONFIRM_BUTTON_HEIGHT
+        ))
+        self.screens[self.EXIT_CONFIRM] = exit_confirm
@@ -7,11 +7,27 @@ kivy.require('2.1.0')
 
 from kivy.app import App
 import sys
+import pygame
 import config
 from database import Database
 from game_state import GameState
 from ui import UI
+from layout import UILayout
 from sound_manager import SoundManager
+from input_controller import InputController
+from frame_timing import FrameTimer, LoadProfile
+from quality import QualityGovernor
+from renderer import create_renderer
+from surfaces import BlitAudit
+from alloc_tracker import AllocationTracker
+from gc_control import GCController
+from telemetry import Telemetry
+from render_scale import RenderTarget, to_render_pos
+from autoplay import AutoPlayer
+from profiler import FrameProfiler
+from latency import LatencyTracker
+from atlas import SpriteBatch, build_game_atlas, game_sprite_surfaces
+from shelf_layer import ShelfLayer
 
 
 class Game:
@@ -20,91 +36,189 @@ class Game:
     def __init__(self):
         pygame.init()
         
-        # Создание окна
-        self.screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+        # Создание окна; при RENDER_SCALE < 1 игра рисует во внеэкранную поверхность
+        self.render_target = RenderTarget()
+        self.screen = self.render_target.surface
         pygame.display.set_caption("Catch the Ball - Олег «СТК»")
         
         # Инициализация компонентов
         self.database = Database()
         self.game_state = GameState()
-        self.ui = UI(self.screen, self.database)
+        # В отладочном режиме каждый блит с несовпадающим форматом логируется
+        self.blit_audit = BlitAudit() if config.SURFACE_AUDIT else None
+        self.renderer = create_renderer(config.RENDER_BACKEND, self.screen, self.blit_audit)
+        self.ui = UI(self.renderer, self.database)
+        
+        # Атлас: картинки объектов, надписи UI и частицы выводятся пакетами
+        self.sprite_batch = None
+        if config.ATLAS_ENABLED:
+            atlas = build_game_atlas(self.ui.static_labels, game_sprite_surfaces())
+            self.ui.set_atlas(atlas)
+            self.sprite_batch = SpriteBatch(atlas)
+        
+        # Полочки - один заранее нарисованный слой
+        self.shelf_layer = ShelfLayer() if config.SHELF_LAYER_ENABLED else None
         self.sound_manager = SoundManager()
+        self.input = InputController()
+        # Замер отклика нужен и для отчёта, и для выноса цели при предсказании
+        self.latency = None
+        if config.LATENCY_TRACKING or config.INPUT_PREDICTION:
+            self.latency = LatencyTracker()
+        self.input.latency = self.latency
+        
+        # Бот вместо игрока и профиль времени кадров по сложности для него
+        self.autoplay = AutoPlayer() if config.AUTOPLAY else None
+        self.load_profile = LoadProfile() if config.AUTOPLAY else None
         
         # Подключаем sound_manager к game_state
         self.game_state.sound_manager = self.sound_manager
         
+        # Телеметрия партий
+        self.telemetry = Telemetry() if config.TELEMETRY_ENABLED else None
+        self.game_state.telemetry = self.telemetry
+        if config.MUSIC_ENABLED:
+            self.sound_manager.play_music()
+        
         # Игровой цикл
         self.clock = pygame.time.Clock()
         self.running = True
+        
+        # Режим статичного экрана: перерисовка только после ввода
+        self._needs_redraw = True
+        self.idle_frames_drawn = 0
+        self.idle_frames_skipped = 0
+        
+        # Замер кадров и адаптивное качество
+        self.frame_timer = FrameTimer()
+        self.quality = None
+        if config.QUALITY_GOVERNOR_ENABLED:
+            self.quality = QualityGovernor(self.frame_timer)
+            self.quality.add_listener(self._apply_quality)
+        
+        # Диагностика выделений памяти за кадр
+        self.alloc_tracker = None
+        if config.ALLOC_TRACKING:
+            self.alloc_tracker = AllocationTracker()
+            self.alloc_tracker.start()
+        
+        # Сборщик мусора: замер пауз, заморозка загруженного при запуске
+        self.gc_control = GCController(self.frame_timer)
+        self.gc_control.freeze()
+        self.gc_control.install()
+        
+        # Профиль кадров по запросу (переменная окружения или клавиша)
+        self.profiler = FrameProfiler()
+        if config.PROFILE_PHASE:
+            self.profiler.start(config.PROFILE_PHASE)
+    
+    def _apply_quality(self, level: dict):
+        """Применение уровня качества к подсистемам отрисовки"""
+        self.game_state.particle_system.set_quality(level['particle_scale'], level['max_particles'])
+        self.ui.set_quality(level['background_squares'], level['alpha_overlays'])
+        if self.telemetry is not None:
+            self.telemetry.set_quality_level(self.quality.level_index)
     
-    def handle_events(self):
-        """Обработка событий"""
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """Обработка событий (по умолчанию - всей очереди pygame)"""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.game_state.show_exit_confirmation = True
             
+            if event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                self.ui.on_resize(self.renderer.get_size())
+            
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                self._handle_mouse_click(mouse_pos)
+                self._handle_mouse_click(to_render_pos(event.pos))
+            
+            if event.type == pygame.KEYDOWN and event.key == config.PROFILE_KEY:
+                self.profiler.toggle()
             
-            # Движение корзины
-            if (not self.game_state.show_exit_confirmation and
+            # Движение корзины: события копятся и применяются раз за тик в update()
+            if self._basket_control_active():
+                self.input.handle_event(event)
+    
+    def _basket_control_active(self) -> bool:
+        """Управляет ли сейчас игрок корзиной"""
+        return (not self.game_state.show_exit_confirmation and
                 not self.game_state.show_difficulty_screen and
                 self.game_state.game_started and
                 not self.game_state.game_over and
                 not self.game_state.paused and
-                self.game_state.basket is not None):
-                
-                if event.type == pygame.FINGERDOWN or event.type == pygame.FINGERMOTION:
-                    touch_x = event.x * config.WIDTH
-                    self.game_state.basket.move(touch_x)
-                elif event.type == pygame.MOUSEMOTION:
-                    self.game_state.basket.move(event.pos[0])
+                self.game_state.basket is not None)
+    
+    def _update_autoplay(self):
+        """Ход бота: сам выбирает сложность, перезапускает партию и ведёт корзину"""
+        game_state = self.game_state
+        if game_state.show_exit_confirmation or game_state.paused:
+            return
+        if game_state.show_difficulty_screen or game_state.game_over:
+            game_state.set_difficulty(config.AUTOPLAY_DIFFICULTY)
+            game_state.show_difficulty_screen = False
+            game_state.restart_game()
+            self.autoplay.reset()
+            return
+        if self._basket_control_active():
+            self.autoplay.update(game_state)
+    
+    def is_idle(self) -> bool:
+        """
+        Статичный экран (выбор сложности, пауза, конец игры, подтверждение
+        выхода без идущей под ним партии): кадры меняются только от ввода
+        """
+        gameplay_running = (self.game_state.game_started and
+                            not self.game_state.game_over and
+                            not self.game_state.paused and
+                            not self.game_state.show_difficulty_screen)
+        return not gameplay_running
     
     def _handle_mouse_click(self, mouse_pos):
         """Обработка кликов мыши"""
         # Диалог подтверждения выхода
         if self.game_state.show_exit_confirmation:
-            yes_rect, no_rect = self.ui.draw_exit_confirmation()
-            if yes_rect.collidepoint(mouse_pos):
+            widget = self.ui.hit_test(UILayout.EXIT_CONFIRM, mouse_pos)
+            if widget == 'yes':
                 self._confirm_exit()
-            elif no_rect.collidepoint(mouse_pos):
+            elif widget == 'no':
                 self.game_state.show_exit_confirmation = False
             return
         
-        # Кнопка выхода
-        if self.ui.exit_rect.collidepoint(mouse_pos):
+        # Кнопки поверх игры
+        hud_widget = self.ui.hit_test(UILayout.HUD, mouse_pos)
+        if hud_widget == 'exit':
             self.game_state.show_exit_confirmation = True
             return
         
         # Экран выбора сложности
         if self.game_state.show_difficulty_screen:
-            if self.ui.easy_button_rect.collidepoint(mouse_pos):
-                self.game_state.set_difficulty(1)
-                self.game_state.show_difficulty_screen = False
-                self.game_state.restart_game()
-            elif self.ui.medium_button_rect.collidepoint(mouse_pos):
-                self.game_state.set_difficulty(2)
-                self.game_state.show_difficulty_screen = False
-                self.game_state.restart_game()
-            elif self.ui.hard_button_rect.collidepoint(mouse_pos):
-                self.game_state.set_difficulty(3)
+            widget = self.ui.hit_test(UILayout.DIFFICULTY, mouse_pos)
+            if widget is not None:
+                level = self.ui.layout.screen(UILayout.DIFFICULTY).values[widget]
+                self.game_state.set_difficulty(level)
                 self.game_state.show_difficulty_screen = False
                 self.game_state.restart_game()
+                self.input.reset()
+                self.input.set_difficulty(config.DIFFICULTY_SETTINGS[level])
+                if self.latency is not None:
+                    self.latency.reset()
             return
         
         # Игровой процесс
         if self.game_state.game_started and not self.game_state.game_over:
             # Кнопка паузы
-            if self.ui.pause_button_rect.collidepoint(mouse_pos):
+            if hud_widget == 'pause':
                 self.game_state.paused = not self.game_state.paused
+                if self.telemetry:
+                    self.telemetry.record_event('pause' if self.game_state.paused else 'resume')
                 return
             
             # Продолжить игру (на экране паузы)
             if self.game_state.paused:
-                continue_rect = self.ui.draw_pause_screen()
-                if continue_rect.collidepoint(mouse_pos):
+                if self.ui.hit_test(UILayout.PAUSE, mouse_pos) == 'continue':
                     self.game_state.paused = False
+                    if self.telemetry:
+                        self.telemetry.record_event('resume')
                 return
         
         # Экран окончания игры
@@ -118,8 +232,7 @@ class Game:
                 )
                 self.game_state._score_saved = True
             
-            restart_rect = self.ui.draw_game_over_screen(self.game_state)
-            if restart_rect.collidepoint(mouse_pos):
+            if self.ui.hit_test(UILayout.GAME_OVER, mouse_pos) == 'restart':
                 self.game_state.show_difficulty_screen = True
                 self.game_state.game_over = False
                 if hasattr(self.game_state, '_score_saved'):
@@ -137,6 +250,11 @@ class Game:
     
     def update(self):
         """Обновление состояния игры"""
+        if self.autoplay is not None:
+            self._update_autoplay()
+        elif self._basket_control_active():
+            self.input.apply(self.game_state.basket)
+        
         if (self.game_state.game_started and
             not self.game_state.game_over and
             not self.game_state.paused):
@@ -144,6 +262,8 @@ class Game:
     
     def draw(self):
         """Отрисовка игры"""
+        self.renderer.begin_frame()
+        
         # Фон
         self.ui.draw_background()
         
@@ -154,17 +274,22 @@ class Game:
             
             elif self.game_state.game_started and not self.game_state.game_over:
                 # Рисуем игровые объекты
-                for shelf in self.game_state.shelves:
-                    shelf.draw(self.screen)
+                if self.shelf_layer is not None:
+                    self.shelf_layer.draw(self.renderer, self.game_state.shelves)
+                else:
+                    for shelf in self.game_state.shelves:
+                        shelf.draw(self.renderer)
                 
+                # Слой спрайтов: шары, корзина и частицы - один пакет из атласа
                 for ball in self.game_state.balls:
-                    ball.draw(self.screen)
+                    ball.draw(self.renderer, self.sprite_batch)
                 
                 if self.game_state.basket is not None:
-                    self.game_state.basket.draw(self.screen)
+                    self.game_state.basket.draw(self.renderer, self.sprite_batch)
                 
-                # Частицы
-                self.game_state.particle_system.draw(self.screen)
+                self.game_state.particle_system.draw(self.renderer, self.sprite_batch)
+                if self.sprite_batch is not None:
+                    self.sprite_batch.flush(self.renderer)
                 
                 # UI
                 self.ui.draw_game_ui(self.game_state)
@@ -189,15 +314,85 @@ class Game:
         if self.game_state.show_exit_confirmation:
             self.ui.draw_exit_confirmation()
         
-        pygame.display.flip()
+        # Время до flip - нагрузка кадра; ожидание vsync в flip в него не входит
+        self.render_target.compose()
+        self.frame_timer.mark_work_end()
+        self.render_target.flip()
+        if self.latency is not None:
+            self.latency.on_present(self.game_state.basket)
+    
+    def _run_idle_frame(self):
+        """
+        Кадр статичного экрана: ожидание ввода с таймаутом вместо отрисовки
+        на полной частоте. Экран перерисовывается только после событий
+        (клик, наведение, изменение окна); таймаут нужен, чтобы музыка и
+        отложенные звуки продолжали подаваться в микшер.
+        """
+        self.clock.tick(config.IDLE_FPS)
+        event = pygame.event.wait(config.IDLE_WAIT_TIMEOUT_MS)
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        if events:
+            self._needs_redraw = True
+            self.handle_events(events)
+        
+        self.update()
+        self.sound_manager.update()
+        if self._needs_redraw:
+            self.draw()
+            self._needs_redraw = False
+            self.idle_frames_drawn += 1
+        else:
+            self.idle_frames_skipped += 1
+        
+        self.gc_control.on_frame_end(0.0, True)
+        if self.telemetry is not None:
+            self.telemetry.on_frame(self.frame_timer,
+                                    len(self.game_state.particle_system.particles),
+                                    True)
     
     def run(self):
         """Главный игровой цикл"""
         while self.running:
+            if config.IDLE_RENDER_ENABLED and self.is_idle():
+                self._run_idle_frame()
+                continue
+            # После возврата к статичному экрану его первый кадр рисуется сразу
+            self._needs_redraw = True
+            
             self.clock.tick(config.FPS)
+            self.profiler.begin('frame')
+            if self.alloc_tracker is not None:
+                self.alloc_tracker.begin_frame()
+            self.frame_timer.begin_frame()
+            self.profiler.begin('events')
             self.handle_events()
+            self.profiler.end('events')
+            self.profiler.begin('update')
             self.update()
+            self.profiler.end('update')
+            self.sound_manager.update()
+            self.profiler.begin('draw')
             self.draw()
+            self.profiler.end('draw')
+            self.frame_timer.end_frame()
+            self.profiler.end('frame')
+            self.profiler.end_frame()
+            if self.load_profile is not None:
+                self.load_profile.add(self.game_state, self.frame_timer.last_frame_ms)
+            self.gc_control.on_frame_end(self.frame_timer.last_work_ms, self.is_idle())
+            if self.telemetry is not None:
+                self.telemetry.on_frame(self.frame_timer,
+                                        len(self.game_state.particle_system.particles),
+                                        self.is_idle())
+            if self.alloc_tracker is not None:
+                self.alloc_tracker.end_frame()
+                frames = self.alloc_tracker.frame_count
+                if frames and frames % config.ALLOC_REPORT_INTERVAL == 0:
+                    self.alloc_tracker.print_report()
+            if self.quality is not None:
+                self.quality.update()
         
         # Сохранение при выходе
         if self.game_state.game_started:
@@ -207,6 +402,21 @@ class Game:
                 self.game_state.current_difficulty
             )
         
+        if self.alloc_tracker is not None:
+            self.alloc_tracker.print_report()
+            self.alloc_tracker.stop()
+        
+        if self.load_profile is not None:
+            print(self.load_profile.get_report())
+        if config.LATENCY_TRACKING:
+            print(self.latency.get_report(self.input.get_coalescing_stats()))
+        self.profiler.stop()
+        
+        if self.telemetry is not None:
+            # Партия, прерванная закрытием окна, закрывается с текущим счётом
+            self.telemetry.close(self.game_state.score if self.game_state.game_started else None)
+        self.gc_control.uninstall()
+        self.sound_manager.stop_music()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,72 @@
+"""
+Модуль для кэша масок столкновений
+"""
+import pygame
+import config
+from asset_cache import get_asset_cache
+
+
+class MaskCache:
+    """
+    Маски для попиксельных столкновений.
+
+    Маска строится один раз на изображение и размер (или на фигуру и
+    размер) и дальше только переиспользуется: в игровом цикле остаётся
+    лишь Mask.overlap.
+    """
+
+    def __init__(self):
+        self._masks = {}
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def get_image_mask(self, path: str, size) -> pygame.mask.Mask:
+        """Маска непрозрачных пикселей изображения path, масштабированного до size"""
+        size = (int(size[0]), int(size[1]))
+        key = ('image', path, size)
+        mask = self._masks.get(key)
+        if mask is None:
+            image = get_asset_cache().get_image(path, size)
+            mask = pygame.mask.from_surface(image, config.MASK_ALPHA_THRESHOLD)
+            self._masks[key] = mask
+        return mask
+
+    def get_circle_mask(self, diameter: int) -> pygame.mask.Mask:
+        """Маска круга (шар без изображения)"""
+        key = ('circle', diameter)
+        mask = self._masks.get(key)
+        if mask is None:
+            surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            radius = diameter // 2
+            pygame.draw.circle(surface, (255, 255, 255, 255), (radius, radius), radius)
+            mask = pygame.mask.from_surface(surface)
+            self._masks[key] = mask
+        return mask
+
+    def get_shape_mask(self, key, size, rects=(), polygons=()) -> pygame.mask.Mask:
+        """
+        Маска фигуры из прямоугольников и многоугольников в локальных
+        координатах (0, 0 - левый верхний угол), кэшируется по key
+        """
+        mask = self._masks.get(key)
+        if mask is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            for rect in rects:
+                pygame.draw.rect(surface, (255, 255, 255, 255), rect)
+            for points in polygons:
+                pygame.draw.polygon(surface, (255, 255, 255, 255), points)
+            mask = pygame.mask.from_surface(surface)
+            self._masks[key] = mask
+        return mask
+
+
+_mask_cache = None
+
+
+def get_mask_cache() -> MaskCache:
+    """Общий кэш масок игры"""
+    global _mask_cache
+    if _mask_cache is None:
+        _mask_cache = MaskCache()
+    return _mask_cache
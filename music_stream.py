@@ -0,0 +1,155 @@
+"""
+Модуль для потоковой генерации фоновой музыки
+"""
+import queue
+import threading
+import pygame
+import config
+
+# Попытка импорта numpy для микширования голосов
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class MusicStream:
+    """
+    Потоковый генератор процедурной музыки.
+
+    Фоновый поток синтезирует короткие PCM-фрагменты (один шаг паттерна)
+    в ограниченную очередь, а основной поток в pump() ставит их в очередь
+    выделенного канала через Channel.queue. Синтез идёт не дальше, чем на
+    lookahead фрагментов вперёд, поэтому нагрузка на CPU равномерная.
+    """
+
+    def __init__(self, synthesize, channel: pygame.mixer.Channel, lookahead: int = None):
+        """
+        :param synthesize: Функция синтеза с параметрами SoundManager._generate_samples,
+                           возвращающая int16-массив (frames, 2).
+        :param channel: Выделенный канал микшера для музыки.
+        :param lookahead: Максимальное число заранее синтезированных фрагментов.
+        """
+        self.synthesize = synthesize
+        self.channel = channel
+        lookahead = lookahead if lookahead is not None else config.MUSIC_LOOKAHEAD_CHUNKS
+        self.chunks = queue.Queue(maxsize=lookahead)
+
+        self.melody = config.MUSIC_MELODY
+        self.bass = config.MUSIC_BASS
+        self.base_tempo = config.MUSIC_BASE_TEMPO
+        self.tempo_scale = 1.0
+        self.step = 0
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.stats = {
+            'chunks_generated': 0,
+            'chunks_queued': 0,
+            'underruns': 0,
+        }
+        self._starved = False  # Пропуск уже засчитан, новый фрагмент ещё не подан
+
+    def start(self):
+        """Запуск фонового потока генерации"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._produce, name='music-stream', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Остановка генерации и воспроизведения"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.channel.stop()
+        self._starved = False
+        # Сбрасываем недоигранные фрагменты
+        while True:
+            try:
+                self.chunks.get_nowait()
+            except queue.Empty:
+                break
+
+    def set_tempo_scale(self, scale: float):
+        """Изменение темпа (например, по множителю сложности)"""
+        self.tempo_scale = max(0.5, min(scale, config.MUSIC_MAX_TEMPO_SCALE))
+
+    def pump(self):
+        """Подача готовых фрагментов в канал (вызывается раз в кадр из основного потока)"""
+        if self._thread is None:
+            return
+
+        # Очередь канала хранит один фрагмент - досылаем только когда она пуста
+        if self.channel.get_busy() and self.channel.get_queue() is not None:
+            return
+
+        try:
+            samples = self.chunks.get_nowait()
+        except queue.Empty:
+            # Канал доигрывает фрагмент, а в его очереди пусто и подать нечего.
+            # Пропуск засчитывается один раз до подачи следующего фрагмента,
+            # а не на каждом холостом вызове
+            if self.channel.get_busy() and not self._starved:
+                self._starved = True
+                self.stats['underruns'] += 1
+            return
+
+        sound = pygame.mixer.Sound(buffer=samples)
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+        self.stats['chunks_queued'] += 1
+        self._starved = False
+
+    def _produce(self):
+        """Цикл фонового потока: синтез фрагментов до заполнения очереди"""
+        while not self._stop_event.is_set():
+            samples = self._render_step()
+            if samples is None:
+                return
+            self.stats['chunks_generated'] += 1
+            # put с таймаутом, чтобы поток замечал остановку
+            while not self._stop_event.is_set():
+                try:
+                    self.chunks.put(samples, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def _render_step(self):
+        """Синтез одного шага паттерна (восьмая доля) с мелодией и басом"""
+        if not HAS_NUMPY:
+            return None
+
+        step_duration = 60.0 / (self.base_tempo * self.tempo_scale) / 2
+        melody_freq = self.melody[self.step % len(self.melody)]
+        bass_freq = self.bass[(self.step // 2) % len(self.bass)]
+        self.step += 1
+
+        voices = (
+            (melody_freq, config.MUSIC_VOLUME, 'sine'),
+            (bass_freq, config.MUSIC_VOLUME * 0.8, 'sawtooth'),
+        )
+        mix = None
+        for freq, volume, waveform in voices:
+            if freq is None:
+                continue
+            samples = self.synthesize(frequencies=freq, duration=step_duration, volume=volume,
+                                      attack_duration=0.005, release_duration=step_duration * 0.5,
+                                      waveform=waveform)
+            if samples is None:
+                continue
+            mix = samples.astype(np.int32) if mix is None else mix + samples
+
+        if mix is None:
+            # Пауза: тишина той же длительности
+            frames = int(step_duration * pygame.mixer.get_init()[0])
+            return np.zeros((frames, 2), dtype=np.int16)
+
+        max_sample_value = 2**(16 - 1) - 1
+        return np.clip(mix, -max_sample_value, max_sample_value).astype(np.int16)
@@ -1,21 +1,28 @@
 """
 Модуль для системы частиц (визуальные эффекты)
 """
-import pygame
 import random
 import math
 import config
+from pools import ObjectPool
+from atlas import particle_sprite_name
 
 
 class Particle:
     """Класс одной частицы"""
     
     def __init__(self, x: float, y: float, color: tuple = None):
+        self.reset(x, y, color)
+    
+    def reset(self, x: float, y: float, color: tuple = None):
+        """Переинициализация частицы на месте (для повторного использования из пула)"""
         self.x = x
         self.y = y
         self.color = color if color else config.YELLOW
-        self.velocity_x = random.uniform(-5, 5)  # Увеличена скорость
-        self.velocity_y = random.uniform(-8, -2)  # Увеличена скорость
+        # Скорости заданы в пикселях экрана и пересчитываются во внутреннее разрешение
+        scale = config.RENDER_SCALE
+        self.velocity_x = random.uniform(-5, 5) * scale  # Увеличена скорость
+        self.velocity_y = random.uniform(-8, -2) * scale  # Увеличена скорость
         self.lifetime = config.PARTICLE_LIFETIME
         self.max_lifetime = config.PARTICLE_LIFETIME
         self.size = random.randint(config.PARTICLE_SIZE_MIN, config.PARTICLE_SIZE_MAX)
@@ -24,17 +31,23 @@ class Particle:
         """Обновление позиции и времени жизни частицы"""
         self.x += self.velocity_x
         self.y += self.velocity_y
-        self.velocity_y += 0.2  # Гравитация
+        self.velocity_y += config.PARTICLE_GRAVITY
         self.lifetime -= 1
     
-    def draw(self, screen: pygame.Surface):
-        """Отрисовка частицы"""
+    def draw(self, renderer, batch=None):
+        """Отрисовка частицы (из атласа через batch, если там есть её спрайт)"""
         if self.lifetime > 0:
+            if batch is not None:
+                # Прозрачность квантуется до уровней, заранее нарисованных в атласе
+                levels = config.PARTICLE_ALPHA_LEVELS
+                level = max(1, min(levels, round(levels * self.lifetime / self.max_lifetime)))
+                name = particle_sprite_name(self.color, self.size, level)
+                if batch.has(name):
+                    batch.add(name, (int(self.x) - self.size, int(self.y) - self.size))
+                    return
             alpha = int(255 * (self.lifetime / self.max_lifetime))
             color_with_alpha = (*self.color[:3], alpha)
-            surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color_with_alpha, (self.size, self.size), self.size)
-            screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
+            renderer.circle(color_with_alpha, (self.x, self.y), self.size)
     
     def is_alive(self) -> bool:
         """Проверка, жива ли частица"""
@@ -46,6 +59,15 @@ class ParticleSystem:
     
     def __init__(self):
         self.particles = []
+        self.pool = ObjectPool(Particle, config.POOL_MAX_PARTICLES, 'particles')
+        # Параметры качества (меняются регулятором качества)
+        self.count_scale = 1.0
+        self.max_particles = None
+    
+    def set_quality(self, count_scale: float, max_particles: int = None):
+        """Настройка числа частиц во взрыве и общего лимита"""
+        self.count_scale = count_scale
+        self.max_particles = max_particles
     
     def add_explosion(self, x: float, y: float, count: int = None, color: tuple = None):
         """Добавить взрыв частиц"""
@@ -53,22 +75,34 @@ class ParticleSystem:
             return
         
         count = count if count is not None else config.PARTICLE_COUNT
+        count = max(1, int(count * self.count_scale))
+        if self.max_particles is not None:
+            count = min(count, self.max_particles - len(self.particles))
         for _ in range(count):
-            self.particles.append(Particle(x, y, color))
+            self.particles.append(self.pool.acquire(x, y, color))
     
     def update(self):
         """Обновление всех частиц"""
-        for particle in self.particles[:]:
+        # Живые частицы сдвигаются к началу списка без копирования,
+        # погибшие возвращаются в пул
+        particles = self.particles
+        alive_count = 0
+        for particle in particles:
             particle.update()
-            if not particle.is_alive():
-                self.particles.remove(particle)
+            if particle.is_alive():
+                particles[alive_count] = particle
+                alive_count += 1
+            else:
+                self.pool.release(particle)
+        del particles[alive_count:]
     
-    def draw(self, screen: pygame.Surface):
-        """Отрисовка всех частиц"""
+    def draw(self, renderer, batch=None):
+        """Отрисовка всех частиц (batch - слой атласа, выводится вызывающим)"""
         for particle in self.particles:
-            particle.draw(screen)
+            particle.draw(renderer, batch)
     
     def clear(self):
         """Очистка всех частиц"""
+        self.pool.release_all(self.particles)
         self.particles.clear()
 
@@ -0,0 +1,72 @@
+"""
+Модуль для пулов переиспользуемых игровых объектов
+"""
+
+
+class ObjectPool:
+    """
+    Пул объектов с явными acquire/release.
+
+    Объект из пула переинициализируется методом reset(*args) с теми же
+    аргументами, что и конструктор. Освобождённые объекты хранятся до
+    max_size штук, лишние отдаются сборщику мусора.
+    """
+
+    def __init__(self, factory, max_size: int = None, name: str = ''):
+        self.factory = factory
+        self.max_size = max_size
+        self.name = name
+        self.free = []
+
+        # Статистика
+        self.in_use = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, *args):
+        """Получить объект (из пула или новый)"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.factory(*args)
+            self.created += 1
+
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """Вернуть объект в пул"""
+        self.in_use -= 1
+        if self.max_size is not None and len(self.free) >= self.max_size:
+            self.discarded += 1
+            return
+        self.free.append(obj)
+
+    def release_all(self, objects):
+        """Вернуть в пул все объекты последовательности"""
+        for obj in objects:
+            self.release(obj)
+
+    def prewarm(self, count: int, *args):
+        """Заранее создать объекты, чтобы не выделять их во время игры"""
+        while len(self.free) < count and (self.max_size is None or len(self.free) < self.max_size):
+            self.free.append(self.factory(*args))
+            self.created += 1
+
+    def get_stats(self) -> dict:
+        """Статистика пула"""
+        return {
+            'name': self.name,
+            'in_use': self.in_use,
+            'free': len(self.free),
+            'high_water': self.high_water,
+            'created': self.created,
+            'reused': self.reused,
+            'discarded': self.discarded,
+        }
@@ -0,0 +1,140 @@
+"""
+Модуль для профилирования кадров по запросу
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+import config
+
+
+PROFILE_PHASES = ('frame', 'events', 'update', 'draw')
+
+
+class FrameProfiler:
+    """
+    Запись профиля N кадров игрового цикла.
+
+    Профилируется только выбранная фаза кадра: весь кадр, обработка
+    событий, обновление или отрисовка. Пока идёт запись, cProfile
+    включается на время этой фазы, а поток-сэмплер раз в
+    PROFILE_SAMPLE_INTERVAL_MS снимает стек главного потока
+    (sys._current_frames). По окончании пишутся файл pstats и свёрнутые
+    стеки ("a;b;c число") для построения flamegraph.
+    Вне записи begin/end стоят одну проверку атрибута.
+    """
+
+    def __init__(self, frames: int = None, output_dir: str = None):
+        self.frames = frames if frames is not None else config.PROFILE_FRAMES
+        self.output_dir = output_dir if output_dir is not None else config.PROFILE_DIR
+        self.phase = None  # Фаза текущей записи; None - запись не идёт
+        self.frames_left = 0
+        self.last_paths = None
+
+        self._profile = None
+        self._in_phase = False
+        self._stacks = Counter()
+        self._sampler = None
+        self._stop_sampler = threading.Event()
+        self._main_thread_id = threading.main_thread().ident
+
+    @property
+    def active(self) -> bool:
+        return self.phase is not None
+
+    def start(self, phase: str = None, frames: int = None):
+        """Начать запись фазы phase на frames кадров"""
+        phase = phase or config.PROFILE_DEFAULT_PHASE
+        if phase not in PROFILE_PHASES:
+            print(f"Неизвестная фаза профилирования '{phase}', доступны: {', '.join(PROFILE_PHASES)}")
+            return
+        if self.active:
+            return
+        self.phase = phase
+        self.frames_left = frames if frames is not None else self.frames
+        self._profile = cProfile.Profile()
+        self._stacks = Counter()
+        self._stop_sampler.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name='frame-profiler', daemon=True)
+        self._sampler.start()
+        print(f"Профилирование: фаза {phase}, кадров {self.frames_left}")
+
+    def toggle(self):
+        """Переключение записи (клавиша PROFILE_KEY)"""
+        if self.active:
+            self.stop()
+        else:
+            self.start()
+
+    def begin(self, phase: str):
+        """Начало фазы кадра"""
+        if phase == self.phase:
+            self._in_phase = True
+            self._profile.enable()
+
+    def end(self, phase: str):
+        """Конец фазы кадра"""
+        if phase == self.phase and self._in_phase:
+            self._profile.disable()
+            self._in_phase = False
+
+    def end_frame(self):
+        """Конец кадра: отсчёт записанных кадров"""
+        if self.phase is None:
+            return
+        self.frames_left -= 1
+        if self.frames_left <= 0:
+            self.stop()
+
+    def _sample_loop(self):
+        """Поток-сэмплер: стек главного потока, пока идёт нужная фаза"""
+        interval = config.PROFILE_SAMPLE_INTERVAL_MS / 1000.0
+        stacks = self._stacks
+        while not self._stop_sampler.wait(interval):
+            if not self._in_phase:
+                continue
+            frame = sys._current_frames().get(self._main_thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if names:
+                names.reverse()
+                stacks[';'.join(names)] += 1
+
+    def stop(self):
+        """Завершение записи и сохранение результатов"""
+        if not self.active:
+            return
+        self.end(self.phase)
+        self._stop_sampler.set()
+        self._sampler.join()
+        self._sampler = None
+
+        if not self._profile.getstats():
+            print(f"Профиль фазы {self.phase} пуст: фаза ни разу не выполнялась")
+        else:
+            try:
+                self.last_paths = self._write()
+                print(f"Профиль сохранён: {', '.join(self.last_paths)}")
+                pstats.Stats(self._profile).sort_stats('cumulative').print_stats(config.PROFILE_PRINT_TOP)
+            except OSError as e:
+                print(f"Ошибка сохранения профиля: {e}")
+        self.phase = None
+        self._profile = None
+
+    def _write(self):
+        """Файлы pstats и свёрнутых стеков; возвращает их пути"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{time.strftime('%Y%m%d_%H%M%S')}_{self.phase}")
+        stats_path = base + '.pstats'
+        self._profile.dump_stats(stats_path)
+        collapsed_path = base + '.collapsed'
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for stack, count in self._stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return stats_path, collapsed_path
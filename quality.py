@@ -0,0 +1,88 @@
+"""
+Модуль для адаптивного управления качеством графики
+"""
+from collections import deque
+import config
+
+
+class QualityGovernor:
+    """
+    Регулятор качества по бюджету времени кадра.
+
+    Сглаженное время работы кадра до display.flip (ожидание vsync - не
+    перегрузка) сравнивается с бюджетом (1000 / FPS). Если оно
+    дольше QUALITY_DOWNGRADE_FRAMES кадров выше верхнего порога - качество
+    снижается на ступень, если дольше QUALITY_UPGRADE_FRAMES кадров ниже
+    нижнего - повышается. Между порогами счётчики сбрасываются (гистерезис).
+    Смены уровня получают подписчики (в игре - и телеметрия партии).
+    """
+
+    def __init__(self, frame_timer, levels: list = None, start_level: int = None):
+        self.frame_timer = frame_timer
+        self.levels = levels if levels is not None else config.QUALITY_LEVELS
+        if start_level is None:
+            start_level = config.QUALITY_DEFAULT_LEVEL
+        self.level_index = max(0, min(start_level, len(self.levels) - 1))
+
+        self.smoothed_ms = 0.0
+        self._over_budget_frames = 0
+        self._under_budget_frames = 0
+        self._cooldown_frames = 0
+
+        # Последние смены: (номер кадра, старый уровень, новый уровень, время кадра)
+        self.transitions = deque(maxlen=config.QUALITY_TRANSITION_HISTORY)
+        self.listeners = []
+
+    @property
+    def level(self) -> dict:
+        """Текущие настройки качества"""
+        return self.levels[self.level_index]
+
+    def add_listener(self, callback):
+        """Подписка на смену уровня; callback(level) вызывается сразу и при каждой смене"""
+        self.listeners.append(callback)
+        callback(self.level)
+
+    def update(self):
+        """Учесть время последнего кадра (вызывается раз в кадр после замера)"""
+        frame_ms = self.frame_timer.last_work_ms
+        if self.smoothed_ms == 0.0:
+            self.smoothed_ms = frame_ms
+        else:
+            self.smoothed_ms += (frame_ms - self.smoothed_ms) * config.QUALITY_SMOOTHING
+
+        if self._cooldown_frames > 0:
+            self._cooldown_frames -= 1
+            return
+
+        budget = self.frame_timer.budget_ms
+        if self.smoothed_ms > budget * config.QUALITY_DOWNGRADE_RATIO:
+            self._over_budget_frames += 1
+            self._under_budget_frames = 0
+        elif self.smoothed_ms < budget * config.QUALITY_UPGRADE_RATIO:
+            self._under_budget_frames += 1
+            self._over_budget_frames = 0
+        else:
+            self._over_budget_frames = 0
+            self._under_budget_frames = 0
+
+        if self._over_budget_frames >= config.QUALITY_DOWNGRADE_FRAMES and self.level_index > 0:
+            self.set_level(self.level_index - 1)
+        elif (self._under_budget_frames >= config.QUALITY_UPGRADE_FRAMES and
+              self.level_index < len(self.levels) - 1):
+            self.set_level(self.level_index + 1)
+
+    def set_level(self, index: int):
+        """Переключение уровня качества с уведомлением подписчиков"""
+        index = max(0, min(index, len(self.levels) - 1))
+        if index == self.level_index:
+            return
+        self.transitions.append(
+            (self.frame_timer.frame_index, self.level_index, index, round(self.smoothed_ms, 2))
+        )
+        self.level_index = index
+        self._over_budget_frames = 0
+        self._under_budget_frames = 0
+        self._cooldown_frames = config.QUALITY_COOLDOWN_FRAMES
+        for callback in self.listeners:
+            callback(self.level)
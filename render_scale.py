@@ -0,0 +1,59 @@
+"""
+Модуль для отрисовки во внутреннем разрешении
+"""
+import pygame
+import config
+from surfaces import create_surface
+
+
+def to_render_pos(pos):
+    """Перевод координат окна (event.pos, mouse.get_pos) во внутреннее разрешение"""
+    window = pygame.display.get_surface()
+    if window is None:
+        return pos
+    width, height = window.get_size()
+    if (width, height) == (config.WIDTH, config.HEIGHT) or not width or not height:
+        return pos
+    return (int(pos[0] * config.WIDTH / width), int(pos[1] * config.HEIGHT / height))
+
+
+def get_mouse_pos():
+    """Положение мыши во внутреннем разрешении"""
+    return to_render_pos(pygame.mouse.get_pos())
+
+
+class RenderTarget:
+    """
+    Окно и поверхность, в которую рисует игра.
+
+    При RENDER_SCALE < 1 игра рисует во внеэкранную поверхность
+    WIDTH x HEIGHT, и она раз за кадр растягивается на окно в present().
+    Заливки, оверлеи и частицы тогда обходятся дешевле пропорционально
+    квадрату масштаба; остаётся одно масштабирование на кадр.
+    """
+
+    def __init__(self):
+        self.window = pygame.display.set_mode((config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT))
+        self.scaled = self.window.get_size() != (config.WIDTH, config.HEIGHT)
+        if self.scaled:
+            self.surface = create_surface((config.WIDTH, config.HEIGHT))
+        else:
+            self.surface = self.window
+
+    def compose(self):
+        """Перенос кадра в окно (масштабирование, если рисуем не в окно)"""
+        if self.scaled:
+            window = pygame.display.get_surface()
+            if config.RENDER_SCALE_SMOOTH:
+                pygame.transform.smoothscale(self.surface, window.get_size(), window)
+            else:
+                pygame.transform.scale(self.surface, window.get_size(), window)
+
+    def flip(self):
+        """Показ кадра; с vsync здесь может быть ожидание обратного хода луча"""
+        pygame.display.flip()
+
+    def present(self):
+        """Вывод кадра на экран"""
+        self.compose()
+        self.flip()
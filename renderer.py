@@ -0,0 +1,275 @@
+"""
+Модуль для абстракции отрисовки
+"""
+from abc import ABC, abstractmethod
+import pygame
+from surfaces import create_surface
+
+
+# Цвет-ключ промежуточных поверхностей для полупрозрачных фигур
+BLEND_COLORKEY = (255, 0, 255)
+
+
+class Renderer(ABC):
+    """
+    Базовый интерфейс отрисовки.
+
+    Игровые объекты и UI рисуют только через эти методы, поэтому бэкенд
+    можно заменить: PygameRenderer рисует на поверхность, NullRenderer
+    лишь считает вызовы, RecordingRenderer записывает список команд кадра.
+    Цвет с альфа-каналом (r, g, b, a) рисуется с полупрозрачностью.
+    Методы рисования абстрактные: бэкенд без какого-либо из них нельзя
+    создать.
+    """
+
+    def __init__(self):
+        self.draw_calls = {}
+        self.frame_draw_calls = 0
+
+    def _count(self, kind: str, amount: int = 1):
+        """Учёт вызова отрисовки"""
+        self.draw_calls[kind] = self.draw_calls.get(kind, 0) + amount
+        self.frame_draw_calls += amount
+
+    def begin_frame(self):
+        """Начало кадра: сброс счётчиков"""
+        self.draw_calls.clear()
+        self.frame_draw_calls = 0
+
+    @abstractmethod
+    def get_size(self):
+        """Размер области отрисовки"""
+
+    @abstractmethod
+    def fill(self, color, rect=None):
+        """Заливка экрана или прямоугольника"""
+
+    @abstractmethod
+    def rect(self, color, rect, width: int = 0, border_radius: int = 0):
+        """Прямоугольник"""
+
+    @abstractmethod
+    def polygon(self, color, points):
+        """Многоугольник"""
+
+    @abstractmethod
+    def circle(self, color, center, radius: int):
+        """Круг"""
+
+    @abstractmethod
+    def sprite(self, surface: pygame.Surface, position):
+        """Вывод готовой поверхности (position - точка или Rect)"""
+
+    @abstractmethod
+    def blits(self, sequence):
+        """
+        Пакетный вывод поверхностей: последовательность (surface, position)
+        или (surface, position, area), где area - часть источника (например, спрайт атласа)
+        """
+
+    @abstractmethod
+    def text(self, font: pygame.font.Font, text: str, color, **anchor) -> pygame.Rect:
+        """
+        Вывод текста. anchor - позиционирование как в Surface.get_rect
+        (например center=(x, y) или topleft=(x, y)). Возвращает Rect текста.
+        """
+
+
+class PygameRenderer(Renderer):
+    """Отрисовка средствами pygame на поверхность"""
+
+    def __init__(self, target: pygame.Surface, audit=None):
+        """
+        :param target: Поверхность, на которую идёт отрисовка.
+        :param audit: Необязательный surfaces.BlitAudit для поиска медленных блитов.
+        """
+        super().__init__()
+        self.target = target
+        self.audit = audit
+        # Промежуточные поверхности формата дисплея для полупрозрачных
+        # заливок и кругов: размер -> Surface. Прозрачность задаётся
+        # альфой всей поверхности - это дешевле попиксельной альфы.
+        self._fill_surfaces = {}
+        self._shape_surfaces = {}
+
+    def begin_frame(self):
+        super().begin_frame()
+        if self.audit is not None:
+            self.audit.begin_frame()
+
+    def get_size(self):
+        return self.target.get_size()
+
+    def _get_fill_surface(self, size):
+        """Переиспользуемая непрозрачная поверхность для заливок"""
+        surface = self._fill_surfaces.get(size)
+        if surface is None:
+            surface = create_surface(size)
+            self._fill_surfaces[size] = surface
+        return surface
+
+    def _get_shape_surface(self, size):
+        """Переиспользуемая поверхность с цветом-ключом для фигур"""
+        surface = self._shape_surfaces.get(size)
+        if surface is None:
+            surface = create_surface(size, colorkey=BLEND_COLORKEY)
+            self._shape_surfaces[size] = surface
+        return surface
+
+    def fill(self, color, rect=None):
+        self._count('fill')
+        if len(color) == 4 and color[3] < 255:
+            if rect is None:
+                rect = self.target.get_rect()
+            rect = pygame.Rect(rect)
+            surface = self._get_fill_surface(rect.size)
+            surface.fill(color[:3])
+            surface.set_alpha(color[3])
+            self.target.blit(surface, rect.topleft)
+        elif rect is None:
+            self.target.fill(color)
+        else:
+            self.target.fill(color, rect)
+
+    def rect(self, color, rect, width: int = 0, border_radius: int = 0):
+        self._count('rect')
+        pygame.draw.rect(self.target, color, rect, width, border_radius=border_radius)
+
+    def polygon(self, color, points):
+        self._count('polygon')
+        pygame.draw.polygon(self.target, color, points)
+
+    def circle(self, color, center, radius: int):
+        self._count('circle')
+        if len(color) == 4 and color[3] < 255:
+            # Полупрозрачный круг рисуется через промежуточную поверхность
+            size = (radius * 2, radius * 2)
+            surface = self._get_shape_surface(size)
+            surface.fill(BLEND_COLORKEY)
+            pygame.draw.circle(surface, color[:3], (radius, radius), radius)
+            surface.set_alpha(color[3])
+            self.target.blit(surface, (int(center[0]) - radius, int(center[1]) - radius))
+        else:
+            pygame.draw.circle(self.target, color, center, radius)
+
+    def sprite(self, surface: pygame.Surface, position):
+        self._count('sprite')
+        if self.audit is not None:
+            self.audit.check(surface, self.target)
+        self.target.blit(surface, position)
+
+    def blits(self, sequence):
+        self._count('blits')
+        if self.audit is not None:
+            for item in sequence:
+                self.audit.check(item[0], self.target)
+        self.target.blits(sequence, doreturn=False)
+
+    def text(self, font: pygame.font.Font, text: str, color, **anchor) -> pygame.Rect:
+        self._count('text')
+        surface = font.render(text, True, color)
+        text_rect = surface.get_rect(**anchor)
+        if self.audit is not None:
+            self.audit.check(surface, self.target)
+        self.target.blit(surface, text_rect)
+        return text_rect
+
+
+class NullRenderer(Renderer):
+    """Бэкенд без растеризации: только считает вызовы отрисовки"""
+
+    def __init__(self, size=(0, 0)):
+        super().__init__()
+        self.size = size
+
+    def get_size(self):
+        return self.size
+
+    def fill(self, color, rect=None):
+        self._count('fill')
+
+    def rect(self, color, rect, width: int = 0, border_radius: int = 0):
+        self._count('rect')
+
+    def polygon(self, color, points):
+        self._count('polygon')
+
+    def circle(self, color, center, radius: int):
+        self._count('circle')
+
+    def sprite(self, surface: pygame.Surface, position):
+        self._count('sprite')
+
+    def blits(self, sequence):
+        self._count('blits')
+
+    def text(self, font: pygame.font.Font, text: str, color, **anchor) -> pygame.Rect:
+        self._count('text')
+        # Размер текста считается без рендера, чтобы раскладка оставалась верной
+        text_rect = pygame.Rect((0, 0), font.size(text))
+        for name, value in anchor.items():
+            setattr(text_rect, name, value)
+        return text_rect
+
+
+class RecordingRenderer(NullRenderer):
+    """Бэкенд, записывающий список команд кадра (без растеризации)"""
+
+    def __init__(self, size=(0, 0)):
+        super().__init__(size)
+        self.commands = []
+
+    def begin_frame(self):
+        super().begin_frame()
+        self.commands = []
+
+    def fill(self, color, rect=None):
+        super().fill(color, rect)
+        self.commands.append(('fill', color, rect))
+
+    def rect(self, color, rect, width: int = 0, border_radius: int = 0):
+        super().rect(color, rect, width, border_radius)
+        self.commands.append(('rect', color, pygame.Rect(rect), width, border_radius))
+
+    def polygon(self, color, points):
+        super().polygon(color, points)
+        self.commands.append(('polygon', color, [tuple(point) for point in points]))
+
+    def circle(self, color, center, radius: int):
+        super().circle(color, center, radius)
+        self.commands.append(('circle', color, tuple(center), radius))
+
+    def sprite(self, surface: pygame.Surface, position):
+        super().sprite(surface, position)
+        # Rect объектов изменяемый - сохраняем копию положения
+        if isinstance(position, pygame.Rect):
+            position = pygame.Rect(position)
+        else:
+            position = tuple(position)
+        self.commands.append(('sprite', surface, position))
+
+    def blits(self, sequence):
+        super().blits(sequence)
+        self.commands.append(('blits', list(sequence)))
+
+    def text(self, font: pygame.font.Font, text: str, color, **anchor) -> pygame.Rect:
+        text_rect = super().text(font, text, color, **anchor)
+        self.commands.append(('text', text, color, text_rect))
+        return text_rect
+
+
+RENDERER_BACKENDS = {
+    'pygame': PygameRenderer,
+    'null': NullRenderer,
+    'recording': RecordingRenderer,
+}
+
+
+def create_renderer(backend: str, surface: pygame.Surface, audit=None) -> Renderer:
+    """Создание бэкенда отрисовки по имени ('pygame', 'null', 'recording')"""
+    if backend == 'pygame':
+        return PygameRenderer(surface, audit)
+    if backend in RENDERER_BACKENDS:
+        return RENDERER_BACKENDS[backend](surface.get_size())
+    print(f"Неизвестный бэкенд отрисовки '{backend}', используется pygame")
+    return PygameRenderer(surface, audit)
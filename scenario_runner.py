@@ -0,0 +1,203 @@
+"""
+Модуль для прогона нагрузочных сценариев
+
+Сценарий - JSON-файл в каталоге scenarios: переопределения констант
+config, настроек уровня сложности, число тиков и постоянные взрывы.
+
+Запуск (все сценарии или перечисленные, без окна или с отрисовкой):
+    python scenario_runner.py [render] [имя_сценария ...]
+"""
+import json
+import os
+import random
+import sys
+import time
+import config
+from autoplay import AutoPlayer
+from frame_timing import LoadProfile
+
+
+ENDLESS_LIVES = 10 ** 9
+
+# Что считать "числом объектов" в таблице сценария
+PROFILE_COUNTERS = {
+    'balls': ('шаров', lambda game_state: len(game_state.balls)),
+    'shelves': ('полочек', lambda game_state: len(game_state.shelves)),
+    'particles': ('частиц', lambda game_state: len(game_state.particle_system.particles)),
+}
+
+
+def count_bucket(count: int) -> int:
+    """Округление числа объектов вниз до 1-2-...-9 x 10^k: строки таблицы по порядкам"""
+    if count < 10:
+        return count
+    magnitude = 10 ** (len(str(count)) - 1)
+    return count // magnitude * magnitude
+
+
+def load_scenario(name: str) -> dict:
+    """Загрузка сценария по имени (без .json) или пути"""
+    path = name if name.endswith('.json') else os.path.join(config.SCENARIOS_DIR, name + '.json')
+    with open(path, encoding='utf-8') as f:
+        scenario = json.load(f)
+    scenario.setdefault('name', os.path.splitext(os.path.basename(path))[0])
+    return scenario
+
+
+def list_scenarios() -> list:
+    """Имена всех сценариев каталога"""
+    if not os.path.isdir(config.SCENARIOS_DIR):
+        return []
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(config.SCENARIOS_DIR)
+                  if name.endswith('.json'))
+
+
+class ScenarioRunner:
+    """
+    Прогон одного сценария: фиксированное число тиков без окна (только
+    логика) или с отрисовкой (update + draw через Game). Жизни не
+    кончаются, чтобы число объектов росло до лимитов сценария.
+
+    Переопределения config и настроек сложности действуют только на
+    время прогона и потом откатываются.
+    """
+
+    def __init__(self, scenario: dict, render: bool = False, ticks: int = None):
+        self.scenario = scenario
+        self.render = render
+        self.ticks = ticks if ticks is not None else scenario.get('ticks', 1800)
+        label, counter = PROFILE_COUNTERS[scenario.get('profile_by', 'balls')]
+        self.profile = LoadProfile(key=lambda game_state: count_bucket(counter(game_state)), label=label)
+        self.samples = []
+        self.elapsed_s = 0.0
+        self._saved_config = {}
+        self._saved_settings = None
+
+    def _apply_overrides(self):
+        """Подмена констант сценария"""
+        # Прогоны стенда не пишутся в телеметрию базы игрока
+        self._saved_config['TELEMETRY_ENABLED'] = config.TELEMETRY_ENABLED
+        config.TELEMETRY_ENABLED = False
+        for name, value in self.scenario.get('config', {}).items():
+            if not hasattr(config, name):
+                print(f"Сценарий {self.scenario['name']}: неизвестная настройка {name}")
+                continue
+            self._saved_config.setdefault(name, getattr(config, name))
+            setattr(config, name, value)
+
+        level = self.scenario.get('difficulty', 2)
+        settings = config.DIFFICULTY_SETTINGS[level]
+        self._saved_settings = (level, dict(settings))
+        settings.update(self.scenario.get('difficulty_settings', {}))
+
+    def _restore_overrides(self):
+        """Возврат констант"""
+        for name, value in self._saved_config.items():
+            setattr(config, name, value)
+        self._saved_config = {}
+        if self._saved_settings is not None:
+            level, settings = self._saved_settings
+            config.DIFFICULTY_SETTINGS[level].clear()
+            config.DIFFICULTY_SETTINGS[level].update(settings)
+            self._saved_settings = None
+
+    def run(self):
+        """Прогон сценария"""
+        self._apply_overrides()
+        try:
+            self._run()
+        finally:
+            self._restore_overrides()
+
+    def _run(self):
+        game = None
+        if self.render:
+            import main
+            game = main.Game()
+            game_state = game.game_state
+        else:
+            from game_state import GameState
+            game_state = GameState()
+
+        # Сид - до restart_game: первые шары появляются уже в нём
+        random.seed(1)
+        game_state.set_difficulty(self.scenario.get('difficulty', 2))
+        game_state.show_difficulty_screen = False
+        game_state.restart_game()
+        game_state.lives = ENDLESS_LIVES
+        player = AutoPlayer() if self.scenario.get('autoplay', False) else None
+
+        explosions = self.scenario.get('explosions_per_tick', 0)
+        rng = random.Random(1)
+        particle_system = game_state.particle_system
+        samples = self.samples
+        profile = self.profile
+
+        run_start = time.perf_counter()
+        for _ in range(self.ticks):
+            # Бот - часть стенда, его время в замер не входит
+            if player is not None:
+                player.update(game_state)
+            start = time.perf_counter()
+            for _ in range(explosions):
+                particle_system.add_explosion(rng.uniform(0, config.WIDTH), rng.uniform(0, config.HEIGHT))
+            game_state.update()
+            if game is not None:
+                game.draw()
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            samples.append(elapsed_ms)
+            profile.add(game_state, elapsed_ms)
+        self.elapsed_s = time.perf_counter() - run_start
+
+        if game is not None:
+            game.gc_control.uninstall()
+
+    def get_summary(self) -> dict:
+        """Итог прогона"""
+        ordered = sorted(self.samples)
+        count = len(ordered)
+        mean_ms = sum(ordered) / count if count else 0.0
+        return {
+            'name': self.scenario['name'],
+            'mode': 'render' if self.render else 'headless',
+            'ticks': count,
+            'ticks_per_s': count / self.elapsed_s if self.elapsed_s else 0.0,
+            'mean_ms': mean_ms,
+            'p95_ms': ordered[min(count - 1, int(count * 0.95))] if count else 0.0,
+            'max_ms': ordered[-1] if count else 0.0,
+            'budget_share': mean_ms / (1000.0 / config.FPS),
+        }
+
+    def get_report(self) -> str:
+        """Таблица сценария по числу объектов"""
+        summary = self.get_summary()
+        return (
+            f"Сценарий {summary['name']} ({summary['mode']}): {self.scenario.get('description', '')}\n"
+            + self.profile.get_report()
+        )
+
+
+def run_all(names=None, render: bool = False):
+    """Прогон сценариев и сводная таблица"""
+    summaries = []
+    for name in names or list_scenarios():
+        runner = ScenarioRunner(load_scenario(name), render)
+        runner.run()
+        print(runner.get_report())
+        print()
+        summaries.append(runner.get_summary())
+
+    print(f"{'Сценарий':<16}{'режим':>10}{'тиков':>8}{'тиков/с':>10}{'мс':>9}"
+          f"{'p95':>9}{'худший':>9}{'% бюджета':>11}")
+    for summary in summaries:
+        print(f"{summary['name']:<16}{summary['mode']:>10}{summary['ticks']:>8}"
+              f"{summary['ticks_per_s']:>10.0f}{summary['mean_ms']:>9.3f}{summary['p95_ms']:>9.3f}"
+              f"{summary['max_ms']:>9.3f}{summary['budget_share'] * 100:>11.1f}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    render = bool(args) and args[0] == 'render'
+    if render:
+        args = args[1:]
+    run_all(args, render)
@@ -9,16 +9,26 @@ import config
 class Shelf:
     """Класс полочки, от которой отскакивают шары"""
     
+    __slots__ = ('width', 'height', 'x', 'y', 'color', 'rect', 'angle', 'handle')
+    
     def __init__(self):
-        self.width = random.randint(config.SHELF_MIN_WIDTH, config.SHELF_MAX_WIDTH)
         self.height = config.SHELF_HEIGHT
-        self.x = random.randint(0, config.WIDTH - self.width)
-        self.y = random.randint(config.HEIGHT // 4, config.HEIGHT // 2)
         self.color = config.LIGHT_GRAY
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect = pygame.Rect(0, 0, 0, self.height)
         self.angle = 0  # Угол не используется для отрисовки rect
+        self.handle = -1  # Дескриптор в EntityStore
+        self.reset()
+    
+    def reset(self):
+        """Новое случайное положение полочки (для повторного использования из пула)"""
+        self.width = random.randint(config.SHELF_MIN_WIDTH, config.SHELF_MAX_WIDTH)
+        self.x = random.randint(0, config.WIDTH - self.width)
+        self.y = random.randint(config.HEIGHT // 4, config.HEIGHT // 2)
+        self.rect.x = self.x
+        self.rect.y = self.y
+        self.rect.width = self.width
     
-    def draw(self, screen: pygame.Surface):
+    def draw(self, renderer):
         """Отрисовка полочки"""
-        pygame.draw.rect(screen, self.color, self.rect)
+        renderer.rect(self.color, self.rect)
 
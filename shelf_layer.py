@@ -0,0 +1,75 @@
+"""
+Модуль для кэшированного слоя полочек
+"""
+import pygame
+import config
+from asset_cache import get_asset_cache
+from renderer import BLEND_COLORKEY
+from surfaces import create_surface
+
+
+class ShelfLayer:
+    """
+    Все полочки, заранее нарисованные на одну поверхность.
+
+    Полочки неподвижны и меняются только при появлении и удалении, поэтому
+    слой перестраивается лишь когда меняется version хранилища полочек,
+    а в остальных кадрах выводится одним блитом. Текстура доски
+    масштабируется один раз под самую широкую полочку; более узкие
+    получают её левую часть, без масштабирования под каждую ширину.
+    """
+
+    def __init__(self):
+        self.surface = None
+        self.position = (0, 0)
+        self.rebuilds = 0
+        self._version = None
+        self.texture = self._load_texture()
+
+    def _load_texture(self):
+        """Текстура доски или None (тогда полочки заливаются цветом)"""
+        if not (config.USE_IMAGES and config.SHELF_TEXTURED):
+            return None
+        try:
+            return get_asset_cache().get_image(
+                config.BOARD_IMAGE_PATH, (config.SHELF_MAX_WIDTH, config.SHELF_HEIGHT))
+        except (pygame.error, OSError) as e:
+            print(f"Не удалось загрузить изображение доски: {e}")
+            return None
+
+    def invalidate(self):
+        """Принудительная перестройка при следующей отрисовке"""
+        self._version = None
+
+    def _rebuild(self, shelves):
+        """Отрисовка всех полочек на поверхность по их общему прямоугольнику"""
+        self.rebuilds += 1
+        if not shelves:
+            self.surface = None
+            return
+
+        bounds = shelves[0].rect.unionall([shelf.rect for shelf in shelves[1:]])
+        self.position = bounds.topleft
+        if self.surface is None or self.surface.get_size() != bounds.size:
+            self.surface = create_surface(bounds.size, colorkey=BLEND_COLORKEY)
+        else:
+            self.surface.fill(BLEND_COLORKEY)
+
+        for shelf in shelves:
+            local = shelf.rect.move(-bounds.x, -bounds.y)
+            if self.texture is not None:
+                self.surface.blit(self.texture, local, (0, 0, local.width, local.height))
+            else:
+                self.surface.fill(shelf.color, local)
+
+    def draw(self, renderer, shelves):
+        """
+        Вывод слоя; перестройка - только если состав полочек изменился.
+
+        :param shelves: EntityStore полочек.
+        """
+        if shelves.version != self._version:
+            self._rebuild(shelves.items)
+            self._version = shelves.version
+        if self.surface is not None:
+            renderer.sprite(self.surface, self.position)
@@ -0,0 +1,95 @@
+"""
+Модуль для безоконного прогона игровой логики
+
+Запуск (бот играет сам, окно не создаётся, жизни не кончаются):
+    python simulator.py [число_тиков] [уровень_сложности]
+
+Лимиты объектов задаются переменными окружения CATCHBALL_MAX_BALLS
+и CATCHBALL_MAX_SHELVES.
+"""
+import sys
+import time
+import config
+from game_state import GameState
+from autoplay import AutoPlayer
+from frame_timing import LoadProfile
+
+
+class Simulator:
+    """
+    Игровая логика без окна и отрисовки: тик за тиком, с ботом вместо игрока.
+
+    Время каждого тика записывается в разрезе множителя сложности, чтобы
+    видеть, как растёт стоимость тика по ходу партии. Проигранная партия
+    сразу перезапускается; в режиме endless жизни не кончаются, и одна
+    партия доходит до высоких множителей сложности.
+    """
+
+    ENDLESS_LIVES = 10 ** 9
+
+    def __init__(self, difficulty: int = 2, autoplay: bool = True, endless: bool = False):
+        self.game_state = GameState()
+        self.game_state.set_difficulty(difficulty)
+        self.game_state.show_difficulty_screen = False
+        self.player = AutoPlayer() if autoplay else None
+        self.endless = endless
+        self._restart()
+
+        self.ticks = 0
+        self.games = 1
+        self.catches = 0
+        self.misses = 0
+        self.best_score = 0
+        self.profile = LoadProfile()
+
+    def step(self) -> float:
+        """Один тик игры; возвращает его длительность в миллисекундах"""
+        game_state = self.game_state
+        score, lives = game_state.score, game_state.lives
+
+        # Бот - часть стенда, а не игры: его время в замер не входит
+        if self.player is not None:
+            self.player.update(game_state)
+        start = time.perf_counter()
+        game_state.update()
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        self.ticks += 1
+        self.catches += max(0, game_state.score - score)
+        self.misses += max(0, lives - game_state.lives)
+        self.profile.add(game_state, elapsed_ms)
+
+        if game_state.game_over:
+            self.best_score = max(self.best_score, game_state.score)
+            self.games += 1
+            self._restart()
+        return elapsed_ms
+
+    def _restart(self):
+        """Новая партия"""
+        self.game_state.restart_game()
+        if self.endless:
+            self.game_state.lives = self.ENDLESS_LIVES
+        if self.player is not None:
+            self.player.reset()
+
+    def run(self, ticks: int):
+        """Прогон заданного числа тиков"""
+        for _ in range(ticks):
+            self.step()
+        self.best_score = max(self.best_score, self.game_state.score)
+
+    def get_report(self) -> str:
+        """Таблица времени тика по множителям сложности"""
+        return (
+            f"Тиков {self.ticks}, партий {self.games}, поймано {self.catches}, "
+            f"пропущено {self.misses}, лучший счёт {self.best_score} "
+            f"(шаров до {config.MAX_BALLS}, полочек до {config.MAX_SHELVES})\n"
+            + self.profile.get_report()
+        )
+
+
+if __name__ == "__main__":
+    simulator = Simulator(int(sys.argv[2]) if len(sys.argv) > 2 else 2, endless=True)
+    simulator.run(int(sys.argv[1]) if len(sys.argv) > 1 else 36000)
+    print(simulator.get_report())
@@ -0,0 +1,110 @@
+"""
+Модуль для дискового кэша синтезированных звуков
+"""
+import hashlib
+import json
+import os
+import config
+
+# Попытка импорта numpy для чтения буферов через memory-map
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Версия формата кэша. Увеличивается при изменении алгоритма синтеза,
+# чтобы старые буферы автоматически стали недействительными.
+CACHE_FORMAT_VERSION = 1
+
+
+class SoundBankCache:
+    """Кэш int16 PCM-буферов звуковых эффектов на диске"""
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir if cache_dir is not None else config.SOUND_CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, name: str, params: dict, mixer_format) -> str:
+        """
+        Ключ записи: хэш параметров генерации и формата микшера.
+
+        :param name: Имя звукового эффекта.
+        :param params: Параметры, переданные в генератор звука.
+        :param mixer_format: Результат pygame.mixer.get_init() (частота, размер, каналы).
+        """
+        payload = json.dumps({
+            'version': CACHE_FORMAT_VERSION,
+            'name': name,
+            'params': params,
+            'format': list(mixer_format),
+        }, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, name: str, key: str) -> str:
+        """Путь к файлу записи"""
+        return os.path.join(self.cache_dir, f"{name}-{key}.npy")
+
+    def load(self, name: str, params: dict, mixer_format):
+        """
+        Загрузить буфер из кэша.
+
+        Возвращает int16-массив, отображённый в память (mmap), или None,
+        если записи нет или она повреждена.
+        """
+        if not HAS_NUMPY:
+            return None
+
+        path = self._entry_path(name, self.make_key(name, params, mixer_format))
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+
+        try:
+            samples = np.load(path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"Ошибка чтения кэша звука '{name}': {e}")
+            self.misses += 1
+            return None
+
+        if samples.dtype != np.int16:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return samples
+
+    def store(self, name: str, params: dict, mixer_format, samples) -> bool:
+        """Сохранить буфер в кэш, удалив устаревшие записи этого эффекта"""
+        if not HAS_NUMPY:
+            return False
+
+        key = self.make_key(name, params, mixer_format)
+        path = self._entry_path(name, key)
+        tmp_path = path + '.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Пишем во временный файл и атомарно переименовываем,
+            # чтобы прерванная запись не оставила битый буфер
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(samples, dtype=np.int16))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Ошибка записи кэша звука '{name}': {e}")
+            return False
+
+        self._remove_stale(name, key)
+        return True
+
+    def _remove_stale(self, name: str, key: str):
+        """Удаление записей эффекта, созданных с другими параметрами"""
+        prefix = f"{name}-"
+        current = os.path.basename(self._entry_path(name, key))
+        try:
+            for filename in os.listdir(self.cache_dir):
+                if filename.startswith(prefix) and filename != current:
+                    os.remove(os.path.join(self.cache_dir, filename))
+        except OSError:
+            pass
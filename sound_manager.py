@@ -13,6 +13,34 @@ try:
 except ImportError:
     HAS_NUMPY = False
 
+from sound_cache import SoundBankCache
+from voice_manager import VoiceManager
+from music_stream import MusicStream
+
+
+# Параметры генерации звуковых эффектов (аргументы _generate_samples).
+# Изменение параметров автоматически делает недействительной запись в кэше.
+SOUND_EFFECTS = {
+    # Звук поимки шара - быстрый, восходящий приятный тон/аккорд
+    'catch': dict(frequencies=[800, 1200], duration=0.1, volume=0.25,
+                  attack_duration=0.005, release_duration=0.05),
+    # Звук промаха - низкий, нисходящий, немного грубый тон (square wave)
+    'miss': dict(frequencies=(400, 200), duration=0.4, volume=0.3,
+                 attack_duration=0.02, release_duration=0.1, waveform='square'),
+    # Звук отскока от полочки - очень короткий, ударный звук с легким свипом
+    'bounce': dict(frequencies=(700, 600), duration=0.08, volume=0.2,
+                   attack_duration=0.001, release_duration=0.04),
+    # Звук повышения сложности - более долгий, торжественный восходящий свип
+    'levelup': dict(frequencies=(600, 1200), duration=0.7, volume=0.35,
+                    attack_duration=0.05, release_duration=0.2),
+    # Звук для кнопки или подтверждения
+    'confirm': dict(frequencies=900, duration=0.07, volume=0.2,
+                    attack_duration=0.005, release_duration=0.03),
+    # Звук для "Game Over"
+    'gameover': dict(frequencies=(250, 100), duration=1.0, volume=0.4,
+                     attack_duration=0.1, release_duration=0.5, waveform='sawtooth'),
+}
+
 
 class SoundManager:
     """Класс для управления звуковыми эффектами"""
@@ -20,11 +48,15 @@ class SoundManager:
     def __init__(self):
         self.sounds = {}
         self.music_playing = False
+        self.sound_cache = SoundBankCache() if config.SOUND_CACHE_ENABLED else None
+        self.voice_manager = None
+        self.music_stream = None
         
         if config.SOUND_ENABLED:
             # Увеличим частоту дискретизации для лучшего качества звука,
             # но 22050 тоже нормально. 44100 - стандарт CD качества.
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            self.voice_manager = VoiceManager()
             self._create_sounds()
     
     def _generate_sound(self, frequencies, duration: float, volume: float = 0.3, 
@@ -33,6 +65,24 @@ class SoundManager:
         """
         Генерация звукового эффекта.
         
+        Параметры совпадают с _generate_samples. Возвращает pygame.mixer.Sound или None.
+        """
+        samples = self._generate_samples(frequencies, duration, volume,
+                                         attack_duration, release_duration, waveform)
+        if samples is None:
+            return None
+        try:
+            return pygame.sndarray.make_sound(samples)
+        except Exception as e:
+            print(f"Ошибка при генерации звука: {e}")
+            return None
+    
+    def _generate_samples(self, frequencies, duration: float, volume: float = 0.3, 
+                          attack_duration: float = 0.01, release_duration: float = 0.05,
+                          waveform: str = 'sine'):
+        """
+        Синтез PCM-буфера звукового эффекта.
+        
         :param frequencies: Частота (float), список частот (list[float]) для аккорда,
                             или кортеж (start_freq, end_freq) для частотного свипа.
         :param duration: Длительность звука в секундах.
@@ -40,6 +90,7 @@ class SoundManager:
         :param attack_duration: Время нарастания громкости в начале звука (секунды).
         :param release_duration: Время затухания громкости в конце звука (секунды).
         :param waveform: Тип волны ('sine', 'square', 'sawtooth'). По умолчанию 'sine'.
+        :return: Массив int16 формы (frames, 2) или None.
         """
         if not HAS_NUMPY:
             return None
@@ -108,62 +159,42 @@ class SoundManager:
             arr = np.clip(arr, -max_sample_value, max_sample_value)
             
             # Преобразование в 16-битные целые числа
-            sound = pygame.sndarray.make_sound(arr.astype(np.int16))
-            return sound
+            return arr.astype(np.int16)
         except Exception as e:
             print(f"Ошибка при генерации звука: {e}")
             return None
     
     def _create_sounds(self):
-        """Создание звуковых эффектов программно"""
+        """Создание звуковых эффектов программно (или загрузка из кэша)"""
         if not HAS_NUMPY:
             print("Numpy не установлен. Звуки отключены. Установите: pip install numpy")
             return
         
-        try:
-            # Звук поимки шара - быстрый, восходящий приятный тон/аккорд
-            # Используем аккорд для более насыщенного звука и быстрый аттак/релиз
-            catch_sound = self._generate_sound(frequencies=[800, 1200], duration=0.1, volume=0.25, 
-                                               attack_duration=0.005, release_duration=0.05)
-            if catch_sound:
-                self.sounds['catch'] = catch_sound
-            
-            # Звук промаха - низкий, нисходящий, немного грубый тон (square wave)
-            miss_sound = self._generate_sound(frequencies=(400, 200), duration=0.4, volume=0.3, 
-                                              attack_duration=0.02, release_duration=0.1, waveform='square')
-            if miss_sound:
-                self.sounds['miss'] = miss_sound
-            
-            # Звук отскока от полочки - очень короткий, ударный звук с легким свипом
-            bounce_sound = self._generate_sound(frequencies=(700, 600), duration=0.08, volume=0.2, 
-                                                attack_duration=0.001, release_duration=0.04)
-            if bounce_sound:
-                self.sounds['bounce'] = bounce_sound
-            
-            # Звук повышения сложности - более долгий, торжественный восходящий свип
-            levelup_sound = self._generate_sound(frequencies=(600, 1200), duration=0.7, volume=0.35, 
-                                                 attack_duration=0.05, release_duration=0.2)
-            if levelup_sound:
-                self.sounds['levelup'] = levelup_sound
-            
-            # Добавим звук для кнопки или подтверждения (пример)
-            confirm_sound = self._generate_sound(frequencies=900, duration=0.07, volume=0.2, 
-                                                 attack_duration=0.005, release_duration=0.03)
-            if confirm_sound:
-                self.sounds['confirm'] = confirm_sound
-            
-            # Звук для "Game Over" (пример)
-            gameover_sound = self._generate_sound(frequencies=(250, 100), duration=1.0, volume=0.4,
-                                                  attack_duration=0.1, release_duration=0.5, waveform='sawtooth')
-            if gameover_sound:
-                self.sounds['gameover'] = gameover_sound
-
-        except Exception as e:
-            print(f"Ошибка создания звуков: {e}")
+        mixer_format = pygame.mixer.get_init()
+        for name, params in SOUND_EFFECTS.items():
+            try:
+                samples = None
+                if self.sound_cache is not None:
+                    samples = self.sound_cache.load(name, params, mixer_format)
+                
+                if samples is None:
+                    samples = self._generate_samples(**params)
+                    if samples is None:
+                        continue
+                    if self.sound_cache is not None:
+                        self.sound_cache.store(name, params, mixer_format, samples)
+                
+                # Буфер передаётся в микшер напрямую, без повторного синтеза
+                self.sounds[name] = pygame.mixer.Sound(buffer=samples)
+            except Exception as e:
+                print(f"Ошибка создания звука '{name}': {e}")
     
     def play_sound(self, sound_name: str):
-        """Воспроизведение звука"""
+        """Воспроизведение звука (запуск откладывается до update() в конце кадра)"""
         if config.SOUND_ENABLED and sound_name in self.sounds:
+            if self.voice_manager is not None:
+                self.voice_manager.trigger(sound_name, self.sounds[sound_name])
+                return
             try:
                 self.sounds[sound_name].play()
             except pygame.error as e:
@@ -173,16 +204,54 @@ class SoundManager:
             except Exception as e:
                 print(f"Неизвестная ошибка при воспроизведении звука '{sound_name}': {e}")
     
+    def update(self):
+        """Обновление звука раз в кадр: запуск накопленных эффектов и подача музыки"""
+        if self.voice_manager is not None:
+            try:
+                self.voice_manager.flush()
+            except Exception as e:
+                print(f"Ошибка при воспроизведении звуков: {e}")
+        if self.music_stream is not None:
+            try:
+                self.music_stream.pump()
+            except pygame.error:
+                pass
+    
     def play_music(self, loop: bool = True):
-        """Воспроизведение музыки"""
-        # Музыка по-прежнему требует файл, так что оставим заглушку
-        # Если нужно генерировать музыку, это значительно сложнее и выходит за рамки
-        # простых звуковых эффектов.
-        pass
+        """Воспроизведение музыки: из файла, если он задан, иначе процедурной"""
+        if not config.SOUND_ENABLED or self.music_playing:
+            return
+        
+        if config.SOUND_MUSIC:
+            try:
+                pygame.mixer.music.load(config.SOUND_MUSIC)
+                pygame.mixer.music.play(-1 if loop else 0)
+                self.music_playing = True
+            except pygame.error as e:
+                print(f"Ошибка воспроизведения музыки '{config.SOUND_MUSIC}': {e}")
+            return
+        
+        # Процедурная музыка генерируется потоком небольшими фрагментами
+        if not HAS_NUMPY or self.voice_manager is None:
+            return
+        channel = self.voice_manager.get_channel('music')
+        if channel is None:
+            return
+        self.music_stream = MusicStream(self._generate_samples, channel)
+        self.music_stream.start()
+        self.music_playing = True
+    
+    def set_music_tempo(self, multiplier: float):
+        """Темп процедурной музыки следует за множителем сложности"""
+        if self.music_stream is not None:
+            self.music_stream.set_tempo_scale(multiplier)
     
     def stop_music(self):
         """Остановка музыки"""
+        if self.music_stream is not None:
+            self.music_stream.stop()
+            self.music_stream = None
+            self.music_playing = False
         if self.music_playing:
             pygame.mixer.music.stop()
             self.music_playing = False
-
@@ -0,0 +1,94 @@
+"""
+Модуль для создания поверхностей в формате дисплея
+"""
+import pygame
+
+
+def _display_ready() -> bool:
+    """Есть ли окно, под формат которого можно конвертировать"""
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+
+def create_surface(size, alpha: bool = False, colorkey=None) -> pygame.Surface:
+    """
+    Создание поверхности в формате дисплея.
+
+    :param size: Размер (ширина, высота).
+    :param alpha: Нужна ли попиксельная прозрачность (convert_alpha).
+    :param colorkey: Цвет-ключ для непрозрачной поверхности (с RLEACCEL).
+    """
+    if alpha:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        return surface.convert_alpha() if _display_ready() else surface
+
+    surface = pygame.Surface(size)
+    if _display_ready():
+        surface = surface.convert()
+    if colorkey is not None:
+        surface.fill(colorkey)
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+    return surface
+
+
+def convert_for_display(surface: pygame.Surface, alpha: bool = None) -> pygame.Surface:
+    """
+    Приведение готовой поверхности (картинка, текст) к формату дисплея.
+
+    :param alpha: Сохранить попиксельную прозрачность; по умолчанию - если она есть у источника.
+    """
+    if not _display_ready():
+        return surface
+    if alpha is None:
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def load_image(path: str, alpha: bool = True) -> pygame.Surface:
+    """Загрузка изображения сразу в формате дисплея"""
+    return convert_for_display(pygame.image.load(path), alpha)
+
+
+def render_text(font: pygame.font.Font, text: str, color) -> pygame.Surface:
+    """Рендер статичного текста в формате дисплея"""
+    return convert_for_display(font.render(text, True, color), alpha=True)
+
+
+def formats_match(source: pygame.Surface, target: pygame.Surface) -> bool:
+    """
+    Совпадает ли формат источника с форматом цели блита.
+
+    Альфа-маска не сравнивается: convert_alpha-поверхность на непрозрачном
+    экране - быстрый путь смешивания. Медленный путь - разная глубина или
+    порядок каналов, когда SDL конвертирует пиксели при каждом блите.
+    """
+    if source.get_bitsize() != target.get_bitsize():
+        return False
+    return source.get_masks()[:3] == target.get_masks()[:3]
+
+
+class BlitAudit:
+    """Отладочный учёт блитов с форматом источника, отличным от цели"""
+
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
+        self.frame_mismatches = 0
+        self.total_mismatches = 0
+        self.last_frame_mismatches = 0
+
+    def begin_frame(self):
+        """Начало кадра: сохранение счётчика прошлого кадра"""
+        self.last_frame_mismatches = self.frame_mismatches
+        self.frame_mismatches = 0
+
+    def check(self, source: pygame.Surface, target: pygame.Surface):
+        """Проверка одного блита"""
+        if formats_match(source, target):
+            return
+        self.frame_mismatches += 1
+        self.total_mismatches += 1
+        if self.verbose:
+            print(
+                f"Медленный блит: источник {source.get_size()} "
+                f"{source.get_bitsize()} бит, маски {source.get_masks()}; "
+                f"цель {target.get_bitsize()} бит, маски {target.get_masks()}"
+            )
@@ -0,0 +1,380 @@
+"""
+Модуль для сессионной телеметрии (события игры и показатели производительности)
+
+Запуск как скрипта замеряет накладные расходы телеметрии:
+    python telemetry.py [число_секунд_игры]
+"""
+import os
+import sqlite3
+import sys
+import time
+from typing import List, Optional, Tuple
+import config
+
+
+class Telemetry:
+    """
+    Запись событий партии (поимка, промах, повышение сложности, пауза,
+    смена уровня качества графики) и ежесекундных замеров
+    производительности (FPS, p95 времени кадра, число частиц).
+
+    Записи копятся в памяти и сбрасываются в отдельную базу SQLite одной
+    транзакцией: раз в TELEMETRY_FLUSH_INTERVAL секунд, при переполнении
+    буфера или в конце партии. Итоги партий сразу добавляются в таблицу
+    суточных сводок, поэтому запросы для отчётов не обходят сырые данные.
+    """
+
+    EVENTS = ('catch', 'miss', 'level_up', 'pause', 'resume', 'game_over', 'quality')
+
+    def __init__(self, db_path: str = None, clock=None):
+        """
+        :param db_path: Файл базы (по умолчанию TELEMETRY_DB_PATH, не база рекордов).
+        :param clock: Источник времени в секундах (по умолчанию time.perf_counter).
+        """
+        self.db_path = db_path if db_path is not None else config.TELEMETRY_DB_PATH
+        self.clock = clock if clock is not None else time.perf_counter
+        self.conn = None
+        self._init_database()
+
+        self.session_id = None
+        self.session_start = 0.0
+        self.session_difficulty = None
+        self.quality_level = None  # Текущий уровень качества (индекс в QUALITY_LEVELS)
+        self._session_counts = {}
+        self._fps_sum = 0.0
+        self._p95_sum = 0.0
+        self._p95_max = 0.0
+        self._sample_count = 0
+
+        self._events = []  # (сессия, мс от начала, событие, значение)
+        self._samples = []  # (сессия, мс от начала, fps, среднее мс, p95 мс, частиц)
+        self._last_sample_time = 0.0
+        self._frames_since_sample = 0
+        self._last_flush_time = self.clock()
+
+        # Накладные расходы (для проверки, что телеметрия не мешает игре)
+        self.flush_count = 0
+        self.flush_ms_total = 0.0
+        self.flush_ms_max = 0.0
+        self.rows_written = 0
+
+    def _init_database(self):
+        """Открытие базы и создание таблиц телеметрии"""
+        try:
+            self.conn = sqlite3.connect(self.db_path)
+            # Без fsync на каждую запись: сбой ОС может испортить файл, поэтому
+            # телеметрия живёт в своей базе, отдельно от рекордов
+            self.conn.execute("PRAGMA synchronous = OFF")
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS telemetry_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    started TEXT DEFAULT CURRENT_TIMESTAMP,
+                    difficulty INTEGER,
+                    duration_s REAL,
+                    score INTEGER,
+                    catches INTEGER DEFAULT 0,
+                    misses INTEGER DEFAULT 0,
+                    level_ups INTEGER DEFAULT 0,
+                    pauses INTEGER DEFAULT 0,
+                    avg_fps REAL,
+                    p95_ms REAL
+                );
+                CREATE TABLE IF NOT EXISTS telemetry_events (
+                    session_id INTEGER NOT NULL,
+                    t_ms INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    value REAL
+                );
+                CREATE TABLE IF NOT EXISTS telemetry_samples (
+                    session_id INTEGER NOT NULL,
+                    t_ms INTEGER NOT NULL,
+                    fps REAL,
+                    frame_ms REAL,
+                    frame_p95_ms REAL,
+                    particles INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS telemetry_rollups (
+                    day TEXT NOT NULL,
+                    difficulty INTEGER NOT NULL,
+                    sessions INTEGER DEFAULT 0,
+                    total_score INTEGER DEFAULT 0,
+                    best_score INTEGER DEFAULT 0,
+                    catches INTEGER DEFAULT 0,
+                    misses INTEGER DEFAULT 0,
+                    level_ups INTEGER DEFAULT 0,
+                    pauses INTEGER DEFAULT 0,
+                    play_seconds REAL DEFAULT 0,
+                    samples INTEGER DEFAULT 0,
+                    fps_sum REAL DEFAULT 0,
+                    p95_sum REAL DEFAULT 0,
+                    p95_max REAL DEFAULT 0,
+                    PRIMARY KEY (day, difficulty)
+                );
+                CREATE INDEX IF NOT EXISTS idx_telemetry_events_session
+                    ON telemetry_events (session_id);
+                CREATE INDEX IF NOT EXISTS idx_telemetry_samples_session
+                    ON telemetry_samples (session_id);
+            ''')
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Ошибка инициализации телеметрии: {e}")
+            self.conn = None
+
+    def start_session(self, difficulty: int):
+        """Начало партии (предыдущая незавершённая партия закрывается без счёта и сводки)"""
+        if self.session_id is not None:
+            self.end_session(None)
+        if self.conn is None:
+            return
+        try:
+            cursor = self.conn.execute(
+                "INSERT INTO telemetry_sessions (difficulty) VALUES (?)", (difficulty,)
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Ошибка начала сессии телеметрии: {e}")
+            return
+
+        self.session_id = cursor.lastrowid
+        self.session_difficulty = difficulty
+        self.session_start = self.clock()
+        self._session_counts = dict.fromkeys(self.EVENTS, 0)
+        self._fps_sum = 0.0
+        self._p95_sum = 0.0
+        self._p95_max = 0.0
+        self._sample_count = 0
+        self._last_sample_time = self.session_start
+        self._frames_since_sample = 0
+        # Партия начинается с уровня качества, оставшегося от прошлой
+        if self.quality_level is not None:
+            self.record_event('quality', self.quality_level)
+
+    def _elapsed_ms(self) -> int:
+        """Время от начала партии"""
+        return int((self.clock() - self.session_start) * 1000)
+
+    def record_event(self, kind: str, value: float = 0):
+        """Событие партии (только в буфер)"""
+        if self.session_id is None:
+            return
+        self._events.append((self.session_id, self._elapsed_ms(), kind, value))
+        self._session_counts[kind] = self._session_counts.get(kind, 0) + 1
+
+    def set_quality_level(self, index: int):
+        """Смена уровня качества графики (событие 'quality' со значением - индексом уровня)"""
+        self.quality_level = index
+        self.record_event('quality', index)
+
+    def on_frame(self, frame_timer, particle_count: int, idle: bool = False):
+        """
+        Учёт кадра (вызывается раз в кадр): раз в секунду - замер
+        производительности, по таймеру или переполнению - сброс буфера.
+        На статичных экранах буфер сбрасывается сразу.
+        """
+        if self.session_id is None:
+            return
+        now = self.clock()
+        self._frames_since_sample += 1
+        elapsed = now - self._last_sample_time
+        if elapsed >= config.TELEMETRY_SAMPLE_INTERVAL and not idle:
+            fps = self._frames_since_sample / elapsed
+            p95 = frame_timer.percentile_ms(95)
+            self._samples.append((
+                self.session_id, int((now - self.session_start) * 1000),
+                fps, frame_timer.average_ms(), p95, particle_count
+            ))
+            self._fps_sum += fps
+            self._p95_sum += p95
+            self._p95_max = max(self._p95_max, p95)
+            self._sample_count += 1
+            self._last_sample_time = now
+            self._frames_since_sample = 0
+        elif idle:
+            # На паузе и в меню замеры не ведутся
+            self._last_sample_time = now
+            self._frames_since_sample = 0
+
+        pending = len(self._events) + len(self._samples)
+        if pending and (idle or pending >= config.TELEMETRY_MAX_BUFFER or
+                        now - self._last_flush_time >= config.TELEMETRY_FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        """Запись буфера одной транзакцией"""
+        self._last_flush_time = self.clock()
+        if not self._events and not self._samples:
+            return
+        if self.conn is None:
+            self._events.clear()
+            self._samples.clear()
+            return
+        start = time.perf_counter()
+        try:
+            with self.conn:
+                if self._events:
+                    self.conn.executemany(
+                        "INSERT INTO telemetry_events (session_id, t_ms, kind, value) "
+                        "VALUES (?, ?, ?, ?)", self._events
+                    )
+                if self._samples:
+                    self.conn.executemany(
+                        "INSERT INTO telemetry_samples "
+                        "(session_id, t_ms, fps, frame_ms, frame_p95_ms, particles) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", self._samples
+                    )
+        except sqlite3.Error as e:
+            print(f"Ошибка записи телеметрии: {e}")
+        self.rows_written += len(self._events) + len(self._samples)
+        self._events.clear()
+        self._samples.clear()
+
+        flush_ms = (time.perf_counter() - start) * 1000
+        self.flush_count += 1
+        self.flush_ms_total += flush_ms
+        self.flush_ms_max = max(self.flush_ms_max, flush_ms)
+
+    def end_session(self, score: Optional[int]):
+        """
+        Конец партии: сброс буфера, итоги партии и обновление суточной сводки.
+
+        Партия без счёта (score=None - брошена без результата) записывается в
+        telemetry_sessions, но в суточную сводку не попадает, чтобы не
+        занижать средний счёт.
+        """
+        if self.session_id is None:
+            return
+        self.flush()
+        if self.conn is not None:
+            counts = self._session_counts
+            duration_s = self.clock() - self.session_start
+            avg_fps = self._fps_sum / self._sample_count if self._sample_count else None
+            avg_p95 = self._p95_sum / self._sample_count if self._sample_count else None
+            try:
+                with self.conn:
+                    self.conn.execute(
+                        "UPDATE telemetry_sessions SET duration_s = ?, score = ?, catches = ?, "
+                        "misses = ?, level_ups = ?, pauses = ?, avg_fps = ?, p95_ms = ? WHERE id = ?",
+                        (duration_s, score, counts['catch'], counts['miss'], counts['level_up'],
+                         counts['pause'], avg_fps, avg_p95, self.session_id)
+                    )
+                    if score is not None:
+                        self._add_rollup(score, counts, duration_s)
+            except sqlite3.Error as e:
+                print(f"Ошибка завершения сессии телеметрии: {e}")
+        self.session_id = None
+
+    def _add_rollup(self, score: int, counts: dict, duration_s: float):
+        """Добавление итогов партии в суточную сводку (внутри транзакции end_session)"""
+        self.conn.execute(
+            "INSERT INTO telemetry_rollups (day, difficulty, sessions, total_score, "
+            "best_score, catches, misses, level_ups, pauses, play_seconds, samples, "
+            "fps_sum, p95_sum, p95_max) "
+            "VALUES (date('now'), ?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (day, difficulty) DO UPDATE SET "
+            "sessions = sessions + 1, "
+            "total_score = total_score + excluded.total_score, "
+            "best_score = max(best_score, excluded.best_score), "
+            "catches = catches + excluded.catches, "
+            "misses = misses + excluded.misses, "
+            "level_ups = level_ups + excluded.level_ups, "
+            "pauses = pauses + excluded.pauses, "
+            "play_seconds = play_seconds + excluded.play_seconds, "
+            "samples = samples + excluded.samples, "
+            "fps_sum = fps_sum + excluded.fps_sum, "
+            "p95_sum = p95_sum + excluded.p95_sum, "
+            "p95_max = max(p95_max, excluded.p95_max)",
+            (self.session_difficulty, score, score, counts['catch'],
+             counts['miss'], counts['level_up'], counts['pause'], duration_s,
+             self._sample_count, self._fps_sum, self._p95_sum, self._p95_max)
+        )
+
+    def get_rollups(self, days: int = 30) -> List[Tuple]:
+        """
+        Суточные сводки за последние days дней:
+        (день, сложность, партий, средний счёт, лучший счёт, поимок, промахов,
+        средний FPS, средний p95 мс, худший p95 мс)
+        """
+        if self.conn is None:
+            return []
+        try:
+            cursor = self.conn.execute(
+                "SELECT day, difficulty, sessions, "
+                "CAST(total_score AS REAL) / sessions, best_score, catches, misses, "
+                "CASE WHEN samples > 0 THEN fps_sum / samples END, "
+                "CASE WHEN samples > 0 THEN p95_sum / samples END, p95_max "
+                "FROM telemetry_rollups WHERE day >= date('now', ?) "
+                "ORDER BY day DESC, difficulty",
+                (f"-{days} days",)
+            )
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Ошибка получения сводок телеметрии: {e}")
+            return []
+
+    def get_stats(self) -> dict:
+        """Накладные расходы телеметрии"""
+        return {
+            'flushes': self.flush_count,
+            'rows_written': self.rows_written,
+            'flush_ms_avg': self.flush_ms_total / self.flush_count if self.flush_count else 0.0,
+            'flush_ms_max': self.flush_ms_max,
+            'pending': len(self._events) + len(self._samples),
+        }
+
+    def close(self, score: Optional[int] = None):
+        """
+        Завершение работы: закрытие партии и базы.
+
+        :param score: Счёт партии, прерванной закрытием окна (None - партии нет
+            или её результат неизвестен; тогда в сводку она не попадает).
+        """
+        self.end_session(score)
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def measure_overhead(seconds: int = 600):
+    """
+    Замер затрат телеметрии на синтетической партии: seconds секунд игры
+    при FPS кадров в секунду с типичным темпом событий.
+    """
+    import tempfile
+    from frame_timing import FrameTimer
+
+    frame_timer = FrameTimer()
+    for _ in range(frame_timer.samples.maxlen):
+        frame_timer.samples.append(5.0)
+
+    # Время партии идёт по кадрам, а не по часам, чтобы прогон был быстрым
+    game_time = [0.0]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        telemetry = Telemetry(os.path.join(tmp_dir, 'telemetry.db'), clock=lambda: game_time[0])
+        telemetry.start_session(2)
+        frames = seconds * config.FPS
+        spent = 0.0
+        for frame in range(frames):
+            game_time[0] = frame / config.FPS
+            start = time.perf_counter()
+            if frame % 90 == 0:
+                telemetry.record_event('catch', frame // 90)
+            if frame % 400 == 0:
+                telemetry.record_event('miss', 3)
+            telemetry.on_frame(frame_timer, 120)
+            spent += time.perf_counter() - start
+        telemetry.end_session(frames // 90)
+
+        stats = telemetry.get_stats()
+        per_frame_us = spent * 1e6 / frames
+        budget_share = per_frame_us / (1e6 / config.FPS) * 100
+        print(f"Кадров: {frames}, записано строк: {stats['rows_written']}, сбросов: {stats['flushes']}")
+        print(f"В среднем на кадр: {per_frame_us:.2f} мкс ({budget_share:.3f}% бюджета кадра)")
+        print(f"Сброс буфера: в среднем {stats['flush_ms_avg']:.3f} мс, худший {stats['flush_ms_max']:.3f} мс")
+        for row in telemetry.get_rollups():
+            print("Сводка:", row)
+        telemetry.close()
+
+
+if __name__ == "__main__":
+    measure_overhead(int(sys.argv[1]) if len(sys.argv) > 1 else 600)
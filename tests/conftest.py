@@ -0,0 +1,10 @@
+"""
+Общие настройки тестов: pygame без окна и звука, модули игры - из корня репозитория
+"""
+import os
+import sys
+
+# config вызывает pygame.init() при импорте, поэтому драйверы SDL задаются до него
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
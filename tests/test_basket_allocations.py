@@ -0,0 +1,30 @@
+"""
+Движение корзины и выдача её прямоугольников столкновений не должны
+оставлять ни одного нового блока памяти - ни с изображением, ни в режиме палок
+"""
+import itertools
+import pytest
+import config
+from alloc_tracker import assert_allocation_budget
+from basket import StickBasket
+
+
+@pytest.fixture(params=[True, False], ids=['image', 'sticks'])
+def basket(request, monkeypatch):
+    monkeypatch.setattr(config, 'USE_IMAGES', request.param)
+    basket = StickBasket()
+    # Без изображения корзина молча перешла бы в режим палок
+    assert (basket.image is not None) == request.param
+    return basket
+
+
+def test_move_allocates_nothing(basket):
+    # Цели чередуются, чтобы каждый вызов действительно сдвигал корзину
+    targets = itertools.cycle((config.WIDTH * 0.2, config.WIDTH * 0.8))
+    assert_allocation_budget(lambda: basket.move(next(targets)), max_blocks=0,
+                             max_peak_bytes=config.ALLOC_PEAK_BUDGET_BASKET, calls=200)
+
+
+def test_get_collision_rects_allocates_nothing(basket):
+    assert_allocation_budget(basket.get_collision_rects, max_blocks=0,
+                             max_peak_bytes=config.ALLOC_PEAK_BUDGET_BASKET, calls=200)
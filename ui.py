@@ -6,13 +6,17 @@ import math
 import random
 import config
 from database import Database
+from surfaces import create_surface, convert_for_display
+from atlas import SpriteBatch
+from layout import UILayout
+from render_scale import get_mouse_pos
 
 
 class UI:
     """Класс для управления пользовательским интерфейсом"""
     
-    def __init__(self, screen: pygame.Surface, database: Database):
-        self.screen = screen
+    def __init__(self, renderer, database: Database):
+        self.renderer = renderer
         self.database = database
         self.font = pygame.font.Font(None, config.FONT_SIZE)
         self.small_font = pygame.font.Font(None, config.FONT_SIZE // 2)
@@ -20,51 +24,33 @@ class UI:
         # Фоновые элементы
         self.background_squares = self._create_background_squares()
         
-        # Текстовые элементы
-        self.title_text = self.font.render("Олег «СТК»", True, config.GRAY)
-        self.title_rect = self.title_text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 15))
+        # Параметры качества (меняются регулятором качества)
+        self.background_square_count = len(self.background_squares)
+        self.alpha_overlays = True
         
-        # Кнопки
-        self.exit_rect = pygame.Rect(
-            config.EXIT_BUTTON_X,
-            config.EXIT_BUTTON_Y,
-            config.EXIT_BUTTON_WIDTH,
-            config.EXIT_BUTTON_HEIGHT
-        )
-        self.exit_text = self.font.render("Выйти", True, config.BLACK)
-        
-        self.pause_button_rect = pygame.Rect(
-            config.PAUSE_BUTTON_X,
-            config.PAUSE_BUTTON_Y,
-            config.PAUSE_BUTTON_SIZE,
-            config.PAUSE_BUTTON_SIZE
-        )
+        # Статичные надписи: имя -> (шрифт, текст, цвет). Пакуются в атлас
         pause_font = pygame.font.Font(None, config.PAUSE_BUTTON_SIZE)
-        self.pause_text = pause_font.render("⏸️", True, config.BLACK)
-        self.pause_text_rect = self.pause_text.get_rect(center=self.pause_button_rect.center)
+        self.static_labels = {
+            'title': (self.font, "Олег «СТК»", config.GRAY),
+            'exit': (self.font, "Выйти", config.BLACK),
+            'pause_icon': (pause_font, "⏸️", config.BLACK),
+            'choose_difficulty': (self.font, "Выберите сложность", config.WHITE),
+            'paused': (self.font, "Пауза", config.WHITE),
+            'continue': (self.font, "Продолжить игру", config.WHITE),
+            'play_again': (self.font, "Играть ещё раз", config.WHITE),
+            'exit_question': (self.font, "Вы уверены, что хотите выйти?", config.WHITE),
+            'yes': (self.font, "Да", config.BLACK),
+            'no': (self.font, "Нет", config.BLACK),
+        }
+        for level, settings in config.DIFFICULTY_SETTINGS.items():
+            self.static_labels[f'difficulty_{level}'] = (self.font, settings['name'], config.BLACK)
+        self.label_batch = None  # Слой надписей из атласа (после set_atlas)
         
-        # Кнопки сложности
-        self.easy_button_rect = pygame.Rect(
-            config.WIDTH // 2 - config.DIFFICULTY_BUTTON_WIDTH // 2,
-            config.HEIGHT // 2 - config.DIFFICULTY_BUTTON_HEIGHT * 1.5 - config.BUTTON_SPACING,
-            config.DIFFICULTY_BUTTON_WIDTH,
-            config.DIFFICULTY_BUTTON_HEIGHT
-        )
-        self.medium_button_rect = pygame.Rect(
-            config.WIDTH // 2 - config.DIFFICULTY_BUTTON_WIDTH // 2,
-            config.HEIGHT // 2 - config.DIFFICULTY_BUTTON_HEIGHT // 2,
-            config.DIFFICULTY_BUTTON_WIDTH,
-            config.DIFFICULTY_BUTTON_HEIGHT
-        )
-        self.hard_button_rect = pygame.Rect(
-            config.WIDTH // 2 - config.DIFFICULTY_BUTTON_WIDTH // 2,
-            config.HEIGHT // 2 + config.DIFFICULTY_BUTTON_HEIGHT // 2 + config.BUTTON_SPACING,
-            config.DIFFICULTY_BUTTON_WIDTH,
-            config.DIFFICULTY_BUTTON_HEIGHT
-        )
+        # Раскладка кнопок всех экранов (для отрисовки и проверки кликов)
+        self.layout = UILayout(self.font, self.renderer.get_size())
     
     def _create_background_squares(self):
-        """Создание фоновых квадратиков"""
+        """Создание фоновых квадратиков (повёрнутые поверхности готовятся один раз)"""
         squares = []
         for _ in range(config.NUM_BACKGROUND_SQUARES):
             size = random.randint(config.SQUARE_MIN_SIZE, config.SQUARE_MAX_SIZE)
@@ -72,112 +58,136 @@ class UI:
             y = random.randint(0, config.HEIGHT - size)
             angle = random.uniform(0, 2 * math.pi)
             color = (random.randint(80, 130), 0, 0, config.SQUARE_ALPHA)
-            squares.append((pygame.Rect(x, y, size, size), angle, color))
+            rect = pygame.Rect(x, y, size, size)
+            
+            surf = create_surface((size, size), alpha=True)
+            surf.fill(color)
+            rotated_surf = pygame.transform.rotate(surf, math.degrees(angle))
+            rotated_rect = rotated_surf.get_rect(center=rect.center)
+            squares.append((convert_for_display(rotated_surf, alpha=True), rotated_rect.topleft))
         return squares
     
+    def set_atlas(self, atlas):
+        """Подключение атласа: статичные надписи выводятся пакетом из него"""
+        self.label_batch = SpriteBatch(atlas) if atlas is not None else None
+    
+    def _draw_label(self, name: str, **anchor):
+        """Вывод статичной надписи (anchor - как в Surface.get_rect)"""
+        if self.label_batch is not None and self.label_batch.has(name):
+            rect = self.label_batch.atlas.get_rect(name).copy()
+            for key, value in anchor.items():
+                setattr(rect, key, value)
+            self.label_batch.add(name, rect)
+        else:
+            font, text, color = self.static_labels[name]
+            self.renderer.text(font, text, color, **anchor)
+    
+    def _flush_labels(self):
+        """Вывод накопленных надписей экрана одним пакетом"""
+        if self.label_batch is not None:
+            self.label_batch.flush(self.renderer)
+    
+    def on_resize(self, size):
+        """Пересчёт раскладки при изменении размера области отрисовки"""
+        self.layout.resize(size)
+    
+    def hit_test(self, screen: str, pos):
+        """Имя кнопки экрана screen (UILayout.HUD, DIFFICULTY, ...) под точкой pos или None"""
+        return self.layout.hit_test(screen, pos)
+    
+    def set_quality(self, background_squares: int, alpha_overlays: bool):
+        """Настройка числа фоновых квадратиков и полупрозрачных оверлеев"""
+        self.background_square_count = min(background_squares, len(self.background_squares))
+        self.alpha_overlays = alpha_overlays
+    
+    def _draw_overlay(self, alpha: int, screen: str):
+        """Затемнение под модальным экраном screen (его заголовком и кнопками)"""
+        if self.alpha_overlays:
+            self.renderer.fill((0, 0, 0, alpha))
+        else:
+            # Без смешивания: сплошная полоса под заголовком и кнопками дешевле
+            # полупрозрачного блита, а игра выше и ниже полосы остаётся видна
+            width, height = self.layout.size
+            top = height // 2 - config.FONT_SIZE * 3
+            bottom = max(rect.bottom for _, rect in self.layout.screen(screen).items())
+            self.renderer.fill(config.BLACK, (0, top, width, bottom + config.FONT_SIZE - top))
+    
     def draw_background(self):
         """Отрисовка фона"""
-        self.screen.fill(config.MAROON)
+        self.renderer.fill(config.MAROON)
         
-        # Рисуем квадратики
-        for rect, angle, color in self.background_squares:
-            surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            surf.fill(color)
-            rotated_surf = pygame.transform.rotate(surf, math.degrees(angle))
-            rotated_rect = rotated_surf.get_rect(center=rect.center)
-            self.screen.blit(rotated_surf, rotated_rect.topleft)
+        # Рисуем квадратики одним пакетом (элементы уже в виде (surface, position))
+        if self.background_square_count == len(self.background_squares):
+            self.renderer.blits(self.background_squares)
+        elif self.background_square_count > 0:
+            self.renderer.blits(self.background_squares[:self.background_square_count])
     
     def draw_difficulty_screen(self):
         """Отрисовка экрана выбора сложности"""
-        difficulty_title = self.font.render("Выберите сложность", True, config.WHITE)
-        difficulty_title_rect = difficulty_title.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 4))
-        self.screen.blit(difficulty_title, difficulty_title_rect)
-        
-        # Кнопка "Легкий"
-        mouse_pos = pygame.mouse.get_pos()
-        color = config.LIGHT_GRAY
-        if self.easy_button_rect.collidepoint(mouse_pos):
-            color = config.GRAY
-        pygame.draw.rect(self.screen, color, self.easy_button_rect, border_radius=5)
-        easy_text = self.font.render("Легкий", True, config.BLACK)
-        self.screen.blit(easy_text, easy_text.get_rect(center=self.easy_button_rect.center))
+        width, height = self.layout.size
+        self._draw_label('choose_difficulty', center=(width // 2, height // 4))
         
-        # Кнопка "Средний"
-        color = config.LIGHT_GRAY
-        if self.medium_button_rect.collidepoint(mouse_pos):
-            color = config.GRAY
-        pygame.draw.rect(self.screen, color, self.medium_button_rect, border_radius=5)
-        medium_text = self.font.render("Средний", True, config.BLACK)
-        self.screen.blit(medium_text, medium_text.get_rect(center=self.medium_button_rect.center))
-        
-        # Кнопка "Сложный"
-        color = config.LIGHT_GRAY
-        if self.hard_button_rect.collidepoint(mouse_pos):
-            color = config.GRAY
-        pygame.draw.rect(self.screen, color, self.hard_button_rect, border_radius=5)
-        hard_text = self.font.render("Сложный", True, config.BLACK)
-        self.screen.blit(hard_text, hard_text.get_rect(center=self.hard_button_rect.center))
+        # Кнопки сложностей (подсвечивается кнопка под курсором)
+        hovered = self.layout.hit_test(UILayout.DIFFICULTY, get_mouse_pos())
+        for name, rect in self.layout.screen(UILayout.DIFFICULTY).items():
+            color = config.GRAY if name == hovered else config.LIGHT_GRAY
+            self.renderer.rect(color, rect, border_radius=5)
+            self._draw_label(name, center=rect.center)
+        self._flush_labels()
     
     def draw_game_ui(self, game_state):
         """Отрисовка игрового интерфейса"""
-        # Счет и жизни
-        score_text = self.font.render(f"Результат: {game_state.score}", True, config.WHITE)
-        lives_text = self.font.render(f"Жизней: {game_state.lives}", True, config.YELLOW)
-        
         # Лучший результат
         best_record = self.database.get_best_score()
         best_score = best_record[1] if best_record else 0
-        best_score_text = self.font.render(
-            f"Лучший результат: {best_score}",
-            True,
-            config.WHITE
-        )
         
         # Счет и жизни - сдвинуты вниз, чтобы не накладывались на кнопку выхода
-        self.screen.blit(score_text, (20, config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + 10))
-        self.screen.blit(lives_text, (config.WIDTH - lives_text.get_width() - 20, config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + 10))
-        self.screen.blit(
-            best_score_text,
-            ((config.WIDTH - best_score_text.get_width()) // 2, config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + 10)
-        )
+        info_y = config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + config.HUD_INFO_OFFSET
+        self.renderer.text(self.font, f"Результат: {game_state.score}", config.WHITE,
+                           topleft=(config.HUD_MARGIN, info_y))
+        self.renderer.text(self.font, f"Жизней: {game_state.lives}", config.YELLOW,
+                           topright=(config.WIDTH - config.HUD_MARGIN, info_y))
+        self.renderer.text(self.font, f"Лучший результат: {best_score}", config.WHITE,
+                           midtop=(config.WIDTH // 2, info_y))
         
         # Индикатор прогрессии сложности (НОВОЕ!) - сдвинут вниз
         speed_multiplier = game_state.difficulty_multiplier
         if speed_multiplier > 1.0:
-            speed_text = self.small_font.render(
+            self.renderer.text(
+                self.small_font,
                 f"⚡ Сложность: x{speed_multiplier:.1f}",
-                True,
-                config.ORANGE
+                config.ORANGE,
+                topleft=(config.HUD_MARGIN,
+                         config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + config.HUD_MULTIPLIER_OFFSET)
             )
-            self.screen.blit(speed_text, (20, config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + 50))
         
         # Уведомление о повышении сложности (НОВОЕ!)
         if game_state.difficulty_level_up_timer > 0:
             # Пульсирующий эффект
-            alpha = int(255 * (game_state.difficulty_level_up_timer / 120))
-            overlay = pygame.Surface((config.WIDTH, 100), pygame.SRCALPHA)
-            overlay.fill((255, 165, 0, min(alpha, 100)))  # Оранжевый с прозрачностью
-            self.screen.blit(overlay, (0, config.HEIGHT // 2 - 50))
+            if self.alpha_overlays:
+                alpha = int(255 * (game_state.difficulty_level_up_timer / 120))
+                # Оранжевый с прозрачностью
+                band_height = config.HUD_LEVEL_UP_BAND_HEIGHT
+                self.renderer.fill((255, 165, 0, min(alpha, 100)),
+                                   (0, config.HEIGHT // 2 - band_height // 2, config.WIDTH, band_height))
             
-            level_text = self.font.render(
+            self.renderer.text(
+                self.font,
                 f"⚡ СЛОЖНОСТЬ УВЕЛИЧЕНА! x{speed_multiplier:.1f} ⚡",
-                True,
-                config.WHITE
+                config.WHITE,
+                center=(config.WIDTH // 2, config.HEIGHT // 2)
             )
-            level_rect = level_text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2))
-            self.screen.blit(level_text, level_rect)
         
         # Прогресс до следующего уровня сложности - сдвинут вниз
         next_level_score = ((game_state.score // config.DIFFICULTY_INCREASE_SCORE) + 1) * config.DIFFICULTY_INCREASE_SCORE
         progress = (game_state.score % config.DIFFICULTY_INCREASE_SCORE) / config.DIFFICULTY_INCREASE_SCORE
         if progress > 0:
-            bar_width = 200
-            bar_height = 8
-            bar_x = 20
-            bar_y = config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + 75
+            bar_width = config.HUD_PROGRESS_WIDTH
+            bar_height = config.HUD_PROGRESS_HEIGHT
+            bar_x = config.HUD_MARGIN
+            bar_y = config.EXIT_BUTTON_Y + config.EXIT_BUTTON_HEIGHT + config.HUD_PROGRESS_OFFSET
             # Фон прогресс-бара
-            pygame.draw.rect(
-                self.screen,
+            self.renderer.rect(
                 config.GRAY,
                 (bar_x, bar_y, bar_width, bar_height),
                 border_radius=4
@@ -185,142 +195,102 @@ class UI:
             # Заполненная часть
             filled_width = int(bar_width * progress)
             if filled_width > 0:
-                pygame.draw.rect(
-                    self.screen,
+                self.renderer.rect(
                     config.ORANGE,
                     (bar_x, bar_y, filled_width, bar_height),
                     border_radius=4
                 )
             # Текст прогресса
-            progress_text = self.small_font.render(
+            self.renderer.text(
+                self.small_font,
                 f"До следующего уровня: {next_level_score - game_state.score}",
-                True,
-                config.WHITE
+                config.WHITE,
+                topleft=(bar_x, bar_y + bar_height + config.HUD_PROGRESS_TEXT_GAP)
             )
-            self.screen.blit(progress_text, (bar_x, bar_y + bar_height + 5))
         
         # Кнопка паузы
-        pygame.draw.rect(
-            self.screen,
+        pause_rect = self.layout.get(UILayout.HUD, 'pause')
+        self.renderer.rect(
             config.LIGHT_GRAY,
-            self.pause_button_rect,
+            pause_rect,
             border_radius=5
         )
-        self.screen.blit(self.pause_text, self.pause_text_rect)
+        self._draw_label('pause_icon', center=pause_rect.center)
+        self._flush_labels()
     
     def draw_pause_screen(self):
         """Отрисовка экрана паузы"""
-        pause_overlay = pygame.Surface((config.WIDTH, config.HEIGHT), pygame.SRCALPHA)
-        pause_overlay.fill((0, 0, 0, 150))
-        self.screen.blit(pause_overlay, (0, 0))
+        self._draw_overlay(150, UILayout.PAUSE)
         
-        pause_msg = self.font.render("Пауза", True, config.WHITE)
-        pause_msg_rect = pause_msg.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2 - config.FONT_SIZE))
-        self.screen.blit(pause_msg, pause_msg_rect)
+        width, height = self.layout.size
+        self._draw_label('paused', center=(width // 2, height // 2 - config.FONT_SIZE))
         
         # Кнопка "Продолжить игру"
-        continue_text = self.font.render("Продолжить игру", True, config.WHITE)
-        continue_rect = continue_text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2 + config.FONT_SIZE * 2))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        if continue_rect.collidepoint(mouse_pos):
-            pygame.draw.rect(self.screen, config.GRAY, continue_rect.inflate(20, 10), border_radius=5)
+        continue_rect = self.layout.get(UILayout.PAUSE, 'continue')
+        if continue_rect.collidepoint(get_mouse_pos()):
+            self.renderer.rect(config.GRAY, continue_rect, border_radius=5)
         else:
-            pygame.draw.rect(self.screen, config.LIGHT_GRAY, continue_rect.inflate(20, 10), border_radius=5)
+            self.renderer.rect(config.LIGHT_GRAY, continue_rect, border_radius=5)
         
-        self.screen.blit(continue_text, continue_rect)
-        return continue_rect
+        self._draw_label('continue', center=continue_rect.center)
+        self._flush_labels()
     
     def draw_game_over_screen(self, game_state):
         """Отрисовка экрана окончания игры"""
-        overlay = pygame.Surface((config.WIDTH, config.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self._draw_overlay(180, UILayout.GAME_OVER)
         
         # Проверяем, новый ли это рекорд
         best_record = self.database.get_best_score()
         is_new_record = best_record is None or game_state.score > best_record[1]
         
+        width, height = self.layout.size
+        end_center = (width // 2, height // 2 - config.FONT_SIZE)
         if is_new_record:
-            end_text = self.font.render(
-                f"Новый рекорд! Ваш результат: {game_state.score}",
-                True,
-                config.GREEN
-            )
+            self.renderer.text(self.font, f"Новый рекорд! Ваш результат: {game_state.score}",
+                               config.GREEN, center=end_center)
         else:
-            end_text = self.font.render(
-                f"Игра окончена :( Ваш результат: {game_state.score}",
-                True,
-                config.WHITE
-            )
-        
-        text_rect = end_text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2 - config.FONT_SIZE))
-        self.screen.blit(end_text, text_rect)
+            self.renderer.text(self.font, f"Игра окончена :( Ваш результат: {game_state.score}",
+                               config.WHITE, center=end_center)
         
         # Кнопка рестарта
-        restart_text = self.font.render("Играть ещё раз", True, config.WHITE)
-        restart_rect = restart_text.get_rect(center=(config.WIDTH // 2, config.HEIGHT // 2 + config.FONT_SIZE))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        if restart_rect.collidepoint(mouse_pos):
-            pygame.draw.rect(self.screen, config.LIGHT_GRAY, restart_rect.inflate(20, 10), border_radius=5)
+        restart_rect = self.layout.get(UILayout.GAME_OVER, 'restart')
+        if restart_rect.collidepoint(get_mouse_pos()):
+            self.renderer.rect(config.LIGHT_GRAY, restart_rect, border_radius=5)
         
-        self.screen.blit(restart_text, restart_rect)
-        return restart_rect
+        self._draw_label('play_again', center=restart_rect.center)
+        self._flush_labels()
     
     def draw_exit_confirmation(self):
         """Отрисовка диалога подтверждения выхода"""
-        confirmation_overlay = pygame.Surface((config.WIDTH, config.HEIGHT), pygame.SRCALPHA)
-        confirmation_overlay.fill((0, 0, 0, 180))
-        self.screen.blit(confirmation_overlay, (0, 0))
+        self._draw_overlay(180, UILayout.EXIT_CONFIRM)
         
-        confirm_text = self.font.render("Вы уверены, что хотите выйти?", True, config.WHITE)
-        confirm_text_rect = confirm_text.get_rect(
-            center=(config.WIDTH // 2, config.HEIGHT // 2 - config.FONT_SIZE * 2)
-        )
-        self.screen.blit(confirm_text, confirm_text_rect)
+        width, height = self.layout.size
+        self._draw_label('exit_question',
+                         center=(width // 2, height // 2 - config.FONT_SIZE * 2))
         
         # Кнопка "Да"
-        yes_button_rect = pygame.Rect(
-            config.WIDTH // 2 - config.CONFIRM_BUTTON_WIDTH - config.CONFIRM_BUTTON_SPACING // 2,
-            config.HEIGHT // 2 + config.FONT_SIZE,
-            config.CONFIRM_BUTTON_WIDTH,
-            config.CONFIRM_BUTTON_HEIGHT
-        )
-        pygame.draw.rect(self.screen, config.GREEN, yes_button_rect, border_radius=5)
-        yes_text = self.font.render("Да", True, config.BLACK)
-        self.screen.blit(yes_text, yes_text.get_rect(center=yes_button_rect.center))
+        yes_button_rect = self.layout.get(UILayout.EXIT_CONFIRM, 'yes')
+        self.renderer.rect(config.GREEN, yes_button_rect, border_radius=5)
+        self._draw_label('yes', center=yes_button_rect.center)
         
         # Кнопка "Нет"
-        no_button_rect = pygame.Rect(
-            config.WIDTH // 2 + config.CONFIRM_BUTTON_SPACING // 2,
-            config.HEIGHT // 2 + config.FONT_SIZE,
-            config.CONFIRM_BUTTON_WIDTH,
-            config.CONFIRM_BUTTON_HEIGHT
-        )
-        pygame.draw.rect(self.screen, config.RED, no_button_rect, border_radius=5)
-        no_text = self.font.render("Нет", True, config.BLACK)
-        self.screen.blit(no_text, no_text.get_rect(center=no_button_rect.center))
-        
-        return yes_button_rect, no_button_rect
+        no_button_rect = self.layout.get(UILayout.EXIT_CONFIRM, 'no')
+        self.renderer.rect(config.RED, no_button_rect, border_radius=5)
+        self._draw_label('no', center=no_button_rect.center)
+        self._flush_labels()
     
     def draw_exit_button(self):
         """Отрисовка кнопки выхода"""
-        pygame.draw.rect(
-            self.screen,
+        exit_rect = self.layout.get(UILayout.HUD, 'exit')
+        self.renderer.rect(
             config.EXIT_BUTTON_COLOR,
-            self.exit_rect,
+            exit_rect,
             border_radius=5
         )
-        self.screen.blit(
-            self.exit_text,
-            (
-                config.EXIT_BUTTON_X + (config.EXIT_BUTTON_WIDTH - self.exit_text.get_width()) // 2,
-                config.EXIT_BUTTON_Y + (config.EXIT_BUTTON_HEIGHT - self.exit_text.get_height()) // 2
-            )
-        )
+        self._draw_label('exit', center=exit_rect.center)
+        self._flush_labels()
     
     def draw_title(self):
         """Отрисовка заголовка"""
-        self.screen.blit(self.title_text, self.title_rect)
-
+        self._draw_label('title', center=(config.WIDTH // 2, config.HEIGHT // 15))
+        self._flush_labels()
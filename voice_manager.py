@@ -0,0 +1,164 @@
+"""
+Модуль для управления голосами (каналами) микшера
+"""
+import pygame
+import config
+
+
+# Настройки для эффектов, не описанных в config.SOUND_EFFECT_SETTINGS
+DEFAULT_EFFECT_SETTINGS = {
+    'category': 'gameplay',
+    'max_voices': 1,
+    'cooldown_ms': 0,
+    'priority': 0,
+}
+
+
+class VoiceManager:
+    """
+    Менеджер голосов звуковых эффектов.
+
+    Каждой категории эффектов выделяется свой пул зарезервированных каналов.
+    Запросы на воспроизведение копятся в течение кадра (одинаковые объединяются)
+    и запускаются в flush() с учётом полифонии, кулдауна и приоритета.
+    """
+
+    def __init__(self, categories: dict = None, effect_settings: dict = None):
+        self.categories = categories if categories is not None else config.SOUND_VOICE_CATEGORIES
+        self.effect_settings = (effect_settings if effect_settings is not None
+                                else config.SOUND_EFFECT_SETTINGS)
+
+        # Резервируем каналы, чтобы Sound.play() без канала их не занимал
+        total_channels = sum(self.categories.values())
+        if pygame.mixer.get_num_channels() < total_channels:
+            pygame.mixer.set_num_channels(total_channels)
+        pygame.mixer.set_reserved(total_channels)
+
+        self.pools = {}
+        self.voices = {}  # Категория -> [(имя, приоритет, время старта) или None]
+        channel_id = 0
+        for category, count in self.categories.items():
+            self.pools[category] = [pygame.mixer.Channel(channel_id + i) for i in range(count)]
+            self.voices[category] = [None] * count
+            channel_id += count
+
+        self.pending = {}  # Эффекты, запрошенные в текущем кадре
+        self.last_played = {}
+        self.stats = {
+            'played': 0,
+            'dropped': 0,
+            'stolen': 0,
+            'coalesced': 0,
+        }
+
+    def get_settings(self, sound_name: str) -> dict:
+        """Настройки эффекта с подстановкой значений по умолчанию"""
+        settings = self.effect_settings.get(sound_name)
+        if settings is None:
+            return DEFAULT_EFFECT_SETTINGS
+        return settings
+
+    def get_channel(self, category: str):
+        """Первый канал категории (для выделенных потоков, например музыки)"""
+        pool = self.pools.get(category)
+        return pool[0] if pool else None
+
+    def trigger(self, sound_name: str, sound: pygame.mixer.Sound):
+        """Запросить воспроизведение эффекта в текущем кадре"""
+        if sound_name in self.pending:
+            self.stats['coalesced'] += 1
+            return
+        self.pending[sound_name] = sound
+
+    def flush(self):
+        """Запуск эффектов, запрошенных за кадр (вызывается один раз за кадр)"""
+        if not self.pending:
+            return
+
+        now = pygame.time.get_ticks()
+        # Более приоритетные эффекты занимают каналы первыми
+        requests = sorted(
+            self.pending.items(),
+            key=lambda item: self.get_settings(item[0])['priority'],
+            reverse=True
+        )
+        self.pending.clear()
+
+        for sound_name, sound in requests:
+            self._start_voice(sound_name, sound, now)
+
+    def _start_voice(self, sound_name: str, sound: pygame.mixer.Sound, now: int):
+        """Запуск одного голоса с учётом ограничений"""
+        settings = self.get_settings(sound_name)
+
+        # Кулдаун между повторами одного эффекта
+        last_time = self.last_played.get(sound_name)
+        if last_time is not None and now - last_time < settings['cooldown_ms']:
+            self.stats['dropped'] += 1
+            return
+
+        category = settings['category']
+        pool = self.pools.get(category)
+        if not pool:
+            self.stats['dropped'] += 1
+            return
+        voices = self.voices[category]
+
+        # Подсчёт активных голосов этого эффекта и поиск свободного канала
+        active_count = 0
+        free_index = None
+        for i, channel in enumerate(pool):
+            if channel.get_busy():
+                if voices[i] is not None and voices[i][0] == sound_name:
+                    active_count += 1
+            else:
+                voices[i] = None
+                if free_index is None:
+                    free_index = i
+
+        if active_count >= settings['max_voices']:
+            self.stats['dropped'] += 1
+            return
+
+        priority = settings['priority']
+        if free_index is None:
+            free_index = self._find_victim(voices, priority)
+            if free_index is None:
+                self.stats['dropped'] += 1
+                return
+            pool[free_index].stop()
+            self.stats['stolen'] += 1
+
+        try:
+            pool[free_index].play(sound)
+        except pygame.error:
+            self.stats['dropped'] += 1
+            return
+
+        voices[free_index] = (sound_name, priority, now)
+        self.last_played[sound_name] = now
+        self.stats['played'] += 1
+
+    def _find_victim(self, voices, priority: int):
+        """Голос для вытеснения: с наименьшим приоритетом, при равенстве - самый старый"""
+        victim_index = None
+        victim_key = None
+        for i, voice in enumerate(voices):
+            if voice is None:
+                return i
+            _, voice_priority, start_time = voice
+            if voice_priority > priority:
+                continue
+            key = (voice_priority, start_time)
+            if victim_key is None or key < victim_key:
+                victim_index = i
+                victim_key = key
+        return victim_index
+
+    def stop_all(self):
+        """Остановка всех голосов"""
+        self.pending.clear()
+        for category, pool in self.pools.items():
+            for i, channel in enumerate(pool):
+                channel.stop()
+                self.voices[category][i] = None